@@ -6,7 +6,8 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('games', 'games'), ('systems', 'systems')],
-    hiddenimports=['pygame'],
+    # Game modules are imported lazily by name (see games/__init__.py), so list them here
+    hiddenimports=['pygame', 'games.paddle_game', 'games.brickfall_game', 'games.void_drift_game'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
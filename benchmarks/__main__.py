@@ -0,0 +1,113 @@
+"""
+Headless benchmark suite.
+
+Run from the project root (works on a plain Linux box, no display needed):
+    SDL_VIDEODRIVER=dummy python -m benchmarks
+    python -m benchmarks --scenario void_drift_swarm --render
+    python -m benchmarks --save-baseline        # store this machine's numbers
+    python -m benchmarks --threshold 0.1        # fail if >10% slower than the baseline
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from array import array
+
+try:
+    import resource  # Unix only; peak memory is reported as 0 elsewhere
+except ImportError:
+    resource = None
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+def run_scenario(name, ticks=None, render=False):
+    """Run one scenario and return its metrics (called in a fresh worker process)"""
+    from benchmarks.scenarios import get_scenario, make_runner
+    scenario = get_scenario(name)
+    ticks = ticks or scenario.ticks
+    runner = make_runner(scenario, render)
+    times = array('d')
+    clock = time.perf_counter
+    start = clock()
+    for _ in range(ticks):
+        tick_start = clock()
+        runner.step()
+        times.append(clock() - tick_start)
+    elapsed = clock() - start
+    ordered = sorted(times)
+    def percentile(point):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * point / 100))] * 1000
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+    return {
+        "scenario": name,
+        "ticks": ticks,
+        "render": render,
+        "ticks_per_sec": ticks / elapsed,
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "peak_rss_mb": peak_kb / 1024,
+        "result": runner.game.result(),
+    }
+
+def compare(results, baseline, threshold):
+    """Return a list of regression messages against the stored baseline"""
+    regressions = []
+    for result in results:
+        base = baseline.get(result["scenario"])
+        if not base or base.get("render", False) != result["render"]:
+            continue  # Only compare like with like
+        if result["ticks_per_sec"] < base["ticks_per_sec"] * (1 - threshold):
+            regressions.append(f"{result['scenario']}: {result['ticks_per_sec']:.0f} ticks/s vs baseline {base['ticks_per_sec']:.0f}")
+        if result["p99_ms"] > base["p99_ms"] * (1 + threshold) and result["p99_ms"] - base["p99_ms"] > 0.05:
+            regressions.append(f"{result['scenario']}: p99 {result['p99_ms']:.3f} ms vs baseline {base['p99_ms']:.3f} ms")
+    return regressions
+
+def main():
+    from benchmarks.scenarios import SCENARIOS
+    parser = argparse.ArgumentParser(description="RE:PLAY headless benchmarks")
+    parser.add_argument("--scenario", action="append", help="Run only this scenario (repeatable)")
+    parser.add_argument("--ticks", type=int, help="Override every scenario's tick count")
+    parser.add_argument("--render", action="store_true", help="Also draw each tick to an offscreen surface")
+    parser.add_argument("--baseline", default=BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before failing (0.2 = 20%%)")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    
+    names = args.scenario or [scenario.name for scenario in SCENARIOS]
+    results = []
+    print(f"{'scenario':<22} {'ticks/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak MB':>8}")
+    # A fresh worker process per scenario, one at a time: clean peak-memory numbers
+    # and no timing interference between scenarios
+    with multiprocessing.Pool(1, maxtasksperchild=1) as pool:
+        for name in names:
+            result = pool.apply(run_scenario, (name, args.ticks, args.render))
+            results.append(result)
+            print(f"{name:<22} {result['ticks_per_sec']:>10.0f} {result['p50_ms']:>8.3f} {result['p95_ms']:>8.3f} "
+                  f"{result['p99_ms']:>8.3f} {result['peak_rss_mb']:>8.1f}")
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({result["scenario"]: result for result in results}, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print("REGRESSIONS:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print("No regressions against the baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
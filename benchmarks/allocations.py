@@ -0,0 +1,65 @@
+"""
+Allocation check: memory growth, per-tick transient allocations and garbage collector runs
+in long Void Drift sessions, measured with tracemalloc after a warm-up.
+
+Run from the project root:
+    SDL_VIDEODRIVER=dummy python -m benchmarks.allocations
+    python -m benchmarks.allocations --max-growth 64   # fail above 64 bytes retained per tick
+    python -m benchmarks.allocations --max-transient 1024   # fail above 1 KB allocated within a tick
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+from benchmarks.scenarios import get_scenario, make_runner
+
+SCENARIOS = ["void_drift_default", "void_drift_swarm", "void_drift_fragments"]
+
+def measure(name, ticks, warmup):
+    """Run `warmup` ticks, then trace `ticks` more; returns (growth B/tick, transient B/tick, gc runs per generation)"""
+    runner = make_runner(get_scenario(name))
+    runner.run(warmup)  # Pools, caches and lists reach their working size
+    gc.collect()
+    before = [generation["collections"] for generation in gc.get_stats()]
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    transient = 0
+    for _ in range(ticks):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        runner.step()
+        transient += tracemalloc.get_traced_memory()[1] - current
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    collections = [generation["collections"] - count for generation, count in zip(gc.get_stats(), before)]
+    runner.shutdown()
+    return (end - start) / ticks, transient / ticks, collections
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", help="scenario to check (repeatable, default: the Void Drift ones)")
+    parser.add_argument("--ticks", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=1200)
+    parser.add_argument("--max-growth", type=float, default=None, metavar="BYTES",
+                        help="exit non-zero if any scenario retains more than this per tick")
+    parser.add_argument("--max-transient", type=float, default=None, metavar="BYTES",
+                        help="exit non-zero if any scenario's peak allocation within a tick averages more than this")
+    args = parser.parse_args()
+    print(f"{'scenario':<22} {'growth B/tick':>13} {'transient B/tick':>16} {'gc runs (gen 0/1/2)':>20}")
+    failed = []
+    for name in args.scenario or SCENARIOS:
+        growth, transient, collections = measure(name, args.ticks, args.warmup)
+        runs = "/".join(str(count) for count in collections)
+        print(f"{name:<22} {growth:>13.1f} {transient:>16.0f} {runs:>20}")
+        if args.max_growth is not None and growth > args.max_growth:
+            failed.append(f"{name} retained {growth:.1f} B/tick (limit {args.max_growth:g})")
+        if args.max_transient is not None and transient > args.max_transient:
+            failed.append(f"{name} allocated {transient:.0f} B/tick (limit {args.max_transient:g})")
+    if failed:
+        print("Over the allocation limits:")
+        for failure in failed:
+            print(f"  {failure}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
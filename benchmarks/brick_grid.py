@@ -0,0 +1,70 @@
+"""
+Brickfall broadphase benchmark: per-tick cost from 30 to 10,000 bricks.
+
+Run from the project root:
+    python -m benchmarks.brick_grid
+"""
+import random
+import time
+import pygame
+from systems.headless import HeadlessRunner
+from systems.input import ScriptedInput
+from games.brickfall_game import BrickfallGame
+
+# (rows, cols, block_width, block_height, block_gap) - all layouts fit the top of the screen
+LAYOUTS = [
+    (3, 10, 75, 25, 5),      # 30 bricks, the shipped wall
+    (10, 30, 24, 10, 2),     # 300 bricks
+    (30, 100, 6, 6, 2),      # 3,000 bricks
+    (50, 200, 3, 4, 1),      # 10,000 bricks
+]
+TICKS = 5000
+PROBES = 20000
+
+def make_runner(rows, cols, block_width, block_height, block_gap):
+    """Build a headless Brickfall whose paddle follows the ball"""
+    def follow_ball(tick):
+        game = runner.game
+        if game.ball.centerx < game.paddle.centerx:
+            return [pygame.K_LEFT]
+        return [pygame.K_RIGHT]
+    
+    def configure(game):
+        game.block_rows = rows
+        game.block_width = block_width
+        game.block_height = block_height
+        game.block_gap = block_gap
+            
+    runner = HeadlessRunner(BrickfallGame, ScriptedInput(follow_ball), configure=configure)
+    assert len(runner.game.blocks) == rows * cols
+    return runner
+
+def time_probes(blocks, grid):
+    """Time a linear colliderect scan against a grid query for the same ball positions"""
+    rng = random.Random(1)
+    probes = [pygame.Rect(rng.randint(0, 785), rng.randint(40, 400), 15, 15) for _ in range(PROBES)]
+    
+    start = time.perf_counter()
+    for ball in probes:
+        for block in blocks:
+            if ball.colliderect(block):
+                break
+    linear = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for ball in probes:
+        grid.first_collision(ball)
+    gridded = time.perf_counter() - start
+    return linear / PROBES, gridded / PROBES
+
+def main():
+    print(f"{'bricks':>8} {'tick us':>9} {'linear us':>10} {'grid us':>8}")
+    for layout in LAYOUTS:
+        runner = make_runner(*layout)
+        count = len(runner.game.blocks)
+        linear, gridded = time_probes(list(runner.game.blocks), runner.game.blocks)
+        elapsed = runner.run(TICKS)
+        print(f"{count:>8} {elapsed / TICKS * 1e6:>9.2f} {linear * 1e6:>10.2f} {gridded * 1e6:>8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Frame capture benchmark: what recording adds to a frame, and how long the clip takes to encode.
+
+Run from the project root:
+    python -m benchmarks.capture
+"""
+import os
+import tempfile
+import time
+from systems.headless import init_headless
+from systems.capture import FrameCapture
+from games.void_drift_game import VoidDriftGame
+from systems.input import ScriptedInput
+
+FRAMES = 600
+DT = 1.0 / 60
+BUDGET_MS = 1000.0 / 60
+SETTINGS = [(1, 1), (2, 1), (2, 2)]  # (every, downscale)
+
+def run(screen, capture):
+    """Tick and draw Void Drift for FRAMES frames; returns (ms per frame, ms spent in capture())"""
+    game = VoidDriftGame()
+    game.input = ScriptedInput()
+    game.init(screen)
+    frame_time = capture_time = 0.0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        game.input.begin_tick()
+        game.update(DT)
+        game.draw(screen)
+        if capture:
+            before = time.perf_counter()
+            capture.capture(screen)
+            capture_time += time.perf_counter() - before
+        frame_time += time.perf_counter() - start
+    game.shutdown()
+    return frame_time / FRAMES * 1000, capture_time / FRAMES * 1000
+
+def main():
+    screen = init_headless()
+    plain, _ = run(screen, None)
+    print(f"{'every':>5} {'scale':>5} {'frame ms':>9} {'capture ms':>11} {'encode s':>9}")
+    print(f"{'off':>5} {'':>5} {plain:>9.3f} {0:>11.3f} {'':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for every, downscale in SETTINGS:
+            capture = FrameCapture(capacity=150, every=every, downscale=downscale, directory=directory)
+            capture.start(screen)
+            frame_ms, capture_ms = run(screen, capture)
+            start = time.perf_counter()
+            capture.stop(os.path.join(directory, f"clip_{every}_{downscale}.gif"))
+            capture.flush()
+            encode = time.perf_counter() - start
+            print(f"{every:>5} {downscale:>5} {frame_ms:>9.3f} {capture_ms:>11.3f} {encode:>9.2f}")
+    print(f"Frame budget at 60 fps: {BUDGET_MS:.1f} ms")
+
+if __name__ == "__main__":
+    main()
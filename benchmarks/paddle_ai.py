@@ -0,0 +1,52 @@
+"""
+Paddle Duel AI-vs-AI matches: how often each difficulty returns the ball and wins points.
+
+Run from the project root:
+    python -m benchmarks.paddle_ai
+    python -m benchmarks.paddle_ai --ticks 200000 --seed 7
+"""
+import argparse
+import time
+from systems.headless import HeadlessRunner
+from games.paddle_game import PaddleGame
+from games.paddle_ai import AIInput, PaddleAI, DIFFICULTIES
+
+def play_match(left, right, ticks, ball_speed, seed):
+    """Play `ticks` ticks of left vs right and return (returns, left points, right points, seconds)"""
+    def configure(game):
+        game.ball_speed_x = ball_speed
+        game.ball_speed_y = ball_speed
+        game.win_score = float("inf")  # One long match, so points add up over every tick
+
+    runner = HeadlessRunner(PaddleGame, configure=configure)
+    game = runner.game
+    game.input = AIInput(game, [PaddleAI("left", left, seed), PaddleAI("right", right, seed + 1)])
+    returns = 0
+    direction = game.ball_speed_x
+    start = time.perf_counter()
+    for _ in range(ticks):
+        runner.step()
+        if (game.ball_speed_x > 0) != (direction > 0):
+            returns += 1  # Includes the serve after each point
+            direction = game.ball_speed_x
+    elapsed = time.perf_counter() - start
+    return returns, game.left_score, game.right_score, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Paddle Duel AI-vs-AI matches headless")
+    parser.add_argument("--ticks", type=int, default=50000, help="ticks per match")
+    parser.add_argument("--ball-speed", type=float, default=5, help="starting ball speed per axis")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'left':>8} {'right':>8} {'returns':>8} {'points':>9} {'returns/s':>10} {'ticks/s':>9}")
+    for left in DIFFICULTIES:
+        for right in DIFFICULTIES:
+            if right == left:
+                continue
+            returns, left_points, right_points, elapsed = play_match(left, right, args.ticks, args.ball_speed, args.seed)
+            points = f"{left_points}-{right_points}"
+            print(f"{left:>8} {right:>8} {returns:>8} {points:>9} {returns / elapsed:>10.0f} {args.ticks / elapsed:>9.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Particle engine benchmark: step and draw cost per frame with 10,000 live particles.
+
+Run from the project root:
+    python -m benchmarks.particles
+"""
+import time
+from systems.headless import init_headless
+from systems import particles
+from systems.particles import ParticleSystem
+
+LIVE = 10000
+FRAMES = 300
+DT = 1.0 / 60
+BUDGET_MS = 1000.0 / 60
+COLORS = [(0, 255, 0), (255, 160, 0), (255, 255, 255), (200, 200, 200)]
+
+def run(screen, frames):
+    """Keep LIVE particles alive on screen and time step() and draw() separately"""
+    system = ParticleSystem(capacity=LIVE, gravity=200, bounds=screen.get_rect(), seed=1)
+    step_time = draw_time = 0.0
+    for frame in range(frames):
+        # Top up with bursts the way games emit them, so the count stays at LIVE
+        while len(system) < LIVE:
+            system.emit(100 + frame * 37 % 600, 100 + frame * 53 % 400, 200, COLORS[frame % len(COLORS)],
+                        life=(2.0, 4.0))
+        start = time.perf_counter()
+        system.step(DT)
+        step_time += time.perf_counter() - start
+        screen.fill((0, 0, 0))
+        start = time.perf_counter()
+        system.draw(screen)
+        draw_time += time.perf_counter() - start
+    return step_time / frames * 1000, draw_time / frames * 1000
+
+def main():
+    screen = init_headless()
+    backends = [("numpy", particles.np), ("array", None)] if particles.np else [("array", None)]
+    print(f"{'backend':>8} {'particles':>10} {'step ms':>8} {'draw ms':>8} {'total ms':>9} {'budget':>7}")
+    for name, module in backends:
+        saved, particles.np = particles.np, module
+        try:
+            frames = FRAMES if module else FRAMES // 10  # The Python loop is slow; fewer frames suffice
+            step_ms, draw_ms = run(screen, frames)
+        finally:
+            particles.np = saved
+        total = step_ms + draw_ms
+        verdict = "ok" if total < BUDGET_MS else "over"
+        print(f"{name:>8} {LIVE:>10} {step_ms:>8.2f} {draw_ms:>8.2f} {total:>9.2f} {verdict:>7}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import random
+import pygame
+from games.paddle_game import PaddleGame
+from games.brickfall_game import BrickfallGame
+from games.void_drift_game import VoidDriftGame
+
+class Scenario:
+    """A reproducible headless run: game, seed, scripted input and stress setup"""
+    def __init__(self, name, game_class, ticks, script=None, configure=None, prepare=None, seed=1234):
+        self.name = name
+        self.game_class = game_class
+        self.ticks = ticks
+        self.script = script  # script(game, rng) -> callable(tick) returning held keys
+        self.configure = configure  # Applied before init()
+        self.prepare = prepare  # Applied after init()
+        self.seed = seed
+
+def follow_ball_both(game, rng):
+    """Both paddles track the ball, so rallies never end"""
+    def script(tick):
+        keys = []
+        if game.ball.centery < game.left_paddle.centery - 10:
+            keys.append(pygame.K_w)
+        elif game.ball.centery > game.left_paddle.centery + 10:
+            keys.append(pygame.K_s)
+        if game.ball.centery < game.right_paddle.centery - 10:
+            keys.append(pygame.K_UP)
+        elif game.ball.centery > game.right_paddle.centery + 10:
+            keys.append(pygame.K_DOWN)
+        return keys
+    return script
+
+def follow_ball_paddle(game, rng):
+    """Brickfall paddle tracks the ball"""
+    def script(tick):
+        if game.ball.centerx < game.paddle.centerx - 5:
+            return [pygame.K_LEFT]
+        if game.ball.centerx > game.paddle.centerx + 5:
+            return [pygame.K_RIGHT]
+        return []
+    return script
+
+def random_steering(game, rng):
+    """Hold a random direction for half a second at a time"""
+    choices = [[], [pygame.K_LEFT], [pygame.K_RIGHT], [pygame.K_UP], [pygame.K_DOWN],
+               [pygame.K_LEFT, pygame.K_UP], [pygame.K_RIGHT, pygame.K_UP]]
+    held = []
+    def script(tick):
+        nonlocal held
+        if tick % 30 == 0:
+            held = rng.choice(choices)
+        return held
+    return script
+
+def steering_and_firing(game, rng):
+    """random_steering with the fire button held"""
+    steer = random_steering(game, rng)
+    def script(tick):
+        return steer(tick) + [pygame.K_SPACE]
+    return script
+
+def huge_wall(game):
+    # 50 x 200 = 10,000 bricks in the top half of the screen
+    game.block_rows = 50
+    game.block_width = 3
+    game.block_height = 4
+    game.block_gap = 1
+
+def asteroid_swarm(game):
+    # A spawn every tick keeps a few hundred asteroids on screen
+    game.asteroid_spawn_rate = 1
+    # Invulnerable player: an empty mask still runs every collision tier but never hits
+    game.player_mask = pygame.mask.Mask(game.player_mask.get_size())
+
+def fragment_storm(game):
+    # The swarm, shot at every tick: hundreds of drifting fragments and bullets to test
+    asteroid_swarm(game)
+    game.fire_cooldown = 1
+
+SCENARIOS = [
+    Scenario("paddle_rally", PaddleGame, 20000, script=follow_ball_both),
+    Scenario("brickfall_default", BrickfallGame, 20000, script=follow_ball_paddle),
+    Scenario("brickfall_10k_wall", BrickfallGame, 20000, script=follow_ball_paddle, configure=huge_wall),
+    Scenario("void_drift_default", VoidDriftGame, 20000, script=random_steering),
+    Scenario("void_drift_swarm", VoidDriftGame, 5000, script=random_steering, prepare=asteroid_swarm),
+    Scenario("void_drift_fragments", VoidDriftGame, 5000, script=steering_and_firing, prepare=fragment_storm),
+]
+
+def get_scenario(name):
+    for scenario in SCENARIOS:
+        if scenario.name == name:
+            return scenario
+    raise KeyError(f"Unknown scenario {name!r} (choose from {', '.join(s.name for s in SCENARIOS)})")
+
+def make_runner(scenario, render=False):
+    """Seed the RNG and build a HeadlessRunner for a scenario"""
+    from systems.headless import HeadlessRunner
+    from systems.input import ScriptedInput
+    random.seed(scenario.seed)
+    runner = HeadlessRunner(scenario.game_class, ScriptedInput(), render=render, configure=scenario.configure)
+    if scenario.prepare:
+        scenario.prepare(runner.game)
+    if scenario.script:
+        runner.game.input.script = scenario.script(runner.game, random.Random(scenario.seed))
+    return runner
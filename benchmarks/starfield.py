@@ -0,0 +1,72 @@
+"""
+Starfield benchmark: layer generation (NumPy and plain Python, timed without the PNG save),
+first run and cached load, and per-frame draw cost of the procedural parallax starfield,
+against the two full-screen blits of the old scrolling starfield image.
+
+Run from the project root:
+    python -m benchmarks.starfield
+"""
+import tempfile
+import time
+import pygame
+from systems.headless import init_headless
+from systems import starfield
+from systems.starfield import Starfield
+
+FRAMES = 600
+SIZES = [(800, 600), (1920, 1080)]
+OLD_IMAGE = "assets/starfield.png"
+
+def time_draw(screen, draw):
+    """Average milliseconds per frame for draw(frame) over a cleared screen"""
+    total = 0.0
+    for frame in range(FRAMES):
+        screen.fill((0, 0, 0))
+        start = time.perf_counter()
+        draw(frame)
+        total += time.perf_counter() - start
+    return total / FRAMES * 1000
+
+def time_generate(stars, repeats=3):
+    """Average milliseconds to render every layer's tile, without saving or loading"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for index, layer in enumerate(stars.layers):
+            stars.generate(index, layer)
+    return (time.perf_counter() - start) / repeats * 1000
+
+def main():
+    init_headless()
+    backends = [("numpy", starfield.np), ("python", None)] if starfield.np else [("python", None)]
+    generate_columns = " ".join(f"{name + ' gen ms':>13}" for name, _ in backends)
+    print(f"{'size':>10} {generate_columns} {'first run ms':>13} {'cached ms':>10} {'draw ms':>8} {'old image ms':>13}")
+    for width, height in SIZES:
+        screen = pygame.Surface((width, height)).convert()
+        with tempfile.TemporaryDirectory() as directory:
+            # First run: generate and save every layer; then a second instance only loads them
+            start = time.perf_counter()
+            Starfield(width, height, seed=1, directory=directory)
+            first_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            stars = Starfield(width, height, seed=1, directory=directory)
+            cached_ms = (time.perf_counter() - start) * 1000
+        generated = []
+        for name, module in backends:
+            saved, starfield.np = starfield.np, module
+            try:
+                generated.append(time_generate(stars))
+            finally:
+                starfield.np = saved
+        draw_ms = time_draw(screen, lambda frame: stars.draw(screen, frame % stars.period))
+        old_ms = float("nan")
+        try:
+            old = pygame.transform.scale(pygame.image.load(OLD_IMAGE), (width, height)).convert()
+            old_ms = time_draw(screen, lambda frame: (screen.blit(old, (0, frame % height - height)),
+                                                      screen.blit(old, (0, frame % height))))
+        except (pygame.error, FileNotFoundError):
+            pass
+        generate_values = " ".join(f"{ms:>13.1f}" for ms in generated)
+        print(f"{width:>5}x{height:<4} {generate_values} {first_ms:>13.1f} {cached_ms:>10.1f} {draw_ms:>8.3f} {old_ms:>13.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Parameter sweeps: many seeded headless runs fanned out over a process pool.
+
+Every combination of --param values is played once per seed; the report averages
+survival time, score and tick rate per parameter set.
+
+Run from the project root:
+    python -m benchmarks.sweep void_drift --param asteroid_spawn_rate=30,45,60 --seeds 8 --out spawn.csv
+    python -m benchmarks.sweep brickfall --param ball_serve_speed=5,8,12 --input follow --runs 5 --out speed.json
+    python -m benchmarks.sweep paddle_duel --input ai --ai-difficulty hard --ticks 100000
+"""
+import argparse
+import ast
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+INPUTS = ("idle", "random", "follow", "ai")
+
+def game_key(descriptor):
+    """Command-line name for a launcher entry, e.g. "Void Drift" -> void_drift"""
+    return descriptor.name.lower().replace(" ", "_")
+
+def parse_param(text):
+    """"name=v1,v2,..." -> (name, [values]); values are Python literals or plain strings"""
+    name, _, values = text.partition("=")
+    if not name or not values:
+        raise argparse.ArgumentTypeError(f"expected name=value[,value...], got {text!r}")
+    parsed = []
+    for value in values.split(","):
+        try:
+            parsed.append(ast.literal_eval(value))
+        except (ValueError, SyntaxError):
+            parsed.append(value)
+    return name, parsed
+
+def make_input(kind, game, seed, ai_difficulty):
+    """Build the input source for one job"""
+    from systems.input import ScriptedInput
+    from benchmarks.scenarios import follow_ball_both, follow_ball_paddle, random_steering
+    rng = random.Random(seed)
+    if kind == "ai":
+        from games.paddle_ai import AIInput, PaddleAI
+        if not hasattr(game, "left_paddle"):
+            raise ValueError("--input ai needs a Paddle Duel game")
+        return AIInput(game, [PaddleAI("left", ai_difficulty, seed), PaddleAI("right", ai_difficulty, seed + 1)])
+    if kind == "random":
+        return ScriptedInput(random_steering(game, rng))
+    if kind == "follow":
+        if hasattr(game, "left_paddle"):
+            return ScriptedInput(follow_ball_both(game, rng))
+        if hasattr(game, "ball"):
+            return ScriptedInput(follow_ball_paddle(game, rng))
+        raise ValueError("--input follow needs a game with a ball")
+    return ScriptedInput()
+
+def run_job(job):
+    """Play one (parameter set, seed) combination headless and return its metrics (runs in a worker)"""
+    from systems.headless import HeadlessRunner
+    from games import GAMES
+    descriptor = next(d for d in GAMES if game_key(d) == job["game"])
+    params = job["params"]
+
+    def configure(game):
+        for name, value in params.items():
+            if not hasattr(game, name):
+                raise AttributeError(f"{type(game).__name__} has no attribute {name!r}")
+            setattr(game, name, value)
+
+    random.seed(job["seed"])  # Brickfall and Void Drift draw from the global RNG
+    runner = HeadlessRunner(descriptor.load(), tick_rate=job["tick_rate"], configure=configure)
+    game = runner.game
+    game.input = make_input(job["input"], game, job["seed"], job["ai_difficulty"])
+    runs = []
+    seen = game.runs_finished
+    start = time.perf_counter()
+    for _ in range(job["ticks"]):
+        runner.step()
+        if game.runs_finished != seen:
+            seen = game.runs_finished
+            runs.append(game.last_run)
+            if job["runs"] and len(runs) >= job["runs"]:
+                break
+    elapsed = time.perf_counter() - start
+    runner.shutdown()
+    survivals = [run["ticks"] / job["tick_rate"] for run in runs if "ticks" in run]
+    scores = [run["score"] for run in runs if "score" in run]
+    row = dict(params)
+    row.update({
+        "seed": job["seed"],
+        "ticks": runner.ticks,
+        "ticks_per_sec": runner.ticks / elapsed if elapsed else 0.0,
+        "runs": len(runs),
+        "mean_survival_s": sum(survivals) / len(survivals) if survivals else None,
+        "mean_score": sum(scores) / len(scores) if scores else None,
+        "max_score": max(scores) if scores else None,
+    })
+    # Numeric end-of-job state (e.g. the scores of a Paddle match still in progress)
+    for name, value in game.result().items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            row[f"final_{name}"] = value
+    return row
+
+def summarize(rows, param_names):
+    """Average the per-seed rows of every parameter set"""
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(repr(row[name]) for name in param_names), []).append(row)
+    summary = []
+    for group in groups.values():
+        entry = {name: group[0][name] for name in param_names}
+        entry["seeds"] = len(group)
+        entry["runs"] = sum(row["runs"] for row in group)
+        for column in group[0]:
+            if column in entry or column in ("seed", "runs"):
+                continue
+            values = [row[column] for row in group if isinstance(row.get(column), (int, float))]
+            if column == "max_score":
+                entry[column] = max(values) if values else None
+            else:
+                entry[column] = sum(values) / len(values) if values else None
+        summary.append(entry)
+    return summary
+
+def write_report(path, summary, rows, per_job):
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump({"summary": summary, "jobs": rows}, f, indent=2)
+        return
+    table = rows if per_job else summary
+    columns = []
+    for entry in table:
+        columns.extend(column for column in entry if column not in columns)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(table)
+
+def main():
+    from games import GAMES
+    names = [game_key(descriptor) for descriptor in GAMES]
+    parser = argparse.ArgumentParser(description="Fan headless game runs out over a process pool")
+    parser.add_argument("game", choices=names)
+    parser.add_argument("--param", action="append", type=parse_param, default=[],
+                        help="Game attribute to sweep, e.g. asteroid_spawn_rate=30,45,60 (repeatable)")
+    parser.add_argument("--seeds", type=int, default=4, help="Seeds per parameter set")
+    parser.add_argument("--seed-base", type=int, default=0)
+    parser.add_argument("--ticks", type=int, default=36000, help="Tick cap per job (36000 = 10 minutes)")
+    parser.add_argument("--runs", type=int, default=0, help="Stop a job after this many game overs")
+    parser.add_argument("--tick-rate", type=int, default=60)
+    parser.add_argument("--input", choices=INPUTS, default="random")
+    parser.add_argument("--ai-difficulty", default="medium", help="Difficulty for --input ai")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", help="Write the report to this .csv or .json file")
+    parser.add_argument("--per-job", action="store_true", help="CSV lists every job instead of per-parameter averages")
+    args = parser.parse_args()
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    param_names = [name for name, _ in args.param]
+    jobs = []
+    for values in itertools.product(*(values for _, values in args.param)):
+        for seed in range(args.seed_base, args.seed_base + args.seeds):
+            jobs.append({"game": args.game, "params": dict(zip(param_names, values)), "seed": seed,
+                         "ticks": args.ticks, "runs": args.runs, "tick_rate": args.tick_rate,
+                         "input": args.input, "ai_difficulty": args.ai_difficulty})
+
+    print(f"{len(jobs)} jobs on {args.workers} workers")
+    start = time.perf_counter()
+    rows = []
+    # Jobs share nothing, so throughput scales with workers; workers are reused so
+    # pygame import and asset loading are paid once per process, not per job
+    pool = multiprocessing.Pool(args.workers)
+    try:
+        for row in pool.imap_unordered(run_job, jobs):
+            rows.append(row)
+            print(f"\r{len(rows)}/{len(jobs)} done", end="", flush=True)
+    finally:
+        # close() + join() rather than terminate(): pygame.init() installs SDL's SIGTERM
+        # handler in the workers, so terminate() would wait on them forever
+        pool.close()
+        pool.join()
+    elapsed = time.perf_counter() - start
+    total_ticks = sum(row["ticks"] for row in rows)
+    print(f"\n{total_ticks} ticks in {elapsed:.1f} s ({total_ticks / elapsed:.0f} ticks/s overall)")
+
+    rows.sort(key=lambda row: (tuple(repr(row[name]) for name in param_names), row["seed"]))
+    summary = summarize(rows, param_names)
+    for entry in summary:
+        settings = ", ".join(f"{name}={entry[name]}" for name in param_names) or "defaults"
+        parts = [f"{entry['runs']} runs"]
+        if entry["mean_survival_s"] is not None:
+            parts.append(f"survival {entry['mean_survival_s']:.1f} s")
+        if entry["mean_score"] is not None:
+            parts.append(f"score {entry['mean_score']:.1f}")
+        parts.append(f"{entry['ticks_per_sec']:.0f} ticks/s")
+        print(f"{settings}: {', '.join(parts)}")
+    if args.out:
+        write_report(args.out, summary, rows, args.per_job)
+        print(f"Wrote {args.out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
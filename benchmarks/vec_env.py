@@ -0,0 +1,63 @@
+"""
+Vectorized environment benchmark: env-steps per second for N game objects vs the batched array cores.
+First checks that the Paddle core plays step for step like N PaddleGame objects (Brickfall's core
+draws its paddle spin from its own RNG, so only its rules match, not its trajectories).
+
+Run from the project root:
+    python -m benchmarks.vec_env
+"""
+import sys
+import time
+import numpy as np
+from systems.vec_env import make_vec_env
+from games.paddle_game import PaddleGame
+from games.brickfall_game import BrickfallGame
+
+SIZES = [1, 16, 256, 4096]
+STEPS = 200_000  # Env-steps per measurement, split across the batch
+PARITY_ENVS = 16
+PARITY_TICKS = 5000
+
+def measure(env, steps):
+    """Step `env` with random actions and return env-steps per second"""
+    rng = np.random.default_rng(0)
+    env.reset(seed=0)
+    batches = max(1, steps // env.num_envs)
+    actions = rng.integers(0, len(env.actions), (batches, env.num_envs))
+    start = time.perf_counter()
+    for batch in actions:
+        env.step(batch)
+    return batches * env.num_envs / (time.perf_counter() - start)
+
+def check_parity(game_class, seed=0):
+    """Step both paths with the same random actions; returns the first tick they disagree on, or None"""
+    objects = make_vec_env(game_class, PARITY_ENVS, batched=False)
+    batched = make_vec_env(game_class, PARITY_ENVS)
+    objects.reset(seed=seed)
+    batched.reset(seed=seed)
+    rng = np.random.default_rng(seed)
+    for tick in range(PARITY_TICKS):
+        actions = rng.integers(0, len(objects.actions), PARITY_ENVS)
+        expected = objects.step(actions)[:3]
+        actual = batched.step(actions)[:3]
+        if not all(np.array_equal(a, b) for a, b in zip(expected, actual)):
+            return tick
+    return None
+
+def main():
+    for seed in (1, 2):
+        tick = check_parity(PaddleGame, seed)
+        if tick is not None:
+            print(f"Paddle parity: batched core diverged from the game objects at tick {tick} (seed {seed})")
+            sys.exit(1)
+    print(f"Paddle parity: identical observations, rewards and dones over {2 * PARITY_ENVS * PARITY_TICKS} env-steps")
+    print(f"{'game':<10} {'envs':>6} {'objects/s':>11} {'batched/s':>11} {'speedup':>8}")
+    for game_class in (PaddleGame, BrickfallGame):
+        for size in SIZES:
+            # The object path is linear in N, so a smaller sample gives the same rate
+            objects = measure(make_vec_env(game_class, size, batched=False), min(STEPS, 20_000))
+            batched = measure(make_vec_env(game_class, size), STEPS)
+            print(f"{game_class.__name__[:-4]:<10} {size:>6} {objects:>11.0f} {batched:>11.0f} {batched / objects:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
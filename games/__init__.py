@@ -1 +1,12 @@
-# Games package
\ No newline at end of file
+# Games package
+from systems.registry import GameDescriptor
+
+# Launcher catalogue, in menu order. Modules are imported only when a game is picked.
+GAMES = [
+    GameDescriptor("Paddle Duel", "games.paddle_game", "PaddleGame"),
+    GameDescriptor("Paddle Duel vs AI", "games.paddle_game", "PaddleVsAIGame"),
+    GameDescriptor("Brickfall", "games.brickfall_game", "BrickfallGame"),
+    GameDescriptor("Void Drift", "games.void_drift_game", "VoidDriftGame",
+                   preload_images=["assets/player_ship.png", "assets/asteroid.png", "assets/asteroid_1.png",
+                                   "assets/asteroid_2.png", "assets/asteroid_3.png", "assets/asteroid_4.png"]),
+]
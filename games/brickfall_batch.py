@@ -0,0 +1,159 @@
+import numpy as np
+import pygame
+from games.brickfall_game import BrickfallGame
+from games.paddle_batch import fold
+
+# Paddle actions, as the keys the real game would see
+ACTIONS = [(), (pygame.K_LEFT,), (pygame.K_RIGHT,)]
+
+class BatchedBrickfall:
+    """N Brickfall games stepped together with array operations
+
+    Actions index ACTIONS per env. Reward is the number of bricks broken that tick; an episode
+    ends when the wall is cleared or the last life is lost. Observations match
+    BrickfallGame.observe(). Walls and the paddle are exact at any speed; bricks are tested at
+    the ball's new position, which is exact while the ball moves less than a brick per tick.
+    """
+
+    def __init__(self, num_envs, max_episode_steps=None, seed=None, configure=None):
+        template = BrickfallGame()  # Same layout and speeds as the real game
+        if configure:
+            configure(template)
+        self.num_envs = num_envs
+        self.actions = ACTIONS
+        self.max_episode_steps = max_episode_steps
+        self.rng = np.random.default_rng(seed)
+        self.width = template.width
+        self.height = template.height
+        self.paddle_width = template.paddle_width
+        self.paddle_height = template.paddle_height
+        self.paddle_speed = template.paddle_speed
+        self.ball_size = template.ball_size
+        self.serve_speed = template.ball_serve_speed
+        self.paddle_top = self.height - 50
+        self.rows = template.block_rows
+        self.cols = self.width // (template.block_width + template.block_gap)
+        self.block_width = template.block_width
+        self.block_height = template.block_height
+        self.pitch_x = template.block_width + template.block_gap
+        self.pitch_y = template.block_height + template.block_gap
+        self.top = 50  # BrickGrid's default top edge
+        self.span_x = self.width - self.ball_size
+        self.ball_start = (self.width // 2 - self.ball_size // 2, self.height // 2 - self.ball_size // 2)
+        self.paddle_x = np.zeros(num_envs)
+        self.ball_x = np.zeros(num_envs)
+        self.ball_y = np.zeros(num_envs)
+        self.speed_x = np.zeros(num_envs)
+        self.speed_y = np.zeros(num_envs)
+        self.bricks = np.zeros((num_envs, self.rows, self.cols), bool)
+        self.score = np.zeros(num_envs, np.int64)
+        self.lives = np.zeros(num_envs, np.int64)
+        self.steps = np.zeros(num_envs, np.int64)
+        self.envs = np.arange(num_envs)
+
+    def reset(self, seed=None):
+        """Start a fresh game in every env and return the first observations"""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._reset(np.ones(self.num_envs, bool))
+        return self._observe()
+
+    def _reset(self, mask):
+        self.paddle_x[mask] = self.width // 2 - self.paddle_width // 2
+        self._serve(mask)
+        self.bricks[mask] = True
+        self.score[mask] = 0
+        self.lives[mask] = 3
+        self.steps[mask] = 0
+
+    def _serve(self, mask):
+        self.ball_x[mask], self.ball_y[mask] = self.ball_start
+        self.speed_x[mask] = self.serve_speed
+        self.speed_y[mask] = self.serve_speed
+
+    def step(self, actions):
+        """Advance every game one tick; returns (observations, rewards, dones, info)"""
+        actions = np.asarray(actions)
+        size = self.ball_size
+        # Paddle, with the game's rule: a step is allowed while the edge is still inside the screen
+        self.paddle_x -= np.where((actions == 1) & (self.paddle_x > 0), self.paddle_speed, 0)
+        self.paddle_x += np.where((actions == 2) & (self.paddle_x + self.paddle_width < self.width), self.paddle_speed, 0)
+
+        # Side walls fold x exactly; the top wall mirrors y
+        x0, y0, speed_x = self.ball_x, self.ball_y, self.speed_x
+        x1, mirrored = fold(x0 + speed_x, self.span_x)
+        self.speed_x = np.where(mirrored, -self.speed_x, self.speed_x)
+        y1 = y0 + self.speed_y
+        above = y1 < 0
+        y1 = np.where(above, -y1, y1)
+        self.speed_y = np.where(above, -self.speed_y, self.speed_y)
+
+        # Paddle: swept against its top face, or the paddle slid into the ball
+        face = self.paddle_top - size
+        crossing = (self.speed_y > 0) & (y0 <= face) & (y1 > face)
+        t = (face - y0) / np.where(crossing, self.speed_y, 1)
+        x_at, _ = fold(x0 + speed_x * t, self.span_x)
+        x_at = np.where(crossing, x_at, x1)
+        on_paddle = (x_at + size > self.paddle_x) & (x_at < self.paddle_x + self.paddle_width)
+        inside = (self.speed_y > 0) & (y1 > face) & (y1 < self.paddle_top + self.paddle_height)
+        landed = on_paddle & (crossing | inside)
+        y1 = np.where(landed, face, y1)
+        hit_position = (x_at + size / 2 - (self.paddle_x + self.paddle_width / 2)) / (self.paddle_width / 2)
+        self.speed_y = np.where(landed, -np.abs(self.speed_y), self.speed_y)
+        self.speed_x = np.where(landed, hit_position * 6 + self.rng.uniform(-0.5, 0.5, self.num_envs), self.speed_x)
+
+        # Bricks: test the few cells the ball box can span; the first live one it overlaps breaks
+        broken = np.zeros(self.num_envs, bool)
+        hit_row = np.zeros(self.num_envs, np.int64)
+        hit_col = np.zeros(self.num_envs, np.int64)
+        first_row = np.floor((y1 - self.top) / self.pitch_y).astype(np.int64)
+        first_col = np.floor(x1 / self.pitch_x).astype(np.int64)
+        for dr in range(size // self.pitch_y + 2):
+            for dc in range(size // self.pitch_x + 2):
+                row = first_row + dr
+                col = first_col + dc
+                valid = ~broken & (row >= 0) & (row < self.rows) & (col >= 0) & (col < self.cols)
+                left = col * self.pitch_x
+                top = self.top + row * self.pitch_y
+                overlaps = ((x1 + size > left) & (x1 < left + self.block_width)
+                            & (y1 + size > top) & (y1 < top + self.block_height))
+                candidate = valid & overlaps
+                candidate[candidate] = self.bricks[self.envs[candidate], row[candidate], col[candidate]]
+                hit_row = np.where(candidate, row, hit_row)
+                hit_col = np.where(candidate, col, hit_col)
+                broken |= candidate
+        if broken.any():
+            self.bricks[self.envs[broken], hit_row[broken], hit_col[broken]] = False
+            left = hit_col * self.pitch_x
+            top = self.top + hit_row * self.pitch_y
+            # Came in from above or below: bounce vertically and mirror the overlap; otherwise sideways
+            vertical = broken & ((y0 + size <= top) | (y0 >= top + self.block_height))
+            sideways = broken & ~vertical
+            y1 = np.where(vertical & (self.speed_y > 0), 2 * (top - size) - y1, y1)
+            y1 = np.where(vertical & (self.speed_y < 0), 2 * (top + self.block_height) - y1, y1)
+            x1 = np.where(sideways & (self.speed_x > 0), 2 * (left - size) - x1, x1)
+            x1 = np.where(sideways & (self.speed_x < 0), 2 * (left + self.block_width) - x1, x1)
+            self.speed_y = np.where(vertical, -self.speed_y, self.speed_y)
+            self.speed_x = np.where(sideways, -self.speed_x, self.speed_x)
+        self.ball_x, self.ball_y = x1, y1
+        self.score += broken
+        rewards = broken.astype(np.float32)
+
+        # Off the bottom: lose a life and serve again
+        lost = self.ball_y + size >= self.height
+        self.lives -= lost
+        self._serve(lost)
+
+        self.steps += 1
+        finished = (self.lives <= 0) | ~self.bricks.any(axis=(1, 2))
+        truncated = ~finished & (self.steps >= self.max_episode_steps) if self.max_episode_steps else np.zeros(self.num_envs, bool)
+        dones = finished | truncated
+        info = {"score": self.score.astype(np.float32), "truncated": truncated}
+        if dones.any():
+            self._reset(dones)
+        return self._observe(), rewards, dones, info
+
+    def _observe(self):
+        head = np.stack([self.paddle_x / self.width, self.ball_x / self.width, self.ball_y / self.height,
+                         self.speed_x / 10, self.speed_y / 10, self.lives / 3], axis=1)
+        return np.concatenate([head, self.bricks.reshape(self.num_envs, -1)], axis=1).astype(np.float32)
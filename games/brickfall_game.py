@@ -1,116 +1,167 @@
 import pygame
 import random
-from systems.game import Game
-import json
-import os
+import struct
+from systems.game import Game, interpolate_rect
+from systems.input import KeyboardInput
+from systems.text import text_cache
+from systems.high_scores import get_store
+from systems.particles import ParticleSystem
+from systems.collision import first_impact
 
-class HighScoreManager:
-    """Manages persistent high scores for games"""
-    
-    def __init__(self, save_file="high_scores.json"):
-        self.save_file = save_file
-        self.scores = self.load_scores()
-    
-    def load_scores(self):
-        """Load high scores from file"""
-        try:
-            if os.path.exists(self.save_file):
-                with open(self.save_file, 'r') as f:
-                    data = json.load(f)
-                    # Ensure all expected games exist with default 0 values
-                    if "void_drift" not in data:
-                        data["void_drift"] = 0
-                    if "brickfall" not in data:
-                        data["brickfall"] = 0
-                    return data
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
-        
-        # Return default scores if file doesn't exist or is corrupted
-        return {
-            "void_drift": 0,
-            "brickfall": 0
-        }
-    
-    def save_scores(self):
-        """Save high scores to file"""
-        try:
-            with open(self.save_file, 'w') as f:
-                json.dump(self.scores, f, indent=2)
-        except Exception as e:
-            print(f"Error saving high scores: {e}")
-    
-    def get_high_score(self, game_name):
-        """Get high score for a specific game"""
-        return self.scores.get(game_name, 0)
+# snapshot(): paddle x, ball x/y and speed, score, lives, won flag, win timer, run ticks;
+# one byte per brick cell follows
+SNAPSHOT = struct.Struct("<iddddiiBdI")
+
+class BrickGrid:
+    """Bricks stored by (row, col) so the ball only tests the cells it overlaps"""
+    def __init__(self, rows, cols, block_width, block_height, block_gap, top=50):
+        self.rows = rows
+        self.cols = cols
+        self.top = top
+        self.block_width = block_width
+        self.block_height = block_height
+        self.pitch_x = block_width + block_gap
+        self.pitch_y = block_height + block_gap
+        # Flat row-major list; a destroyed brick leaves None in its cell
+        self.cells = []
+        for row in range(rows):
+            for col in range(cols):
+                x = col * self.pitch_x
+                y = top + row * self.pitch_y
+                self.cells.append(pygame.Rect(x, y, block_width, block_height))
+        self.count = len(self.cells)
+        self.alive = bytearray(b"\x01") * self.count  # 1 per standing brick, for snapshots
+        
+    def __len__(self):
+        return self.count
     
-    def update_high_score(self, game_name, new_score):
-        """Update high score for a specific game"""
-        current_high = self.get_high_score(game_name)
-        if new_score > current_high:
-            self.scores[game_name] = new_score
-            self.save_scores()
-            return True
-        return False
+    def __iter__(self):
+        """Iterate over the remaining bricks"""
+        for block in self.cells:
+            if block is not None:
+                yield block
+                
+    def remove(self, row, col):
+        """Destroy the brick at (row, col) in O(1)"""
+        index = row * self.cols + col
+        if self.cells[index] is not None:
+            self.cells[index] = None
+            self.alive[index] = 0
+            self.count -= 1
+            
+    def restore(self, alive):
+        """Rebuild the wall from a copy of `alive`"""
+        self.alive[:] = alive
+        for index, flag in enumerate(alive):
+            if not flag:
+                self.cells[index] = None
+            elif self.cells[index] is None:
+                row, col = divmod(index, self.cols)
+                self.cells[index] = pygame.Rect(col * self.pitch_x, self.top + row * self.pitch_y,
+                                                self.block_width, self.block_height)
+        self.count = sum(alive)
+            
+    def cells_in(self, rect):
+        """Yield (row, col, block) for the remaining bricks in the grid cells rect covers"""
+        first_row = max(0, (rect.top - self.top) // self.pitch_y)
+        last_row = min(self.rows - 1, (rect.bottom - 1 - self.top) // self.pitch_y)
+        first_col = max(0, rect.left // self.pitch_x)
+        last_col = min(self.cols - 1, (rect.right - 1) // self.pitch_x)
+        # Row-major order matches the old linear scan, so the same brick wins ties
+        for row in range(first_row, last_row + 1):
+            base = row * self.cols
+            for col in range(first_col, last_col + 1):
+                block = self.cells[base + col]
+                if block is not None:
+                    yield row, col, block
+            
+    def first_collision(self, rect):
+        """Return (row, col, block) for the first brick overlapping rect, or None"""
+        for hit in self.cells_in(rect):
+            if rect.colliderect(hit[2]):
+                return hit
+        return None
 
 class BrickfallGame(Game):
+    input_keys = (pygame.K_LEFT, pygame.K_RIGHT)
+    
     def __init__(self):
         self.width = 800
         self.height = 600
+        self.input = KeyboardInput()  # Swap for a ScriptedInput to drive the game programmatically
         self.paddle_width = 100
         self.paddle_height = 15
         self.ball_size = 15
         self.paddle_speed = 8
-        self.ball_speed_x = 5
-        self.ball_speed_y = 5
+        self.ball_serve_speed = 5  # Speed on both axes at the start and after a lost life
+        self.ball_speed_x = self.ball_serve_speed
+        self.ball_speed_y = self.ball_serve_speed
         self.block_width = 75
         self.block_height = 25
         self.block_gap = 5
+        self.block_rows = 3
+        self.block_color = (0, 255, 0)
+        self.max_bounces = 4  # Collisions resolved per tick; more only happen at absurd speeds
+        self.particles = ParticleSystem(capacity=2000, gravity=300, bounds=(0, 0, self.width, self.height))
         
     def init(self, screen):
         self.screen = screen
-        # Use readable system fonts consistently
-        self.font = pygame.font.Font(None, 48)        # main game font
-        self.small_font = pygame.font.Font(None, 24)  # smaller UI elements
         
         # Initialize high score manager
-        self.high_score_manager = HighScoreManager()
+        self.high_score_manager = get_store()  # Shared, write-behind store
         self.current_high_score = self.high_score_manager.get_high_score('brickfall')
         
         self.reset_game()
         
+    def resume(self, screen):
+        super().resume(screen)
+        # The launcher may have reset the high scores while this instance was suspended
+        self.high_score_manager = get_store()
+        self.current_high_score = self.high_score_manager.get_high_score('brickfall')
+        
     def reset_game(self):
         # Game state
         self.score = 0
         self.lives = 3
         self.game_won = False
         self.win_timer = 0
+        self.run_ticks = 0  # Ticks played this run, for finish_run()
+        self.ball_speed_x = self.ball_serve_speed
+        self.ball_speed_y = self.ball_serve_speed
         
         # Paddle
         self.paddle = pygame.Rect(self.width // 2 - self.paddle_width // 2, self.height - 50, self.paddle_width, self.paddle_height)
         
         # Ball
         self.ball = pygame.Rect(self.width // 2 - self.ball_size // 2, self.height // 2 - self.ball_size // 2, self.ball_size, self.ball_size)
+        self.ball_x = float(self.ball.x)  # Exact position; self.ball is its rounded copy
+        self.ball_y = float(self.ball.y)
+        # Left, right and top walls, as rects the ball can be swept against
+        self.walls = [pygame.Rect(-self.width, -self.height, self.width, 3 * self.height),
+                      pygame.Rect(self.width, -self.height, self.width, 3 * self.height),
+                      pygame.Rect(-self.width, -self.height, 3 * self.width, self.height)]
         
-        # Blocks (3 rows, 5 columns)
-        # Replace block setup in reset_game()
-        self.blocks = []
+        # Blocks (block_rows rows, as many columns as fit the screen)
         cols = self.width // (self.block_width + self.block_gap)
-        for row in range(3):
-            for col in range(cols):
-                x = col * (self.block_width + self.block_gap)
-                y = 50 + row * (self.block_height + self.block_gap)
-                self.blocks.append(pygame.Rect(x, y, self.block_width, self.block_height))
+        self.blocks = BrickGrid(self.block_rows, cols, self.block_width, self.block_height, self.block_gap)
+        self.snap_previous_positions()
 
+    def snap_previous_positions(self):
+        """Remember positions from the last tick so draw() can interpolate"""
+        self.prev_paddle = self.paddle.copy()
+        self.prev_ball = self.ball.copy()
                 
     def update(self, dt):
+        self.particles.step(dt)
         if self.game_won:
             self.win_timer += dt
             if self.win_timer > 2.0:
                 self.reset_game()
             return
             
-        keys = pygame.key.get_pressed()
+        self.snap_previous_positions()
+        self.run_ticks += 1
+        keys = self.input.get_pressed()
         
         # Paddle movement (Left/Right arrows)
         if keys[pygame.K_LEFT] and self.paddle.left > 0:
@@ -118,46 +169,19 @@ class BrickfallGame(Game):
         if keys[pygame.K_RIGHT] and self.paddle.right < self.width:
             self.paddle.x += self.paddle_speed
         
-        # Ball movement
-        self.ball.x += self.ball_speed_x
-        self.ball.y += self.ball_speed_y
-        
-        # Wall collisions
-        if self.ball.left <= 0 or self.ball.right >= self.width:
-            self.ball_speed_x *= -1
-        if self.ball.top <= 0:
-            self.ball_speed_y *= -1
+        # Ball movement, bouncing off walls, paddle and bricks at the exact time of impact
+        self.move_ball()
             
-        # Paddle collision
+        # Paddle collision (the paddle slid into the ball)
         if self.ball.colliderect(self.paddle) and self.ball_speed_y > 0:
-            self.ball_speed_y *= -1
             self.ball.top = self.paddle.top - self.ball.height  # push ball above paddle
-            # Adjust x speed based on where ball hits paddle
-            paddle_center = self.paddle.centerx
-            ball_center = self.ball.centerx
-            hit_position = (ball_center - paddle_center) / (self.paddle_width / 2)
-            self.ball_speed_x = hit_position * 6  # Vary horizontal speed
-            self.ball_speed_x += random.uniform(-0.5, 0.5)  # Add slight randomness
-        
-        # Block collisions
-        for block in self.blocks[:]:
-            if self.ball.colliderect(block):
-                self.blocks.remove(block)
-                # Determine which side we hit
-                if abs(self.ball.bottom - block.top) < 10 and self.ball_speed_y > 0:
-                    self.ball_speed_y *= -1
-                    self.ball.bottom = block.top
-                elif abs(self.ball.top - block.bottom) < 10 and self.ball_speed_y < 0:
-                    self.ball_speed_y *= -1
-                    self.ball.top = block.bottom
-                else:
-                    self.ball_speed_x *= -1
-                self.score += 1
-                break
+            self.ball_y = float(self.ball.y)
+            self.bounce_off_paddle()
                 
         # Check win condition
         if len(self.blocks) == 0:
             self.game_won = True
+            self.finish_run(score=self.score, ticks=self.run_ticks, won=True)
             
         # Reset ball if it goes off bottom
         if self.ball.bottom >= self.height:
@@ -166,34 +190,104 @@ class BrickfallGame(Game):
                 # Update persistent high score when game is over
                 self.high_score_manager.update_high_score('brickfall', self.score)
                 self.current_high_score = self.high_score_manager.get_high_score('brickfall')
+                self.finish_run(score=self.score, ticks=self.run_ticks, won=False)
                 self.reset_game()
             else:
                 self.ball.center = (self.width // 2, self.height // 2)
-                self.ball_speed_x = 5
-                self.ball_speed_y = 5
+                self.ball_x = float(self.ball.x)
+                self.ball_y = float(self.ball.y)
+                self.ball_speed_x = self.ball_serve_speed
+                self.ball_speed_y = self.ball_serve_speed
+                self.prev_ball = self.ball.copy()  # Teleport, don't interpolate
             
-    def draw(self, screen):
+    def move_ball(self):
+        """Advance the ball one tick with swept collision, so no speed can tunnel through a brick"""
+        remaining = 1.0  # Fraction of this tick's movement still to apply
+        size = self.ball_size
+        for _ in range(self.max_bounces):
+            dx = self.ball_speed_x * remaining
+            dy = self.ball_speed_y * remaining
+            # Only the grid cells under the swept path can be hit
+            path = pygame.Rect(int(min(self.ball_x, self.ball_x + dx)) - 1, int(min(self.ball_y, self.ball_y + dy)) - 1,
+                               int(abs(dx)) + size + 3, int(abs(dy)) + size + 3)
+            bricks = list(self.blocks.cells_in(path))
+            obstacles = self.walls + [self.paddle] + [block for _, _, block in bricks]
+            hit = first_impact(self.ball_x, self.ball_y, size, size, dx, dy, obstacles)
+            if hit is None:
+                self.ball_x += dx
+                self.ball_y += dy
+                break
+            t, normal_x, normal_y, index = hit
+            self.ball_x += dx * t
+            self.ball_y += dy * t
+            remaining *= 1 - t
+            if index == len(self.walls) and normal_y < 0:
+                # Landed on the paddle: the bounce angle depends on where it struck
+                self.ball.x = round(self.ball_x)
+                self.bounce_off_paddle()
+                continue
+            if normal_x:
+                self.ball_speed_x *= -1
+            if normal_y:
+                self.ball_speed_y *= -1
+            if index > len(self.walls):
+                row, col, block = bricks[index - len(self.walls) - 1]
+                self.blocks.remove(row, col)
+                self.particles.emit(block.centerx, block.centery, 30, self.block_color)  # Shatter
+                self.score += 1
+        self.ball.x = round(self.ball_x)
+        self.ball.y = round(self.ball_y)
+        
+    def bounce_off_paddle(self):
+        """Send the ball back up, angled by where it struck the paddle"""
+        self.ball_speed_y = -abs(self.ball_speed_y)
+        hit_position = (self.ball.centerx - self.paddle.centerx) / (self.paddle_width / 2)
+        self.ball_speed_x = hit_position * 6  # Vary horizontal speed
+        self.ball_speed_x += random.uniform(-0.5, 0.5)  # Add slight randomness
+        
+    def draw(self, screen, alpha=1.0):
         screen.fill((0, 0, 0))
         
         if self.game_won:
-            win_text = self.font.render("You Win!", True, (255, 255, 255))
-            screen.blit(win_text, (self.width // 2 - win_text.get_width() // 2, self.height // 2))
+            text_cache.draw(screen, "You Win!", (self.width // 2, self.height // 2), 48, (255, 255, 255), anchor="midtop")
         else:
             # Draw paddle and ball
-            pygame.draw.rect(screen, (255, 255, 255), self.paddle)
-            pygame.draw.ellipse(screen, (255, 255, 255), self.ball)
+            pygame.draw.rect(screen, (255, 255, 255), interpolate_rect(self.prev_paddle, self.paddle, alpha))
+            pygame.draw.ellipse(screen, (255, 255, 255), interpolate_rect(self.prev_ball, self.ball, alpha))
             
             # Draw blocks
             for block in self.blocks:
-                pygame.draw.rect(screen, (0, 255, 0), block)
+                pygame.draw.rect(screen, self.block_color, block)
+            self.particles.draw(screen)
             
             # Draw UI - moved to bottom to avoid overlapping with blocks
-            score_text = self.small_font.render(f"Score: {self.score}  Lives: {self.lives}", True, (255, 255, 255))
-            high_score_text = self.small_font.render(f"High Score: {self.current_high_score}", True, (255, 215, 0))  # Gold color
-            screen.blit(score_text, (10, self.height - 40))
-            screen.blit(high_score_text, (10, self.height - 70))
-            
-        pygame.display.flip()
+            text_cache.draw(screen, ("Score: ", self.score, "  Lives: ", self.lives), (10, self.height - 40), 24, (255, 255, 255))
+            text_cache.draw(screen, ("High Score: ", self.current_high_score), (10, self.height - 70), 24, (255, 215, 0))  # Gold color
+        
+    def observe(self):
+        """Paddle, ball and lives roughly scaled to 0..1, then 1.0/0.0 for every brick cell"""
+        state = [self.paddle.x / self.width, self.ball_x / self.width, self.ball_y / self.height,
+                 self.ball_speed_x / 10, self.ball_speed_y / 10, self.lives / 3]
+        state.extend(0.0 if block is None else 1.0 for block in self.blocks.cells)
+        return state
+        
+    def snapshot(self):
+        """Simulation state as bytes (particles and high scores are not part of it)"""
+        return SNAPSHOT.pack(self.paddle.x, self.ball_x, self.ball_y, self.ball_speed_x, self.ball_speed_y,
+                             self.score, self.lives, self.game_won, self.win_timer, self.run_ticks) + self.blocks.alive
+        
+    def restore(self, data):
+        (self.paddle.x, self.ball_x, self.ball_y, self.ball_speed_x, self.ball_speed_y,
+         self.score, self.lives, game_won, self.win_timer, self.run_ticks) = SNAPSHOT.unpack_from(data)
+        self.game_won = bool(game_won)
+        self.blocks.restore(data[SNAPSHOT.size:])
+        self.ball.x = round(self.ball_x)
+        self.ball.y = round(self.ball_y)
+        self.snap_previous_positions()  # Jump, don't interpolate
+        self.particles.clear()
+        
+    def result(self):
+        return {"score": self.score, "lives": self.lives, "bricks": len(self.blocks)}
         
     def shutdown(self):
         pass
\ No newline at end of file
@@ -0,0 +1,93 @@
+import random
+from collections import deque
+import pygame
+from systems.input import KeyState
+
+# reaction_ticks: how stale the ball state the AI sees is; error: max aim offset in pixels.
+# A shot is missed when the offset exceeds half the paddle plus half the ball (57 px by default).
+DIFFICULTIES = {
+    "easy": {"reaction_ticks": 24, "error": 100},
+    "medium": {"reaction_ticks": 12, "error": 75},
+    "hard": {"reaction_ticks": 6, "error": 62},
+    "perfect": {"reaction_ticks": 0, "error": 0},
+}
+
+# Keys that move each paddle (up, down)
+SIDE_KEYS = {"left": (pygame.K_w, pygame.K_s), "right": (pygame.K_UP, pygame.K_DOWN)}
+
+def unfold(y, low, high):
+    """Fold a straight-line position back between two walls, as if it had bounced off them"""
+    span = high - low
+    if span <= 0:
+        return low
+    offset = (y - low) % (2 * span)  # Mirror images of the court repeat every two spans
+    return low + (offset if offset <= span else 2 * span - offset)
+
+def predict_intercept(ball_x, ball_y, speed_x, speed_y, target_x, low, high):
+    """Ball y when it reaches target_x, in O(1) however many wall bounces happen on the way"""
+    ticks = (target_x - ball_x) / speed_x
+    return unfold(ball_y + speed_y * ticks, low, high)
+
+class PaddleAI:
+    """Steers one paddle toward where the ball will cross its line"""
+    def __init__(self, side, difficulty="medium", seed=None, reaction_ticks=None, error=None):
+        preset = DIFFICULTIES[difficulty]
+        self.side = side
+        self.up_key, self.down_key = SIDE_KEYS[side]
+        self.reaction_ticks = preset["reaction_ticks"] if reaction_ticks is None else reaction_ticks
+        self.error = preset["error"] if error is None else error
+        self.rng = random.Random(seed)  # Own generator so the AI never shifts game randomness
+        self.seen = deque(maxlen=self.reaction_ticks + 1)  # Ball states, oldest is what the AI reacts to
+        self.approaching = False
+        self.aim_offset = 0.0
+
+    def keys(self, game):
+        """Keys to hold this tick"""
+        self.seen.append((game.ball_x, game.ball_y, game.ball_speed_x, game.ball_speed_y))
+        ball_x, ball_y, speed_x, speed_y = self.seen[0]
+        paddle = game.left_paddle if self.side == "left" else game.right_paddle
+        if self.side == "left":
+            approaching = speed_x < 0
+            target_x = paddle.right
+        else:
+            approaching = speed_x > 0
+            target_x = paddle.left - game.ball_size
+        if approaching and not self.approaching:
+            # New incoming shot: pick how far off this attempt will be
+            self.aim_offset = self.rng.uniform(-self.error, self.error)
+        self.approaching = approaching
+
+        if approaching:
+            y = predict_intercept(ball_x, ball_y, speed_x, speed_y, target_x, 0, game.height - game.ball_size)
+            target_y = y + game.ball_size / 2 + self.aim_offset
+        else:
+            target_y = game.height / 2  # Recentre while the ball is away
+        # Stop within one step of the target so the paddle doesn't jitter around it
+        if target_y < paddle.centery - game.paddle_speed / 2:
+            return (self.up_key,)
+        if target_y > paddle.centery + game.paddle_speed / 2:
+            return (self.down_key,)
+        return ()
+
+class AIInput:
+    """Input source where PaddleAI controllers drive some paddles and `passthrough` drives the rest"""
+    def __init__(self, game, controllers, passthrough=None):
+        self.game = game
+        self.controllers = list(controllers)
+        self.passthrough = passthrough  # e.g. KeyboardInput for a human opponent
+        ai_keys = {key for ai in self.controllers for key in SIDE_KEYS[ai.side]}
+        self.human_keys = [key for key in game.input_keys if key not in ai_keys]
+        self.keys = KeyState()
+
+    def begin_tick(self):
+        """Read the human's keys, then let every controller decide"""
+        self.keys.clear()
+        if self.passthrough is not None:
+            self.passthrough.begin_tick()
+            pressed = self.passthrough.get_pressed()
+            self.keys.update(key for key in self.human_keys if pressed[key])
+        for ai in self.controllers:
+            self.keys.update(ai.keys(self.game))
+
+    def get_pressed(self):
+        return self.keys
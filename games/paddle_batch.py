@@ -0,0 +1,191 @@
+import numpy as np
+import pygame
+from games.paddle_game import PaddleGame
+from games.paddle_ai import AIInput, PaddleAI
+
+# Actions for the left paddle, as the keys the real game would see
+ACTIONS = [(), (pygame.K_w,), (pygame.K_s,)]
+
+def make_input(game, agent):
+    """Input for a PaddleGame in a VecEnv that plays like this core: the agent's keys move the
+    left paddle and the perfect AI, which _opponent() mirrors, plays the right"""
+    return AIInput(game, [PaddleAI("right", "perfect")], passthrough=agent)
+
+def fold(y, span):
+    """Reflect straight-line positions back into [0, span]; also returns whether each ended up mirrored"""
+    bounces = np.floor(y / span)
+    offset = y - bounces * span
+    mirrored = bounces % 2 == 1
+    return np.where(mirrored, span - offset, offset), mirrored
+
+class BatchedPaddle:
+    """N Paddle Duel matches stepped together with array operations
+
+    The agent plays the left paddle (ACTIONS index per env, or an (N, 2) array to drive both);
+    otherwise the right paddle is a perfect intercept-predicting opponent. Reward is +1 when the
+    left side scores and -1 when the right side does; an episode ends at win_score points.
+    Observations match PaddleGame.observe(). The ball is swept against walls and paddles the
+    way PaddleGame.move_ball() does it, so corners and paddle edges bounce it the same way.
+    """
+
+    def __init__(self, num_envs, win_score=None, max_episode_steps=None):
+        template = PaddleGame()  # Same court, speeds and match length as the real game
+        self.num_envs = num_envs
+        self.actions = ACTIONS
+        self.win_score = win_score or template.win_score
+        self.max_episode_steps = max_episode_steps
+        self.width = template.width
+        self.height = template.height
+        self.paddle_width = template.paddle_width
+        self.paddle_height = template.paddle_height
+        self.ball_size = template.ball_size
+        self.paddle_speed = template.paddle_speed
+        self.serve_speed = (template.ball_speed_x, template.ball_speed_y)
+        self.max_bounces = template.max_bounces
+        self.left_x = 50
+        self.right_x = self.width - 50 - self.paddle_width
+        # Ball x where it touches each paddle's face
+        self.left_face = self.left_x + self.paddle_width
+        self.right_face = self.right_x - self.ball_size
+        # Top and bottom walls as (left, top, right, bottom), the same rects the game sweeps against
+        self.walls = [(-self.width, -self.height, 2 * self.width, 0),
+                      (-self.width, self.height, 2 * self.width, 2 * self.height)]
+        self.span_y = self.height - self.ball_size
+        self.ball_start = (self.width // 2 - self.ball_size // 2, self.height // 2 - self.ball_size // 2)
+        self.paddle_start = self.height // 2 - self.paddle_height // 2
+        self.ball_x = np.zeros(num_envs)
+        self.ball_y = np.zeros(num_envs)
+        self.speed_x = np.zeros(num_envs)
+        self.speed_y = np.zeros(num_envs)
+        self.left_y = np.zeros(num_envs)
+        self.right_y = np.zeros(num_envs)
+        self.left_score = np.zeros(num_envs, np.int64)
+        self.right_score = np.zeros(num_envs, np.int64)
+        self.steps = np.zeros(num_envs, np.int64)
+
+    def reset(self, seed=None):
+        """Start every match from the serve and return the first observations"""
+        self._reset(np.ones(self.num_envs, bool))
+        return self._observe()
+
+    def _reset(self, mask):
+        self.ball_x[mask], self.ball_y[mask] = self.ball_start
+        self.speed_x[mask], self.speed_y[mask] = self.serve_speed
+        self.left_y[mask] = self.paddle_start
+        self.right_y[mask] = self.paddle_start
+        self.left_score[mask] = 0
+        self.right_score[mask] = 0
+        self.steps[mask] = 0
+
+    def _move_paddle(self, y, up, down):
+        # Same rule as the game: a step is allowed while the edge is still inside the court
+        y -= np.where(up & (y > 0), self.paddle_speed, 0)
+        y += np.where(down & (y + self.paddle_height < self.height), self.paddle_speed, 0)
+
+    def _opponent(self):
+        """Perfect right paddle: chase the predicted crossing point, recentre while the ball is away"""
+        approaching = self.speed_x > 0
+        ticks = np.where(approaching, (self.right_face - self.ball_x) / np.where(approaching, self.speed_x, 1), 0)
+        predicted, _ = fold(self.ball_y + self.speed_y * ticks, self.span_y)
+        target = np.where(approaching, predicted + self.ball_size / 2, self.height / 2)
+        centre = self.right_y + self.paddle_height // 2
+        return target < centre - self.paddle_speed / 2, target > centre + self.paddle_speed / 2
+
+    def _sweep(self, x, y, dx, dy, left, top, right, bottom):
+        """systems.collision.sweep_box() for every env: (time of impact, inf on a miss; x face hit; y face hit)"""
+        # Grow the rect by the ball so the ball becomes a point, then clip the ray against it
+        left = left - self.ball_size
+        top = top - self.ball_size
+        with np.errstate(divide="ignore", invalid="ignore"):
+            near_x = (np.where(dx > 0, left, right) - x) / dx
+            far_x = (np.where(dx > 0, right, left) - x) / dx
+            near_y = (np.where(dy > 0, top, bottom) - y) / dy
+            far_y = (np.where(dy > 0, bottom, top) - y) / dy
+        # Not moving along an axis: always inside that slab, or never
+        near_x = np.where(dx == 0, np.where((left < x) & (x < right), -np.inf, np.inf), near_x)
+        far_x = np.where(dx == 0, np.inf, far_x)
+        near_y = np.where(dy == 0, np.where((top < y) & (y < bottom), -np.inf, np.inf), near_y)
+        far_y = np.where(dy == 0, np.inf, far_y)
+        enter = np.maximum(near_x, near_y)
+        missed = (enter >= np.minimum(far_x, far_y)) | (enter < 0) | (enter > 1)
+        return np.where(missed, np.inf, enter), near_x >= near_y, near_y >= near_x
+
+    def _move_ball(self):
+        """PaddleGame.move_ball() for every env: up to max_bounces impacts, earliest obstacle first"""
+        obstacles = self.walls + [
+            (self.left_x, self.left_y, self.left_x + self.paddle_width, self.left_y + self.paddle_height),
+            (self.right_x, self.right_y, self.right_x + self.paddle_width, self.right_y + self.paddle_height)]
+        remaining = np.ones(self.num_envs)  # Fraction of this tick's movement still to apply
+        moving = np.ones(self.num_envs, bool)
+        for _ in range(self.max_bounces):
+            dx = self.speed_x * remaining
+            dy = self.speed_y * remaining
+            hits = [self._sweep(self.ball_x, self.ball_y, dx, dy, *rect) for rect in obstacles]
+            times = np.stack([sweep[0] for sweep in hits])
+            first = np.argmin(times, axis=0)  # Ties go to the earlier obstacle, as in first_impact()
+            t = times.min(axis=0)
+            hit = moving & (t <= 1)
+            t = np.where(hit, t, moving)  # Whole remaining move where nothing is hit, none once stopped
+            self.ball_x += dx * t
+            self.ball_y += dy * t
+            remaining = np.where(hit, remaining * (1 - t), remaining)
+            self.speed_x = np.where(hit & np.choose(first, [sweep[1] for sweep in hits]), -self.speed_x, self.speed_x)
+            self.speed_y = np.where(hit & np.choose(first, [sweep[2] for sweep in hits]), -self.speed_y, self.speed_y)
+            moving = hit
+            if not moving.any():
+                break
+
+    def _overlaps(self, x, y, paddle_x, paddle_y):
+        """pygame's colliderect() between the ball at (x, y) and a paddle"""
+        return ((x < paddle_x + self.paddle_width) & (paddle_x < x + self.ball_size)
+                & (y < paddle_y + self.paddle_height) & (paddle_y < y + self.ball_size))
+
+    def step(self, actions):
+        """Advance every match one tick; returns (observations, rewards, dones, info)"""
+        actions = np.asarray(actions)
+        if actions.ndim == 2:
+            left, right = actions[:, 0], actions[:, 1]
+            right_up, right_down = right == 1, right == 2
+        else:
+            left = actions
+            right_up, right_down = self._opponent()
+        self._move_paddle(self.left_y, left == 1, left == 2)
+        self._move_paddle(self.right_y, right_up, right_down)
+
+        self._move_ball()
+
+        # A paddle that moved into the ball pushes it out, as in the game. Like the game these
+        # tests use the ball's rect, i.e. its position rounded to whole pixels
+        x, y = np.round(self.ball_x), np.round(self.ball_y)
+        pushed_left = (self.speed_x < 0) & self._overlaps(x, y, self.left_x, self.left_y)
+        self.ball_x = np.where(pushed_left, self.left_face, self.ball_x)
+        self.speed_x = np.where(pushed_left, -self.speed_x, self.speed_x)
+        x = np.where(pushed_left, self.left_face, x)
+        pushed_right = (self.speed_x > 0) & self._overlaps(x, y, self.right_x, self.right_y)
+        self.ball_x = np.where(pushed_right, self.right_face, self.ball_x)
+        self.speed_x = np.where(pushed_right, -self.speed_x, self.speed_x)
+        x = np.where(pushed_right, self.right_face, x)
+
+        # Scoring: serve again from the centre, towards the side that conceded
+        right_point = x <= 0
+        left_point = ~right_point & (x + self.ball_size >= self.width)
+        scored = left_point | right_point
+        self.right_score += right_point
+        self.left_score += left_point
+        self.ball_x[scored], self.ball_y[scored] = self.ball_start
+        self.speed_x = np.where(scored, -self.speed_x, self.speed_x)
+        rewards = left_point.astype(np.float32) - right_point
+
+        self.steps += 1
+        finished = (self.left_score >= self.win_score) | (self.right_score >= self.win_score)
+        truncated = ~finished & (self.steps >= self.max_episode_steps) if self.max_episode_steps else np.zeros(self.num_envs, bool)
+        dones = finished | truncated
+        info = {"score": (self.left_score - self.right_score).astype(np.float32), "truncated": truncated}
+        if dones.any():
+            self._reset(dones)
+        return self._observe(), rewards, dones, info
+
+    def _observe(self):
+        return np.stack([self.ball_x / self.width, self.ball_y / self.height,
+                         self.speed_x / 10, self.speed_y / 10,
+                         self.left_y / self.height, self.right_y / self.height], axis=1).astype(np.float32)
@@ -1,22 +1,35 @@
 import pygame
-from systems.game import Game
+from systems.game import Game, interpolate_rect
+from systems.input import KeyboardInput
+from games.paddle_ai import AIInput, PaddleAI
+from systems.text import text_cache
+from systems.collision import first_impact
 
 class PaddleGame(Game):
+    input_keys = (pygame.K_w, pygame.K_s, pygame.K_UP, pygame.K_DOWN)
+    ai_sides = ()  # Paddles ("left"/"right") the AI plays when the keyboard drives the game
+    ai_difficulty = "medium"
+    
     def __init__(self):
         self.width = 800
         self.height = 600
+        self.input = KeyboardInput()  # Swap for a ScriptedInput to drive the game programmatically
         self.paddle_width = 10
         self.paddle_height = 100
         self.ball_size = 15
         self.paddle_speed = 8
         self.ball_speed_x = 5
         self.ball_speed_y = 5
+        self.max_bounces = 4  # Collisions resolved per tick; more only happen at absurd speeds
+        self.win_score = 11  # First to this many points wins the match
+        self.match_pause = 120  # Ticks the final score stays up before the next match
         
     def init(self, screen):
         self.screen = screen
-        # Use readable system fonts consistently
-        self.font = pygame.font.Font(None, 48)        # main game font
-        self.small_font = pygame.font.Font(None, 24)  # smaller UI elements
+        if self.ai_sides and isinstance(self.input, KeyboardInput):
+            # Headless runs and replays bring their own input and are left alone
+            controllers = [PaddleAI(side, self.ai_difficulty) for side in self.ai_sides]
+            self.input = AIInput(self, controllers, passthrough=self.input)
         self.reset_game()
         
     def reset_game(self):
@@ -26,13 +39,37 @@ class PaddleGame(Game):
         
         # Ball
         self.ball = pygame.Rect(self.width // 2 - self.ball_size // 2, self.height // 2 - self.ball_size // 2, self.ball_size, self.ball_size)
+        self.ball_x = float(self.ball.x)  # Exact position; self.ball is its rounded copy
+        self.ball_y = float(self.ball.y)
+        # Top and bottom walls, as rects the ball can be swept against
+        self.walls = [pygame.Rect(-self.width, -self.height, 3 * self.width, self.height),
+                      pygame.Rect(-self.width, self.height, 3 * self.width, self.height)]
         
         # Scores
         self.left_score = 0
         self.right_score = 0
+        self.winner = None  # "Left" or "Right" once the match is decided
+        self.pause_ticks = 0
+        self.snap_previous_positions()
+        self.drawn_rects = []  # Where paddles, ball and score were last drawn
+        self.changed_rects = None
+        self.invalidate()
+        
+    def snap_previous_positions(self):
+        """Remember positions from the last tick so draw() can interpolate"""
+        self.prev_left_paddle = self.left_paddle.copy()
+        self.prev_right_paddle = self.right_paddle.copy()
+        self.prev_ball = self.ball.copy()
         
     def update(self, dt):
-        keys = pygame.key.get_pressed()
+        self.snap_previous_positions()
+        if self.winner:
+            # Hold the final score on screen, then start the next match
+            self.pause_ticks -= 1
+            if self.pause_ticks <= 0:
+                self.reset_game()
+            return
+        keys = self.input.get_pressed()
         
         # Left paddle (W/S)
         if keys[pygame.K_w] and self.left_paddle.top > 0:
@@ -46,24 +83,21 @@ class PaddleGame(Game):
         if keys[pygame.K_DOWN] and self.right_paddle.bottom < self.height:
             self.right_paddle.y += self.paddle_speed
         
-        # Ball movement
-        self.ball.x += self.ball_speed_x
-        self.ball.y += self.ball_speed_y
-        
-        # Wall collisions
-        if self.ball.top <= 0 or self.ball.bottom >= self.height:
-            self.ball_speed_y *= -1
+        # Ball movement, bouncing off walls and paddles at the exact time of impact
+        self.move_ball()
             
-        # Paddle collisions
+        # Paddle collisions (a paddle moved into the ball)
         # Left paddle
         if self.ball.colliderect(self.left_paddle) and self.ball_speed_x < 0:
             self.ball_speed_x *= -1
             self.ball.left = self.left_paddle.right  # push out
+            self.ball_x = float(self.ball.x)
 
         # Right paddle
         if self.ball.colliderect(self.right_paddle) and self.ball_speed_x > 0:
             self.ball_speed_x *= -1
             self.ball.right = self.right_paddle.left  # push out
+            self.ball_x = float(self.ball.x)
 
             
         # Scoring
@@ -73,24 +107,92 @@ class PaddleGame(Game):
         if self.ball.right >= self.width:
             self.left_score += 1
             self.reset_ball()
+        if max(self.left_score, self.right_score) >= self.win_score:
+            self.winner = "Left" if self.left_score > self.right_score else "Right"
+            self.pause_ticks = self.match_pause
+            self.finish_run(score=self.left_score - self.right_score,
+                            left_score=self.left_score, right_score=self.right_score)
+            self.invalidate()  # The winner text appears outside the tracked rects
             
+    def move_ball(self):
+        """Advance the ball one tick with swept collision, so no speed can tunnel through a paddle"""
+        obstacles = self.walls + [self.left_paddle, self.right_paddle]
+        remaining = 1.0  # Fraction of this tick's movement still to apply
+        for _ in range(self.max_bounces):
+            dx = self.ball_speed_x * remaining
+            dy = self.ball_speed_y * remaining
+            hit = first_impact(self.ball_x, self.ball_y, self.ball_size, self.ball_size, dx, dy, obstacles)
+            if hit is None:
+                self.ball_x += dx
+                self.ball_y += dy
+                break
+            t, normal_x, normal_y, index = hit
+            self.ball_x += dx * t
+            self.ball_y += dy * t
+            remaining *= 1 - t
+            if normal_x:
+                self.ball_speed_x *= -1
+            if normal_y:
+                self.ball_speed_y *= -1
+        self.ball.x = round(self.ball_x)
+        self.ball.y = round(self.ball_y)
+        
     def reset_ball(self):
         self.ball.center = (self.width // 2, self.height // 2)
+        self.ball_x = float(self.ball.x)
+        self.ball_y = float(self.ball.y)
         self.ball_speed_x *= -1
+        self.prev_ball = self.ball.copy()  # Teleport, don't interpolate across the court
         
-    def draw(self, screen):
-        screen.fill((0, 0, 0))
+    def draw(self, screen, alpha=1.0):
+        incremental = self.dirty_rect_mode and not self.full_redraw
+        if incremental:
+            # Erase only what was drawn last frame
+            for rect in self.drawn_rects:
+                screen.fill((0, 0, 0), rect)
+        else:
+            screen.fill((0, 0, 0))
+            self.full_redraw = False
         
-        # Draw paddles and ball
-        pygame.draw.rect(screen, (255, 255, 255), self.left_paddle)
-        pygame.draw.rect(screen, (255, 255, 255), self.right_paddle)
-        pygame.draw.ellipse(screen, (255, 255, 255), self.ball)
+        # Draw paddles and ball between the last two ticks
+        left_paddle = interpolate_rect(self.prev_left_paddle, self.left_paddle, alpha)
+        right_paddle = interpolate_rect(self.prev_right_paddle, self.right_paddle, alpha)
+        ball = interpolate_rect(self.prev_ball, self.ball, alpha)
+        pygame.draw.rect(screen, (255, 255, 255), left_paddle)
+        pygame.draw.rect(screen, (255, 255, 255), right_paddle)
+        if not self.winner:
+            pygame.draw.ellipse(screen, (255, 255, 255), ball)  # Hidden behind the result between matches
         
         # Draw scores
-        score_text = self.font.render(f"{self.left_score} - {self.right_score}", True, (255, 255, 255))
-        screen.blit(score_text, (self.width // 2 - score_text.get_width() // 2, 20))
+        score_rect = text_cache.draw(screen, (self.left_score, " - ", self.right_score), (self.width // 2, 20), 48, (255, 255, 255), anchor="midtop")
+        
+        drawn = [left_paddle, right_paddle, ball, score_rect]
+        if self.winner:
+            drawn.append(text_cache.draw(screen, (self.winner, " wins!"), (self.width // 2, self.height // 2), 48,
+                                         (255, 255, 255), anchor="center"))
+        if incremental:
+            self.changed_rects = [old.union(new) for old, new in zip(self.drawn_rects, drawn)]
+        else:
+            self.changed_rects = None
+        self.drawn_rects = drawn
         
-        pygame.display.flip()
+    def dirty_rects(self):
+        return self.changed_rects
+        
+    def observe(self):
+        """Ball position and velocity, then both paddles' y, roughly scaled to 0..1"""
+        return [self.ball_x / self.width, self.ball_y / self.height,
+                self.ball_speed_x / 10, self.ball_speed_y / 10,
+                self.left_paddle.y / self.height, self.right_paddle.y / self.height]
+        
+    def result(self):
+        # score is the left side's lead, the quantity bots playing the left paddle maximise
+        return {"left_score": self.left_score, "right_score": self.right_score,
+                "score": self.left_score - self.right_score}
         
     def shutdown(self):
         pass
+
+class PaddleVsAIGame(PaddleGame):
+    """Paddle Duel against the computer: the player uses W/S, the AI plays the right paddle"""
+    ai_sides = ("right",)
@@ -1,80 +1,103 @@
 import pygame
 import random
-from systems.game import Game
-import json
-import os
+import struct
+from systems.game import Game, interpolate_rect
+from systems.input import KeyboardInput
+from systems.text import text_cache
+from systems.high_scores import get_store
+from systems.assets import assets
+from systems.sprite_cache import SpriteCache
+from systems.collision import mask_radius, sprites_collide
+from systems.profiler import profiler
+from systems.effects import get_disintegration
+from systems.particles import ParticleSystem
+from systems.spatial_hash import SpatialHash
+from systems.entity_pool import EntityPool
+from systems.starfield import get_starfield
 
-class HighScoreManager:
-    """Manages persistent high scores for games"""
+# Scaled asteroid sprites and masks, shared by every asteroid and every game instance
+asteroid_sprites = SpriteCache(max_entries=1024)  # Spawn sizes plus fragment sizes
+
+# snapshot(): player x/y, score, frame count, hit flash, game over timer and flag, depixelation,
+# asteroid speed, starfield scroll, fire cooldown, asteroid and bullet counts; then x, y, width,
+# height, previous y, sprite variant and drift per asteroid (the image and mask come back from
+# asteroid_sprites), then x, y per bullet
+SNAPSHOT = struct.Struct("<hhdIddBddhBHH")
+ASTEROID_STATE = struct.Struct("<hhhhhBb")
+BULLET_STATE = struct.Struct("<hh")
+
+def is_destroyed(asteroid):
+    """EntityPool.remove_if() predicate, defined once so the bullet pass builds no closure"""
+    return asteroid.destroyed
+
+class Asteroid:
+    """Asteroid object that stores both rect and image for proper collision and rendering
     
-    def __init__(self, save_file="high_scores.json"):
-        self.save_file = save_file
-        self.scores = self.load_scores()
+    Asteroids live in an EntityPool: spawn() reinitialises a released one in place.
+    """
+    __slots__ = ("rect", "prev_y", "image", "mask", "radius", "variant", "vx", "destroyed")
     
-    def load_scores(self):
-        """Load high scores from file"""
-        try:
-            if os.path.exists(self.save_file):
-                with open(self.save_file, 'r') as f:
-                    data = json.load(f)
-                    # Ensure all expected games exist with default 0 values
-                    if "void_drift" not in data:
-                        data["void_drift"] = 0
-                    if "brickfall" not in data:
-                        data["brickfall"] = 0
-                    return data
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.spawn(0, 0, 0, 0, None, None, 0)
         
-        # Return default scores if file doesn't exist or is corrupted
-        return {
-            "void_drift": 0,
-            "brickfall": 0
-        }
-    
-    def save_scores(self):
-        """Save high scores to file"""
-        try:
-            with open(self.save_file, 'w') as f:
-                json.dump(self.scores, f, indent=2)
-        except Exception as e:
-            print(f"Error saving high scores: {e}")
-    
-    def get_high_score(self, game_name):
-        """Get high score for a specific game"""
-        return self.scores.get(game_name, 0)
-    
-    def update_high_score(self, game_name, new_score):
-        """Update high score for a specific game"""
-        current_high = self.get_high_score(game_name)
-        if new_score > current_high:
-            self.scores[game_name] = new_score
-            self.save_scores()
-            return True
-        return False
-
-class Asteroid:
-    """Asteroid object that stores both rect and image for proper collision and rendering"""
-    def __init__(self, x, y, width, height, image):
-        self.rect = pygame.Rect(x, y, width, height)
+    def spawn(self, x, y, width, height, image, mask, radius, variant=0):
+        self.rect.update(x, y, width, height)
+        self.prev_y = y  # Position at the previous tick, for render interpolation
         self.image = image
-        # Create a mask for pixel-perfect collision detection
-        self.mask = pygame.mask.from_surface(image)
+        self.variant = variant  # Source image number, the asteroid_sprites key with the size
+        self.vx = 0  # Sideways drift per tick; fragments drift apart and wrap around the screen
+        self.destroyed = False  # Shot this tick, removed after the bullet pass
+        # Mask for pixel-perfect collision detection, shared from the sprite cache
+        self.mask = mask
+        # Bounding circle around the mask, a cheap rejection test before the mask overlap
+        self.radius = radius
+        return self
+
+PLAYER_IMAGE = "assets/player_ship.png"
+ASTEROID_IMAGES = ["assets/asteroid.png", "assets/asteroid_1.png", "assets/asteroid_2.png",
+                   "assets/asteroid_3.png", "assets/asteroid_4.png"]
+STARFIELD_SEED = 7  # Procedural background; the layers are generated once and cached on disk
 
 class VoidDriftGame(Game):
+    input_keys = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+                  pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s, pygame.K_SPACE)
+    
     def __init__(self):
         self.width = 800
         self.height = 600
+        self.input = KeyboardInput()  # Swap for a ScriptedInput to drive the game programmatically
         self.player_width = 40
         self.player_height = 40
         self.player_speed = 6
         self.asteroid_speed = 4
+        # Difficulty ramp: asteroid speed grows with score from base to max
+        self.asteroid_base_speed = 4
+        self.asteroid_max_speed = 12
+        self.asteroid_speed_ramp = 0.05  # Speed gained per point
         self.asteroid_spawn_rate = 60  # frames between spawns
+        self.asteroid_min_size = 40
+        self.asteroid_max_size = 120
+        self.fragment_min_size = 20  # A shot asteroid splits in two while the halves are at least this big
+        self.fragment_drift = 3  # Fragments drift sideways at 1 to this many pixels per tick
+        self.split_score = 5  # Points for shooting an asteroid
+        self.bullet_width = 4
+        self.bullet_height = 12
+        self.bullet_speed = 12
+        self.fire_cooldown = 12  # Ticks between shots while SPACE is held
+        # Asteroids bucketed by position each tick; the screen wraps left to right
+        self.asteroid_grid = SpatialHash(self.width, self.height, cell_size=64, wrap_x=True, wrap_y=False)
+        self.nearby_asteroids = []  # Reused by every grid query
+        # Asteroids and bullet rects are recycled rather than allocated per spawn
+        self.asteroids = EntityPool(Asteroid)
+        self.bullets = EntityPool(lambda: pygame.Rect(0, 0, 0, 0))
+        self.observed_asteroids = 8  # Nearest asteroids included in observe()
         self.score_multiplier = 10  # Score increases by 10 per second
         self.hit_flash_timer = 0 
         self.game_over = False
         self.game_over_timer = 0  
         self.depixelation_progress = 0  # 0 to 1 for depixelation effect
+        self.particles = ParticleSystem(capacity=2000, bounds=(0, 0, self.width, self.height))
         
         # High score manager for persistent storage
         self.high_score_manager = None
@@ -82,35 +105,30 @@ class VoidDriftGame(Game):
         
         # Visual assets
         self.player_image = None
+        self.player_disintegration = None  # Pre-baked death animation frames
+        self.player_mask = None
+        self.player_radius = 0
         self.asteroid_images = []  # List of different asteroid images
-        self.starfield_image = None
+        self.starfield = None  # Procedural parallax layers, shared between game instances
         
     def init(self, screen):
         self.screen = screen 
-        # Use readable system fonts consistently
-        self.font = pygame.font.Font(None, 36)        # main score
-        self.small_font = pygame.font.Font(None, 24)  # smaller scores
-        self.game_over_font = pygame.font.Font(None, 72) # Game Over text
         
         # Initialize high score manager
-        self.high_score_manager = HighScoreManager()
+        self.high_score_manager = get_store()  # Shared, write-behind store
         self.current_high_score = self.high_score_manager.get_high_score('void_drift')
         
-        # Load assets
+        # Load assets (decoded once in the background and shared between game instances)
         try:
-            self.player_image = pygame.image.load("assets/player_ship.png").convert_alpha()
+            self.player_image = assets.get_image(PLAYER_IMAGE)
             # Load multiple asteroid variants
-            asteroid_variants = ["assets/asteroid.png", "assets/asteroid_1.png", "assets/asteroid_2.png", 
-                               "assets/asteroid_3.png", "assets/asteroid_4.png"]
-            for variant in asteroid_variants:
+            for variant in ASTEROID_IMAGES:
                 try:
-                    asteroid_img = pygame.image.load(variant).convert_alpha()
+                    asteroid_img = assets.get_image(variant)
                     self.asteroid_images.append(asteroid_img)
                 except pygame.error:
                     print(f"Warning: Could not load {variant}")
             
-            self.starfield_image = pygame.image.load("assets/starfield.png").convert()
-            
             if not self.asteroid_images:
                 print("Warning: No asteroid images loaded, using fallback")
                 self.asteroid_images = [None]  # Fallback
@@ -119,29 +137,59 @@ class VoidDriftGame(Game):
             # Fallback to simple shapes if assets fail to load
             self.player_image = None
             self.asteroid_images = [None]  # Fallback
-            self.starfield_image = None
+            
+        # Player collision shape, built once from the ship's alpha channel
+        if self.player_image:
+            self.player_mask = pygame.mask.from_surface(self.player_image)
+        else:
+            self.player_mask = pygame.mask.Mask((self.player_width, self.player_height), fill=True)
+        self.player_radius = mask_radius(self.player_mask)
+        
+        # Bake the death animation once per ship sprite instead of every game-over frame
+        if self.player_image:
+            self.player_disintegration = get_disintegration(PLAYER_IMAGE, self.player_image)
+        
+        # Scale every asteroid variant at every spawnable and fragment size now, not mid-game
+        sizes = range(self.asteroid_min_size, self.asteroid_max_size + 1, asteroid_sprites.quantum)
+        asteroid_sprites.prewarm(self.asteroid_images, sizes)
+        fragment_sizes = range(self.fragment_min_size, self.asteroid_max_size // 2 + 1, asteroid_sprites.quantum)
+        asteroid_sprites.prewarm(self.asteroid_images, fragment_sizes)
+        self.bullet_mask = pygame.mask.Mask((self.bullet_width, self.bullet_height), fill=True)
+        self.bullet_radius = mask_radius(self.bullet_mask)
             
         # Starfield scrolling
+        self.starfield = get_starfield(self.width, self.height, STARFIELD_SEED)
         self.starfield_y = 0
-        self.starfield_speed = 1  # Slower than asteroids
+        self.starfield_speed = 1  # Slower than asteroids; each layer scrolls at a multiple of this
         
         self.reset_game()
         
+    def resume(self, screen):
+        super().resume(screen)
+        # The launcher may have reset the high scores while this instance was suspended
+        self.high_score_manager = get_store()
+        self.current_high_score = self.high_score_manager.get_high_score('void_drift')
+        
     def reset_game(self):
         self.player = pygame.Rect(self.width // 2 - self.player_width // 2, 
             self.height - 100, self.player_width, self.player_height) # Player object
+        self.prev_player = self.player.copy()
         
         # Game state
         self.score = 0
         self.frame_count = 0
-        self.asteroids = []  # List of asteroid objects with their own images
+        self.asteroids.clear()  # Asteroid objects with their own images
+        self.bullets.clear()  # Rects flying up the screen
+        self.fire_timer = 0  # Ticks until the next shot is allowed
         self.hit_flash_timer = 0
         self.game_over = False
         self.game_over_timer = 0
         self.depixelation_progress = 0
         
     def update(self, dt):
-        keys = pygame.key.get_pressed()
+        self.prev_player.update(self.player)
+        self.particles.step(dt)
+        keys = self.input.get_pressed()
 
         if self.game_over:
             # Countdown Game Over timer
@@ -152,7 +200,9 @@ class VoidDriftGame(Game):
                 # Reset player and asteroids manually
                 self.player.x = self.width // 2 - self.player_width // 2
                 self.player.y = self.height - 100
+                self.prev_player.update(self.player)
                 self.asteroids.clear()
+                self.bullets.clear()
                 self.score = 0
                 self.frame_count = 0
                 self.game_over = False
@@ -161,172 +211,275 @@ class VoidDriftGame(Game):
                 self.depixelation_progress = 0
             # Don't process movement or asteroids, but continue the loop
         else:
-            # Player movement (Arrow keys and WASD)
-            if (keys[pygame.K_LEFT] or keys[pygame.K_a]) and self.player.left > 0:
-                self.player.x -= self.player_speed
-            if (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and self.player.right < self.width:
-                self.player.x += self.player_speed
+            # Player movement (Arrow keys and WASD); the screen wraps left to right
+            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+                self.player.x = (self.player.x - self.player_speed) % self.width
+            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+                self.player.x = (self.player.x + self.player_speed) % self.width
+            if abs(self.player.x - self.prev_player.x) > self.width // 2:
+                # Wrapped: move the previous position across the seam too so draw() interpolates smoothly
+                self.prev_player.x += self.width if self.player.x > self.prev_player.x else -self.width
             if (keys[pygame.K_UP] or keys[pygame.K_w]) and self.player.top > 0:
                 self.player.y -= self.player_speed
             if (keys[pygame.K_DOWN] or keys[pygame.K_s]) and self.player.bottom < self.height:
                 self.player.y += self.player_speed
+                
+            # Shooting (SPACE)
+            if self.fire_timer > 0:
+                self.fire_timer -= 1
+            if keys[pygame.K_SPACE] and self.fire_timer == 0:
+                bullet_x = (self.player.centerx - self.bullet_width // 2) % self.width  # The nose may be past the seam
+                self.bullets.acquire().update(bullet_x, self.player.top - self.bullet_height, self.bullet_width, self.bullet_height)
+                self.fire_timer = self.fire_cooldown
 
             # Spawn asteroids
             self.frame_count += 1
             if self.frame_count % self.asteroid_spawn_rate == 0:
                 # Adjust asteroid sizes - remove very small ones, add bigger ones
-                asteroid_width = random.randint(40, 120)  # Increased minimum from 30 to 40, max from 80 to 120
-                asteroid_height = random.randint(40, 120)
+                # Sizes snap to the sprite cache grid so spawns reuse scaled images and masks
+                asteroid_width = asteroid_sprites.quantize(random.randint(self.asteroid_min_size, self.asteroid_max_size))
+                asteroid_height = asteroid_sprites.quantize(random.randint(self.asteroid_min_size, self.asteroid_max_size))
                 asteroid_x = random.randint(0, self.width - asteroid_width)
                 # Select a random asteroid image
-                asteroid_image = random.choice(self.asteroid_images)
-                # Scale the image to match the desired size
-                scaled_image = pygame.transform.scale(asteroid_image, (asteroid_width, asteroid_height))
+                variant = random.randrange(len(self.asteroid_images))
+                sprite = asteroid_sprites.get(variant, self.asteroid_images[variant], asteroid_width, asteroid_height)
                 # Create Asteroid object with pixel-perfect collision
-                self.asteroids.append(Asteroid(asteroid_x, -asteroid_height, asteroid_width, asteroid_height, scaled_image))
-
-            # Move asteroids and check collisions
-            for asteroid in self.asteroids[:]:
-                # Size-based speed variation: bigger asteroids move slower
-                # Base speed modified by size factor (larger = slower)
-                size_factor = 1.0 - (min(asteroid.rect.width, asteroid.rect.height) - 40) / 160  # 40 to 120 range
-                size_factor = max(0.5, size_factor)  # Don't go below 50% speed
-                asteroid_speed_adjusted = self.asteroid_speed * size_factor
-                
-                asteroid.rect.y += asteroid_speed_adjusted
-                if asteroid.rect.top > self.height:
-                    self.asteroids.remove(asteroid)
-                    self.score += 1
-                
-                # Improved pixel-perfect collision detection
-                if self.player.colliderect(asteroid.rect):
-                    # Create a mask for the player (approximate since player is a rect)
-                    player_mask = pygame.mask.Mask((self.player.width, self.player.height), fill=True)
-                    
-                    # Check pixel-perfect collision with proper offset calculation
-                    offset_x = asteroid.rect.x - self.player.x
-                    offset_y = asteroid.rect.y - self.player.y
-                    
-                    if asteroid.mask.overlap(player_mask, (offset_x, offset_y)):
-                        # Handle collision (death)
-                        # Update persistent high score
-                        self.high_score_manager.update_high_score('void_drift', self.score)
-                        self.current_high_score = self.high_score_manager.get_high_score('void_drift')
-                        
-                        self.hit_flash_timer = 0.2
-                        self.game_over = True
-                        self.game_over_timer = 4.0
-                        self.depixelation_progress = 0  # Start depixelation
-                        self.asteroids.remove(asteroid)
+                self.asteroids.acquire().spawn(asteroid_x, -asteroid_height, asteroid_width, asteroid_height,
+                                               sprite.image, sprite.mask, sprite.radius, variant)
 
+            # Move asteroids and check collisions (timed as a span when profiling)
+            with profiler.span("void_drift.asteroids"):
+                self.move_asteroids()
+                self.check_player_collision()
+                if self.bullets:
+                    self.move_bullets()
 
         # Update score (time survived with multiplier)
         if not self.game_over:
             self.score += dt * self.score_multiplier
             
-        # Difficulty ramping - increase asteroid speed based on score
-        # Soft cap: speed increases but slows down at higher values
-        base_speed = 4
-        max_speed = 12
-        speed_factor = 0.05  # How quickly speed increases
-        self.asteroid_speed = min(max_speed, base_speed + (self.score * speed_factor))
+        # Difficulty ramping - increase asteroid speed based on score, capped at the max
+        self.asteroid_speed = min(self.asteroid_max_speed, self.asteroid_base_speed + (self.score * self.asteroid_speed_ramp))
         
         # Update starfield scrolling
         if not self.game_over:
             self.starfield_y += self.starfield_speed
-            # Reset starfield when it scrolls off screen
-            if self.starfield_y >= self.height:
+            # Wrap once every layer is back at its starting position
+            if self.starfield_y >= self.starfield.period:
                 self.starfield_y = 0
 
         return True
 
-    def draw(self, screen):
-        # Draw scrolling starfield background
-        if self.starfield_image:
-            # Draw starfield at current scroll position
-            screen.blit(self.starfield_image, (0, self.starfield_y - self.height))
-            # Draw second copy to create seamless scrolling
-            screen.blit(self.starfield_image, (0, self.starfield_y))
-        else:
+    def move_asteroids(self):
+        """Fall (bigger is slower) and drift around the wrapped screen; asteroids that pass score a point"""
+        asteroids = self.asteroids
+        items = asteroids.items  # Indexed directly: the live ones are items[:asteroids.count]
+        index = 0
+        while index < asteroids.count:
+            asteroid = items[index]
+            # Size-based speed variation: bigger asteroids move slower
+            # Base speed modified by size factor (larger = slower)
+            size_factor = 1.0 - (min(asteroid.rect.width, asteroid.rect.height) - 40) / 160  # 40 to 120 range
+            size_factor = max(0.5, size_factor)  # Don't go below 50% speed
+            asteroid_speed_adjusted = self.asteroid_speed * size_factor
+            
+            asteroid.prev_y = asteroid.rect.y
+            asteroid.rect.y += asteroid_speed_adjusted
+            if asteroid.vx:
+                asteroid.rect.x = (asteroid.rect.x + asteroid.vx) % self.width
+            if asteroid.rect.top > self.height:
+                self.score += 1
+                asteroids.release_at(index)  # The last asteroid moves into this slot; visit it next
+            else:
+                index += 1
+        
+    def check_player_collision(self):
+        """Tiered collision (rect, bounding circles, masks) between the ship and every asteroid
+        
+        A single query, so a straight pass is cheaper than building the spatial hash for it.
+        """
+        straddling = self.player.right > self.width
+        for asteroid in self.asteroids:
+            rect = asteroid.rect
+            if straddling or rect.right > self.width:
+                rect = self.asteroid_grid.nearest(rect, self.player)  # Compare across the seam
+            if sprites_collide(self.player, self.player_mask, self.player_radius,
+                               rect, asteroid.mask, asteroid.radius):
+                # Handle collision (death)
+                # Update persistent high score
+                self.high_score_manager.update_high_score('void_drift', self.score)
+                self.current_high_score = self.high_score_manager.get_high_score('void_drift')
+                
+                self.hit_flash_timer = 0.2
+                self.game_over = True
+                self.game_over_timer = 4.0
+                self.depixelation_progress = 0  # Start depixelation
+                self.finish_run(score=self.score, ticks=self.frame_count)
+                # Explosion burst around the ship
+                self.particles.emit(self.player.centerx, self.player.centery, 120, (255, 160, 0))
+                self.particles.emit(self.player.centerx, self.player.centery, 60, (255, 255, 200), speed=(80, 240))
+                self.asteroids.release(asteroid)
+                return
+                
+    def move_bullets(self):
+        """Bullets fly up; one that hits an asteroid is spent and the asteroid splits
+        
+        The asteroids are bucketed in a spatial hash first, so each bullet only tests its
+        neighbours instead of every asteroid.
+        """
+        grid = self.asteroid_grid
+        grid.clear()
+        for asteroid in self.asteroids:
+            grid.insert(asteroid, asteroid.rect)
+        bullets = self.bullets
+        items = bullets.items
+        shot = 0
+        index = 0
+        while index < bullets.count:
+            bullet = items[index]
+            bullet.y -= self.bullet_speed
+            hit = bullet.bottom < 0  # Off the top counts as spent too
+            if not hit:
+                for asteroid in grid.query(bullet, self.nearby_asteroids):
+                    if asteroid.destroyed:
+                        continue
+                    rect = grid.nearest(asteroid.rect, bullet)
+                    if sprites_collide(bullet, self.bullet_mask, self.bullet_radius, rect, asteroid.mask, asteroid.radius):
+                        asteroid.destroyed = True
+                        shot += 1
+                        hit = True
+                        break
+            if hit:
+                bullets.release_at(index)
+            else:
+                index += 1
+        if shot:
+            asteroids = self.asteroids
+            # Fragments are appended past the end, so only the asteroids that were there are visited
+            for index in range(asteroids.count):
+                if asteroids.items[index].destroyed:
+                    self.split_asteroid(asteroids.items[index])
+            asteroids.remove_if(is_destroyed)
+                
+    def split_asteroid(self, asteroid):
+        """Break a shot asteroid into two half-size fragments drifting apart (too small ones just shatter)"""
+        rect = asteroid.rect
+        self.score += self.split_score
+        self.particles.emit(rect.centerx, rect.centery, 20, (200, 200, 200))
+        if min(rect.width, rect.height) // 2 < self.fragment_min_size:
+            return
+        width = asteroid_sprites.quantize(rect.width // 2)
+        height = asteroid_sprites.quantize(rect.height // 2)
+        sprite = asteroid_sprites.get(asteroid.variant, self.asteroid_images[asteroid.variant], width, height)
+        for side in (-1, 1):
+            x = (rect.centerx - width if side < 0 else rect.centerx) % self.width
+            fragment = self.asteroids.acquire().spawn(x, rect.centery - height // 2, width, height,
+                                                      sprite.image, sprite.mask, sprite.radius, asteroid.variant)
+            fragment.vx = side * random.randint(1, self.fragment_drift)
+
+    def draw(self, screen, alpha=1.0):
+        player_rect = interpolate_rect(self.prev_player, self.player, alpha)
+        
+        # Draw the parallax starfield over the screen the caller has cleared; in dirty-rect mode
+        # the back buffer is left as it was, so clear it here
+        if self.dirty_rect_mode:
             screen.fill((0, 0, 0))
+        self.starfield.draw(screen, self.starfield_y)
         
-        # Draw player
-        if self.player_image:
-            if self.game_over and self.depixelation_progress > 0:
-                # Draw depixelation effect
-                self.draw_depixelation_effect(screen, self.player, self.depixelation_progress)
+        # Draw player, twice while it straddles the left/right seam
+        player_rects = [player_rect]
+        if player_rect.right > self.width:
+            player_rects.append(player_rect.move(-self.width, 0))
+        elif player_rect.left < 0:
+            player_rects.append(player_rect.move(self.width, 0))
+        for player_rect in player_rects:
+            if self.player_image:
+                if self.game_over and self.depixelation_progress > 0:
+                    # Draw depixelation effect
+                    self.draw_depixelation_effect(screen, player_rect, self.depixelation_progress)
+                else:
+                    screen.blit(self.player_image, player_rect)
             else:
-                screen.blit(self.player_image, self.player)
-        else:
-            # Fallback to rectangle
-            player_color = (255, 255, 255)
-            pygame.draw.rect(screen, player_color, self.player)
+                # Fallback to rectangle
+                player_color = (255, 255, 255)
+                pygame.draw.rect(screen, player_color, player_rect)
+                
+        # Draw bullets
+        for bullet in self.bullets:
+            pygame.draw.rect(screen, (255, 255, 120), bullet)
         
         # Draw asteroids
         for asteroid in self.asteroids:
-            if asteroid.image:
-                # Use the asteroid's own pre-scaled image
-                screen.blit(asteroid.image, asteroid.rect)
-            else:
-                # Fallback to rectangle
-                pygame.draw.rect(screen, (200, 200, 200), asteroid.rect)
+            # Interpolate vertical motion between the last two ticks
+            y = round(asteroid.prev_y + (asteroid.rect.y - asteroid.prev_y) * alpha)
+            # A fragment straddling the seam shows on both edges
+            xs = (asteroid.rect.x, asteroid.rect.x - self.width) if asteroid.rect.right > self.width else (asteroid.rect.x,)
+            for x in xs:
+                if asteroid.image:
+                    # Use the asteroid's own pre-scaled image
+                    screen.blit(asteroid.image, (x, y))
+                else:
+                    # Fallback to rectangle
+                    pygame.draw.rect(screen, (200, 200, 200), (x, y, asteroid.rect.width, asteroid.rect.height))
+        
+        self.particles.draw(screen)
         
         # Draw score
-        score_text = self.font.render(f"Score: {int(self.score)}", True, (255, 255, 255))
-        high_score_text = self.font.render(f"High Score: {int(self.current_high_score)}", True, (255, 255, 255))
-        screen.blit(score_text, (10, 10))
-        screen.blit(high_score_text, (10, 50))
+        text_cache.draw(screen, ("Score: ", int(self.score)), (10, 10), 36, (255, 255, 255))
+        text_cache.draw(screen, ("High Score: ", int(self.current_high_score)), (10, 50), 36, (255, 255, 255))
 
          # Draw Game Over text
         if self.game_over:
-            go_text = self.game_over_font.render("GAME OVER!", True, (255, 0, 0))
-            screen.blit(go_text, (self.width//2 - go_text.get_width()//2,
-                                  self.height//2 - go_text.get_height()//2))
-        
-        pygame.display.flip()
+            text_cache.draw(screen, "GAME OVER!", (self.width//2, self.height//2), 72, (255, 0, 0), anchor="center")
         
     def draw_depixelation_effect(self, screen, rect, progress):
-        """Draw a depixelation effect that makes the player disintegrate into pixels"""
-        if not self.player_image:
+        """Draw the player disintegrating into pixels (one blit of a pre-baked frame)"""
+        if not self.player_disintegration:
             return
-            
-        # Create a copy of the player image
-        player_surface = self.player_image.copy()
+        screen.blit(self.player_disintegration.frame(progress), rect)
         
-        # Calculate pixel size based on progress (0 to 1)
-        # At progress 0, full detail. At progress 1, completely pixelated/disintegrated
-        max_pixel_size = 8
-        pixel_size = int(max_pixel_size * progress)
+    def observe(self):
+        """Player position and asteroid speed, then the lowest asteroids' rects (zero-padded), scaled to 0..1"""
+        state = [self.player.x / self.width, self.player.y / self.height, self.asteroid_speed / self.asteroid_max_speed]
+        nearest = sorted(self.asteroids, key=lambda asteroid: -asteroid.rect.bottom)[:self.observed_asteroids]
+        for asteroid in nearest:
+            rect = asteroid.rect
+            state.extend((rect.x / self.width, rect.y / self.height, rect.width / self.width, rect.height / self.height))
+        state.extend([0.0] * (4 * (self.observed_asteroids - len(nearest))))
+        return state
         
-        if pixel_size < 1:
-            # Still mostly intact, just draw normally
-            screen.blit(self.player_image, rect)
-            return
-            
-        # Create pixelation effect
-        # Scale down to create pixelation, then scale back up
-        original_size = self.player_image.get_size()
-        small_size = (max(1, original_size[0] // pixel_size), max(1, original_size[1] // pixel_size))
-        
-        # Scale down (pixelate)
-        small_surface = pygame.transform.scale(player_surface, small_size)
-        
-        # Scale back up (but with pixelation)
-        pixelated_surface = pygame.transform.scale(small_surface, original_size)
+    def snapshot(self):
+        """Simulation state as bytes; asteroids are stored by sprite key rather than by surface"""
+        parts = [SNAPSHOT.pack(self.player.x, self.player.y, self.score, self.frame_count, self.hit_flash_timer,
+                               self.game_over_timer, self.game_over, self.depixelation_progress,
+                               self.asteroid_speed, self.starfield_y, self.fire_timer, len(self.asteroids), len(self.bullets))]
+        for asteroid in self.asteroids:
+            rect = asteroid.rect
+            parts.append(ASTEROID_STATE.pack(rect.x, rect.y, rect.width, rect.height, asteroid.prev_y, asteroid.variant, asteroid.vx))
+        for bullet in self.bullets:
+            parts.append(BULLET_STATE.pack(bullet.x, bullet.y))
+        return b"".join(parts)
         
-        # Add disintegration effect - remove random pixels
-        if progress > 0.3:
-            # Create a mask for disappearing pixels
-            for x in range(0, original_size[0], pixel_size):
-                for y in range(0, original_size[1], pixel_size):
-                    # Random chance to remove this pixel block
-                    if random.random() < progress * 0.8:
-                        # Make this pixel block transparent
-                        pixel_rect = pygame.Rect(x, y, pixel_size, pixel_size)
-                        pygame.draw.rect(pixelated_surface, (0, 0, 0, 0), pixel_rect, 0)
+    def restore(self, data):
+        (self.player.x, self.player.y, self.score, self.frame_count, self.hit_flash_timer, self.game_over_timer,
+         game_over, self.depixelation_progress, self.asteroid_speed, self.starfield_y, self.fire_timer,
+         asteroid_count, bullet_count) = SNAPSHOT.unpack_from(data)
+        self.game_over = bool(game_over)
+        self.prev_player.update(self.player)  # Jump, don't interpolate
+        self.asteroids.clear()
+        bullets_at = SNAPSHOT.size + asteroid_count * ASTEROID_STATE.size
+        for x, y, width, height, prev_y, variant, vx in ASTEROID_STATE.iter_unpack(data[SNAPSHOT.size:bullets_at]):
+            sprite = asteroid_sprites.get(variant, self.asteroid_images[variant], width, height)
+            asteroid = self.asteroids.acquire().spawn(x, y, width, height, sprite.image, sprite.mask, sprite.radius, variant)
+            asteroid.prev_y = prev_y
+            asteroid.vx = vx
+        self.bullets.clear()
+        for x, y in BULLET_STATE.iter_unpack(data[bullets_at:bullets_at + bullet_count * BULLET_STATE.size]):
+            self.bullets.acquire().update(x, y, self.bullet_width, self.bullet_height)
+        self.particles.clear()
         
-        # Draw the pixelated/disintegrating ship
-        screen.blit(pixelated_surface, rect)
+    def result(self):
+        return {"score": self.score, "game_over": self.game_over}
         
     def shutdown(self):
         pass
@@ -1,29 +1,36 @@
+import time
+_startup_began = time.perf_counter()  # Measured before pygame and the systems are imported
+
 import pygame
 import sys
 from systems.game_manager import GameManager
-from games.paddle_game import PaddleGame
-from games.brickfall_game import BrickfallGame
-from games.void_drift_game import VoidDriftGame
+from systems.text import text_cache
+from systems.assets import assets
+from systems.high_scores import get_store
+from systems.profiler import profiler
+from games import GAMES
 
 class LauncherGame:
     def __init__(self):
         self.selected_game = 0
-        self.games = ["Paddle Duel", "Brickfall", "Void Drift"]
-        self.game_classes = [PaddleGame, BrickfallGame, VoidDriftGame]  # Paddle Duel, Brickfall, Void Drift
+        self.game_descriptors = GAMES  # Game modules are imported only when selected
+        self.games = [descriptor.name for descriptor in GAMES]
         self.buttons = []
+        self.dirty_rect_mode = False  # Set by GameManager
+        self.full_redraw = True
+        self.drawn_state = None  # (selection, hovered button) the screen currently shows
+        self.repainted = True
         
     def init(self, screen):
         self.screen = screen
-        # Use readable system fonts with arcade feel
-        self.font = pygame.font.Font(None, 48)  # Large readable font
-        self.small_font = pygame.font.Font(None, 32)  # Medium readable font
         self.update_buttons()
         
     def update_buttons(self):
         """Update button positions based on screen size"""
         self.buttons = []
+        self.full_redraw = True
         for i, game_name in enumerate(self.games):
-            text = self.small_font.render(game_name, True, (255, 255, 255))
+            text = text_cache.render(game_name, 32, (255, 255, 255))
             x = self.screen.get_width() // 2 - text.get_width() // 2
             y = 200 + i * 50
             width = text.get_width() + 20
@@ -36,7 +43,7 @@ class LauncherGame:
             })
         
         # Add Reset High Scores button
-        reset_text = self.small_font.render("Reset High Scores", True, (255, 100, 100))
+        reset_text = text_cache.render("Reset High Scores", 32, (255, 100, 100))
         reset_x = self.screen.get_width() // 2 - reset_text.get_width() // 2
         reset_y = 200 + len(self.games) * 50 + 30
         reset_width = reset_text.get_width() + 20
@@ -51,13 +58,24 @@ class LauncherGame:
     def update(self, dt):
         pass
         
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        # The menu only changes when the selection or hovered button does
+        mouse_pos = pygame.mouse.get_pos()
+        hovered = next((i for i, button in enumerate(self.buttons) if button['rect'].collidepoint(mouse_pos)), None)
+        state = (self.selected_game, hovered)
+        if self.dirty_rect_mode and not self.full_redraw and state == self.drawn_state:
+            self.repainted = False
+            return
+        self.drawn_state = state
+        self.full_redraw = False
+        self.repainted = True
+        
         screen.fill((0, 0, 0))
         
         # Draw title with 3D effect and border
         title_text = "RE:PLAY"
-        title_main = self.font.render(title_text, True, (255, 255, 255))
-        title_shadow = self.font.render(title_text, True, (0, 255, 255))  # Cyan shadow for 3D effect
+        title_main = text_cache.render(title_text, 48, (255, 255, 255))
+        title_shadow = text_cache.render(title_text, 48, (0, 255, 255))  # Cyan shadow for 3D effect
         
         title_x = screen.get_width() // 2 - title_main.get_width() // 2
         title_y = 100
@@ -73,7 +91,6 @@ class LauncherGame:
         pygame.draw.rect(screen, (255, 255, 255), title_rect.inflate(8, 8), 2)  # Outer white border
         
         # Draw game buttons with hover effects
-        mouse_pos = pygame.mouse.get_pos()
         for button in self.buttons[:-1]:  # All buttons except reset
             is_hovered = button['rect'].collidepoint(mouse_pos)
             is_selected = button['index'] == self.selected_game
@@ -104,10 +121,23 @@ class LauncherGame:
         text_y = reset_button['rect'].y + 5
         screen.blit(reset_button['text_surface'], (text_x, text_y))
             
-        instructions = self.small_font.render("Use UP/DOWN to navigate, ENTER to select, ESC to quit", True, (200, 200, 200))
-        screen.blit(instructions, (screen.get_width() // 2 - instructions.get_width() // 2, screen.get_height() - 50))
+        text_cache.draw(screen, "Use UP/DOWN to navigate, ENTER to select, ESC to quit",
+                        (screen.get_width() // 2, screen.get_height() - 50), 32, (200, 200, 200), anchor="midtop")
+        
+    def dirty_rects(self):
+        """Whole screen after a repaint, nothing when the menu was left untouched"""
+        return None if self.repainted else []
+        
+    def invalidate(self):
+        self.full_redraw = True
         
-        pygame.display.flip()
+    def suspend(self):
+        pass
+        
+    def resume(self, screen):
+        # Buttons and cached text are still valid; only the screen needs repainting
+        self.screen = screen
+        self.invalidate()
         
     def shutdown(self):
         pass
@@ -115,17 +145,8 @@ class LauncherGame:
     def reset_high_scores(self):
         """Reset all high scores to 0"""
         try:
-            import json
-            import os
-            
-            # Reset the high scores file
-            high_scores_data = {
-                "void_drift": 0,
-                "brickfall": 0
-            }
-            
-            with open("high_scores.json", 'w') as f:
-                json.dump(high_scores_data, f, indent=2)
+            # Reset in memory; the store writes the file in the background
+            get_store().reset_all()
             
             print("High scores have been reset to 0!")
             
@@ -141,28 +162,48 @@ def main():
     screen = pygame.display.set_mode((800, 600))
     pygame.display.set_caption("RE:PLAY")
     
-    manager = GameManager(LauncherGame)
-    launcher = LauncherGame()
-    launcher.init(screen)
-    manager.set_game_by_index(type(launcher), screen)
+    # --dirty-rects: only present changed regions (helps software rendering on low-end machines)
+    manager = GameManager(LauncherGame, dirty_rects="--dirty-rects" in sys.argv)
+    # Decode every game's images on a worker thread while the menu is up
+    for descriptor in GAMES:
+        assets.preload(descriptor.preload_images)
+    manager.set_game_by_index(LauncherGame, screen)
     
     clock = pygame.time.Clock()
+    max_fps = 60  # Render cap; the simulation rate is GameManager.tick_rate
+    
+    first_frame = True
+    if "--profile" in sys.argv:
+        manager.toggle_profiler()  # Same as pressing F3
     
     try:
         while manager.running:
-            dt = clock.tick(60) / 1000.0
+            dt = clock.tick(max_fps) / 1000.0
             if dt < 0:
                 print(f"WARNING: Negative dt value: {dt}")
                 dt = 0.016  # Fallback to ~60 FPS
-            manager.handle_events()
-            manager.update(dt)
-            manager.draw(screen)
+            profiler.begin_frame()
+            with profiler.span("events"):
+                manager.handle_events()
+            with profiler.span("update"):
+                manager.update(dt)
+            manager.draw(screen)  # Times its own draw and flip phases
+            profiler.end_frame()
+            if first_frame:
+                first_frame = False
+                print(f"Startup took {(time.perf_counter() - _startup_began) * 1000:.0f} ms to the first frame")
     except Exception as e:
         print(f"ERROR in main game loop: {e}")
         import traceback
         traceback.print_exc()
     finally:
         print("Game shutting down...")
+        if manager.recorder:
+            manager.stop_recording()
+        manager.capture.stop()
+        manager.capture.flush()  # Let a clip that is still encoding reach the disk
+        manager.shutdown()
+        get_store().close()  # Make sure pending high scores reach the disk
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,88 @@
+import os
+import threading
+import pygame
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class AssetManager:
+    """Shared image store: files are decoded on a worker thread, converted on the main thread"""
+    
+    def __init__(self, search_paths=None):
+        # Relative asset paths are tried against the working directory first, then the project root
+        self.search_paths = search_paths or [os.getcwd(), PROJECT_ROOT]
+        self.resolved = {}  # requested path -> path on disk
+        self.decoded = {}   # path on disk -> raw Surface until it is converted (or the error hit while decoding it)
+        self.pending = set()  # paths queued on the worker but not decoded yet
+        self.images = {}    # (path on disk, alpha) -> converted Surface shared by every game
+        self.condition = threading.Condition()
+        
+    def resolve(self, path):
+        """Find an asset on disk once and remember where it was"""
+        resolved = self.resolved.get(path)
+        if resolved is None:
+            resolved = path
+            if not os.path.isabs(path):
+                for base in self.search_paths:
+                    candidate = os.path.join(base, path)
+                    if os.path.exists(candidate):
+                        resolved = candidate
+                        break
+            self.resolved[path] = resolved
+        return resolved
+    
+    def preload(self, paths):
+        """Start decoding images on a background thread (call while the launcher is showing)"""
+        with self.condition:
+            queue = []
+            for path in paths:
+                resolved = self.resolve(path)
+                converted = (resolved, True) in self.images or (resolved, False) in self.images
+                if not converted and resolved not in self.decoded and resolved not in self.pending:
+                    self.pending.add(resolved)
+                    queue.append(resolved)
+        if queue:
+            threading.Thread(target=self._decode_all, args=(queue,), daemon=True).start()
+            
+    def _decode_all(self, paths):
+        for path in paths:
+            try:
+                surface = pygame.image.load(path)
+            except (pygame.error, OSError) as e:
+                surface = e
+            with self.condition:
+                self.decoded[path] = surface
+                self.pending.discard(path)
+                self.condition.notify_all()
+    
+    def get_image(self, path, alpha=True):
+        """Return the converted image, raising pygame.error if it can't be loaded"""
+        resolved = self.resolve(path)
+        key = (resolved, alpha)
+        image = self.images.get(key)
+        if image is not None:
+            return image
+        with self.condition:
+            # Wait for the worker rather than decoding the same file twice
+            while resolved in self.pending:
+                self.condition.wait()
+            surface = self.decoded.get(resolved)
+        if surface is None:
+            try:
+                surface = pygame.image.load(resolved)
+            except (pygame.error, OSError) as e:
+                surface = e
+            with self.condition:
+                self.decoded[resolved] = surface
+        if isinstance(surface, Exception):
+            raise pygame.error(f"Could not load {path}: {surface}")
+        # Pixel-format conversion needs the display, so it always happens on the main thread
+        image = surface.convert_alpha() if alpha else surface.convert()
+        self.images[key] = image
+        with self.condition:
+            # The converted copy is what's shared; don't hold the raw one as well. The other
+            # alpha variant, if ever asked for, decodes the file again
+            self.decoded.pop(resolved, None)
+        return image
+
+# Shared by the launcher and every game
+assets = AssetManager()
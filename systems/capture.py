@@ -0,0 +1,165 @@
+import os
+import queue
+import threading
+import time
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # Optional; capture is unavailable without it
+    np = None
+try:
+    from PIL import Image
+except ImportError:  # Optional; without Pillow, GIF requests are written as PNG sequences
+    Image = None
+
+class FrameCapture:
+    """Copies frames into a preallocated ring buffer and encodes them on a background thread
+
+    While recording, capture() costs one array copy of the back buffer's raw pixels (through a
+    surfarray view, no per-frame allocation); the ring keeps the newest `capacity` frames.
+    Stopping hands the ring to the encoder thread, which converts it to RGB and writes an
+    animated GIF or a PNG sequence.
+    """
+
+    def __init__(self, capacity=150, every=2, downscale=2, fps=60, directory="captures"):
+        self.capacity = capacity
+        self.every = every  # Keep every Nth frame (2 at 60 fps = a 30 fps clip)
+        self.downscale = downscale  # Nearest-neighbour shrink, 2 = half width and height
+        self.frame_ms = 1000 * every / fps
+        self.directory = directory
+        self.recording = False
+        self.ring = None
+        self.shifts = None  # RGB bit shifts of 32-bit frames; None when the ring holds RGB
+        self.spare = None  # Ring returned by the encoder, reused by the next start()
+        self.head = 0
+        self.count = 0
+        self.frame = 0
+        self.jobs = queue.Queue()
+        self.worker = None
+
+    def start(self, surface):
+        """Begin recording frames of `surface`'s size; returns False if capture is unavailable"""
+        if np is None:
+            print("Frame capture needs NumPy (pip install numpy)")
+            return False
+        width, height = surface.get_size()
+        step = self.downscale
+        shape = (self.capacity, (height + step - 1) // step, (width + step - 1) // step)
+        if surface.get_bitsize() == 32:
+            # Keep raw pixels: a straight 32-bit copy is far cheaper than gathering RGB bytes
+            self.shifts = surface.get_shifts()[:3]
+            dtype = np.uint32
+        else:
+            self.shifts = None
+            shape += (3,)
+            dtype = np.uint8
+        if self.spare is not None and self.spare.shape == shape and self.spare.dtype == dtype:
+            self.ring, self.spare = self.spare, None
+        else:
+            self.ring = np.empty(shape, dtype)  # Allocated once per recording, not per frame
+        self.head = 0
+        self.count = 0
+        self.frame = 0
+        self.recording = True
+        return True
+
+    def capture(self, surface):
+        """Copy the current back buffer into the ring (call after drawing, before flip)"""
+        if not self.recording:
+            return
+        self.frame += 1
+        if (self.frame - 1) % self.every:
+            return
+        step = self.downscale
+        if self.shifts:
+            view = pygame.surfarray.pixels2d(surface)  # References the pixels, no copy
+            np.copyto(self.ring[self.head], view[::step, ::step].T)  # surfarray is (x, y); rows are contiguous
+            del view  # Unlock the surface before anything blits to it again
+        else:
+            # 8/16-bit surfaces can't be referenced as RGB; array3d makes a temporary copy
+            np.copyto(self.ring[self.head], pygame.surfarray.array3d(surface)[::step, ::step].transpose(1, 0, 2))
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def stop(self, path=None):
+        """Stop recording and encode the buffered frames in the background; returns the target path
+
+        A path ending in .gif gives an animated GIF (needs Pillow); anything else is a
+        directory of numbered PNGs. Without Pillow a .gif path becomes that directory, and
+        the directory is what gets returned.
+        """
+        if not self.recording:
+            return None
+        self.recording = False
+        if path is None:
+            path = os.path.join(self.directory, f"capture_{time.strftime('%Y%m%d_%H%M%S')}.gif")
+        if path.lower().endswith(".gif") and Image is None:
+            print("Pillow not installed; writing a PNG sequence instead of a GIF")
+            path = path[:-4]
+        if self.count:
+            self._submit(("clip", self.ring, (self.head - self.count) % self.capacity, self.count, self.shifts, path))
+        else:
+            self.spare = self.ring
+        self.ring = None
+        return path
+
+    def screenshot(self, surface, path=None):
+        """Save one PNG of `surface` in the background; returns the target path"""
+        if path is None:
+            path = os.path.join(self.directory, f"screenshot_{time.strftime('%Y%m%d_%H%M%S')}.png")
+        self._submit(("shot", surface.copy(), path))  # A plain blit; encoding is the slow part
+        return path
+
+    def flush(self):
+        """Wait until every queued encode has been written"""
+        if self.worker:
+            self.jobs.join()
+
+    def _submit(self, job):
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._encode_loop, daemon=True)
+            self.worker.start()
+        self.jobs.put(job)
+
+    def _encode_loop(self):
+        while True:
+            job = self.jobs.get()
+            try:
+                if job[0] == "shot":
+                    _, image, path = job
+                    self._ensure_directory(os.path.dirname(path))
+                    pygame.image.save(image, path)
+                    print(f"Saved screenshot {path}")
+                else:
+                    _, ring, first, count, shifts, path = job
+                    frames = [self._rgb(ring[(first + i) % self.capacity], shifts) for i in range(count)]
+                    self._write_clip(frames, path)
+                    self.spare = ring
+            except (OSError, pygame.error, ValueError) as e:
+                print(f"Error saving capture: {e}")
+            finally:
+                self.jobs.task_done()
+
+    def _rgb(self, frame, shifts):
+        """(height, width, 3) RGB bytes from one ring frame"""
+        if shifts is None:
+            return frame
+        return np.dstack([(frame >> shift) & 0xFF for shift in shifts]).astype(np.uint8)
+
+    def _write_clip(self, frames, path):
+        if path.lower().endswith(".gif"):  # stop() only keeps .gif when Pillow is available
+            self._ensure_directory(os.path.dirname(path))
+            images = [Image.fromarray(frame) for frame in frames]
+            images[0].save(path, save_all=True, append_images=images[1:],
+                           duration=round(self.frame_ms), loop=0)
+            print(f"Saved {len(frames)} frame GIF {path}")
+            return
+        self._ensure_directory(path)
+        for index, frame in enumerate(frames):
+            pygame.image.save(pygame.surfarray.make_surface(frame.transpose(1, 0, 2)), os.path.join(path, f"frame_{index:04d}.png"))
+        print(f"Saved {len(frames)} frames to {path}/")
+
+    def _ensure_directory(self, directory):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
@@ -0,0 +1,73 @@
+import math
+
+def mask_radius(mask):
+    """Distance from the centre of a mask to its farthest set pixel"""
+    width, height = mask.get_size()
+    cx = width / 2
+    cy = height / 2
+    farthest = 0.0
+    # The farthest set pixel lies on the outline of one of the mask's blobs.
+    # Distances run to the pixel's far corner so the circle fully contains it.
+    cx -= 0.5
+    cy -= 0.5
+    for component in mask.connected_components():
+        points = component.outline()
+        if points:
+            farthest = max(farthest, max((abs(x - cx) + 0.5) ** 2 + (abs(y - cy) + 0.5) ** 2 for x, y in points))
+    return math.sqrt(farthest)
+
+def circles_overlap(ax, ay, a_radius, bx, by, b_radius):
+    """True if two circles touch"""
+    reach = a_radius + b_radius
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy <= reach * reach
+
+def sprites_collide(a_rect, a_mask, a_radius, b_rect, b_mask, b_radius):
+    """Tiered test: rect overlap, then bounding circles, then pixel-perfect masks"""
+    if not a_rect.colliderect(b_rect):
+        return False
+    if not circles_overlap(a_rect.x + a_rect.width / 2, a_rect.y + a_rect.height / 2, a_radius,
+                           b_rect.x + b_rect.width / 2, b_rect.y + b_rect.height / 2, b_radius):
+        return False
+    return a_mask.overlap(b_mask, (b_rect.x - a_rect.x, b_rect.y - a_rect.y)) is not None
+
+def sweep_box(x, y, width, height, dx, dy, rect):
+    """Swept AABB: earliest time in [0, 1] at which a box moving by (dx, dy) touches a static rect
+    
+    Returns (t, normal_x, normal_y) for the face that was hit, or None if the box misses
+    or already overlaps the rect. Cost is the same at any speed, so nothing tunnels.
+    """
+    # Grow the rect by the box size so the box becomes a point, then clip the ray against it
+    left = rect.left - width
+    top = rect.top - height
+    if dx:
+        near_x = ((left if dx > 0 else rect.right) - x) / dx
+        far_x = ((rect.right if dx > 0 else left) - x) / dx
+    elif left < x < rect.right:
+        near_x, far_x = -math.inf, math.inf
+    else:
+        return None
+    if dy:
+        near_y = ((top if dy > 0 else rect.bottom) - y) / dy
+        far_y = ((rect.bottom if dy > 0 else top) - y) / dy
+    elif top < y < rect.bottom:
+        near_y, far_y = -math.inf, math.inf
+    else:
+        return None
+    enter = max(near_x, near_y)
+    if enter >= min(far_x, far_y) or enter < 0 or enter > 1:
+        return None
+    # The later slab entry is the face that was hit; equal entries mean a corner
+    normal_x = (-1 if dx > 0 else 1) if near_x >= near_y else 0
+    normal_y = (-1 if dy > 0 else 1) if near_y >= near_x else 0
+    return enter, normal_x, normal_y
+
+def first_impact(x, y, width, height, dx, dy, rects):
+    """Earliest sweep_box hit against any of `rects`, as (t, normal_x, normal_y, index), or None"""
+    best = None
+    for index, rect in enumerate(rects):
+        hit = sweep_box(x, y, width, height, dx, dy, rect)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit + (index,)
+    return best
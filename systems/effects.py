@@ -0,0 +1,53 @@
+import random
+import pygame
+
+class Disintegration:
+    """Pre-baked frames of a sprite pixelating and crumbling away, drawn with one blit each"""
+
+    def __init__(self, image, steps=60, max_pixel_size=8, seed=0):
+        self.steps = steps
+        self.max_pixel_size = max_pixel_size
+        # Seeded so the pattern is the same every run. Every block size reads its thresholds
+        # from one noise field (a value per block corner pixel, drawn only where a block that
+        # is actually baked starts), and removed blocks stay punched out of `keep` for every
+        # later frame, so holes only grow even when the block grid changes size
+        rng = random.Random(seed)
+        noise = {}  # (x, y) -> threshold
+        keep = pygame.Surface(image.get_size(), pygame.SRCALPHA)  # Opaque white, transparent where removed
+        keep.fill((255, 255, 255, 255))
+        self.frames = [self._bake(image, step / steps, rng, noise, keep) for step in range(steps)]
+
+    def _bake(self, image, progress, rng, noise, keep):
+        # Same look as the old per-frame effect: pixelate, then drop blocks past 30%
+        pixel_size = int(self.max_pixel_size * progress)
+        if pixel_size < 1:
+            return image  # Still intact
+        width, height = image.get_size()
+        small_size = (max(1, width // pixel_size), max(1, height // pixel_size))
+        frame = pygame.transform.scale(pygame.transform.scale(image, small_size), (width, height))
+        if progress > 0.3:
+            for x in range(0, width, pixel_size):
+                for y in range(0, height, pixel_size):
+                    threshold = noise.get((x, y))
+                    if threshold is None:
+                        threshold = noise[(x, y)] = rng.random()
+                    if threshold < progress * 0.8:
+                        keep.fill((0, 0, 0, 0), (x, y, pixel_size, pixel_size))
+            frame.blit(keep, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        return frame
+
+    def frame(self, progress):
+        """Surface to draw at `progress` (0 = intact, 1 = fully disintegrated)"""
+        return self.frames[max(0, min(self.steps - 1, int(progress * self.steps)))]
+
+# Baked effects keyed by sprite name and size, shared between game instances
+_disintegrations = {}
+
+def get_disintegration(name, image):
+    """Return the Disintegration for `image`, baking it the first time it is asked for"""
+    key = (name, image.get_size())
+    effect = _disintegrations.get(key)
+    if effect is None:
+        effect = Disintegration(image)
+        _disintegrations[key] = effect
+    return effect
@@ -0,0 +1,59 @@
+from itertools import islice
+
+class EntityPool:
+    """Reusable entities in one list, with the live ones packed at the front
+
+    acquire() hands back a released entity for the caller to reinitialise (a new one is only
+    built when every entity is live), and release_at() swap-removes: the last live entity
+    moves into the hole, so nothing is shifted, copied or freed per frame. Order is therefore
+    not preserved. While releasing during a pass, walk indexes and re-check the same index
+    after a release; for-loops over the pool must not release.
+    """
+
+    def __init__(self, factory, capacity=0):
+        self.factory = factory  # Builds a blank entity when the pool has to grow
+        self.items = [factory() for _ in range(capacity)]
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self.items[index]
+
+    def __iter__(self):
+        return islice(self.items, self.count)
+
+    def acquire(self):
+        """A dead entity (now live) to reinitialise"""
+        if self.count == len(self.items):
+            self.items.append(self.factory())
+        entity = self.items[self.count]
+        self.count += 1
+        return entity
+
+    def release_at(self, index):
+        """Return the live entity at index to the pool; the last live entity takes its place"""
+        last = self.count - 1
+        items = self.items
+        items[index], items[last] = items[last], items[index]
+        self.count = last
+
+    def release(self, entity):
+        """Return a live entity to the pool (finds it first, so prefer release_at in loops)"""
+        self.release_at(self.items.index(entity, 0, self.count))
+
+    def remove_if(self, predicate):
+        """Release every live entity for which predicate(entity) is true, in one pass"""
+        index = 0
+        while index < self.count:
+            if predicate(self.items[index]):
+                self.release_at(index)
+            else:
+                index += 1
+
+    def clear(self):
+        """Release everything (the entities stay allocated for reuse)"""
+        self.count = 0
@@ -1,9 +1,57 @@
+import pygame
+from systems.game_pool import estimate_size
+
 class Game:
+    dirty_rect_mode = False  # Set by GameManager; the screen is then not cleared between frames
+    full_redraw = True  # Next draw() must repaint everything
+    input_keys = ()  # Every key update() reads; only these are captured when recording
+    runs_finished = 0  # Game overs so far; headless tools poll this to count runs
+    last_run = None  # Summary of the most recent finished run
     def init(self, screen):
         pass
     def update(self, dt):
         pass
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         pass
+    def dirty_rects(self):
+        """Screen regions changed by the last draw(), or None if it repainted the whole screen"""
+        return None
+    def invalidate(self):
+        """Force a full repaint on the next draw() (window exposed, game switched, ...)"""
+        self.full_redraw = True
+    def finish_run(self, **summary):
+        """Signal a game over with its final stats (score, ticks survived, ...)"""
+        self.runs_finished += 1
+        self.last_run = summary
+    def observe(self):
+        """Compact numeric state for bots and vectorized environments (a flat list of floats)"""
+        return []
+    def result(self):
+        """Summary of the current run (scores etc.) for replays and tooling"""
+        return {}
+    def snapshot(self):
+        """Simulation state packed into bytes for restore() (rewind), or None if unsupported"""
+        return None
+    def restore(self, data):
+        """Put the simulation back to a state returned by snapshot()"""
+        pass
+    def suspend(self):
+        """Called when the player switches away; the instance is kept (in a GamePool) to resume later"""
+        pass
+    def resume(self, screen):
+        """Called instead of init() when a suspended instance becomes active again"""
+        self.screen = screen
+        self.invalidate()  # Whatever was on screen meanwhile must be painted over
+    def memory_size(self):
+        """Approximate bytes this instance keeps alive while suspended (counted against GamePool's budget)"""
+        return estimate_size(self)
     def shutdown(self):
-        pass
\ No newline at end of file
+        pass
+
+def interpolate_rect(previous, current, alpha):
+    """Blend two rects for rendering between fixed simulation ticks"""
+    if previous is None or alpha >= 1.0:
+        return current
+    x = previous.x + (current.x - previous.x) * alpha
+    y = previous.y + (current.y - previous.y) * alpha
+    return pygame.Rect(round(x), round(y), current.width, current.height)
@@ -1,39 +1,222 @@
+import os
+import random
+import time
 import pygame
+from systems.replay import InputRecorder
+from systems.profiler import profiler
+from systems.capture import FrameCapture
+from systems.game_pool import GamePool
+from systems.rewind import RewindBuffer
+from systems.text import text_cache
 
 class GameManager: # This shouldn't change much now. 1/27/26
-    def __init__(self, launcher_class=None):
+    def __init__(self, launcher_class=None, tick_rate=60, max_steps_per_frame=5, dirty_rects=False, dirty_area_limit=0.5, pool_budget=64 * 1024 * 1024):
         self.active_game = None
         self.running = True
         self.in_game = False
         self.launcher_class = launcher_class
-    def set_game_by_index(self, game_class, screen):
+        # Fixed-timestep simulation: games always advance by fixed_dt per tick
+        self.set_tick_rate(tick_rate)
+        self.max_steps_per_frame = max_steps_per_frame  # Catch-up cap after a slow frame
+        self.accumulator = 0.0
+        self.alpha = 0.0  # How far the renderer is between the last two ticks (0 to 1)
+        # Dirty-rect mode: games report what they changed and only those regions are presented
+        self.dirty_rect_mode = dirty_rects
+        self.dirty_area_limit = dirty_area_limit  # Fraction of the screen above which a full flip is cheaper
+        self.recorder = None  # InputRecorder while F5 recording is on
+        self.pool = GamePool(pool_budget)  # Switched-away games, suspended rather than rebuilt
+        self.rewind = RewindBuffer(seconds=30, tick_rate=self.tick_rate)  # Snapshots of the active game
+        self.rewinding = False  # Backspace held: ticks step back through the buffer instead
+        self.rewindable = False  # Set by the first snapshot pushed; games without snapshots keep running
+        self.replay_dir = "replays"
+        self.capture = FrameCapture()  # F6 clip / F7 screenshot of what the game draws
+        self.screenshot_pending = False
+    def set_tick_rate(self, tick_rate):
+        """Set how many simulation ticks run per second (games are tuned for 60)"""
+        self.tick_rate = tick_rate
+        self.fixed_dt = 1.0 / tick_rate
+    def set_game_by_index(self, game_class, screen, fresh=False):
+        """Switch to game_class, resuming its suspended instance unless `fresh` asks for a new one"""
         if self.active_game:
-            self.active_game.shutdown()
-        self.active_game = game_class()
-        self.active_game.init(screen)
+            self.pool.put(self.active_game)
+        game = self.pool.take(game_class)
+        if game and fresh:
+            game.shutdown()
+            game = None
+        if game:
+            game.dirty_rect_mode = self.dirty_rect_mode
+            game.resume(screen)
+        else:
+            game = game_class()
+            game.dirty_rect_mode = self.dirty_rect_mode
+            game.init(screen)
+        self.active_game = game
         self.in_game = True
+        self.rewind.clear()  # History belongs to the game it was taken from
+        self.rewindable = False
+        self.reset_timestep()
+    def reset_timestep(self):
+        """Drop any banked simulation time, e.g. after switching games"""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+    def start_recording(self, screen):
+        """Restart the active game with a fresh RNG seed and log its input every tick"""
+        game_class = type(self.active_game)
+        seed = int.from_bytes(os.urandom(8), "little") >> 1
+        random.seed(seed)  # Brickfall and Void Drift draw from the global RNG
+        self.set_game_by_index(game_class, screen, fresh=True)  # A replay must start from init()
+        self.recorder = InputRecorder(self.active_game.input, game_class, seed, self.tick_rate)
+        self.active_game.input = self.recorder
+        print(f"Recording {game_class.__name__} (seed {seed})")
+    def stop_recording(self):
+        """Save the current recording to replay_dir and stop logging"""
+        recorder = self.recorder
+        self.recorder = None
+        if self.active_game and self.active_game.input is recorder:
+            self.active_game.input = recorder.source
+            recorder.log.result = self.active_game.result()
+        name = recorder.log.game.split(":")[1]
+        path = os.path.join(self.replay_dir, f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.rply")
+        try:
+            recorder.log.save(path)
+            print(f"Saved replay {path} ({recorder.log.ticks} ticks, {os.path.getsize(path)} bytes)")
+        except OSError as e:
+            print(f"Error saving replay: {e}")
     def return_to_launcher(self, launcher_class):
+        if self.recorder:
+            self.stop_recording()
+        # Set launcher as active game; the game is suspended so it can be resumed
+        self.set_game_by_index(launcher_class, pygame.display.get_surface())
+    def start_selected_game(self):
+        """Import (if needed) and start the game highlighted in the launcher"""
+        launcher = self.active_game
+        if launcher.selected_game < len(launcher.game_descriptors):
+            descriptor = launcher.game_descriptors[launcher.selected_game]
+            self.set_game_by_index(descriptor.load(), launcher.screen)
+    def shutdown(self):
+        """Shut down the active game and every suspended one"""
         if self.active_game:
             self.active_game.shutdown()
-        # Set launcher as active game
-        self.active_game = launcher_class()
-        self.active_game.init(pygame.display.get_surface())
-        self.in_game = True
+            self.active_game = None
+        self.pool.clear()
     def update(self, dt):
-        if self.active_game:
-            self.active_game.update(dt)
+        if not self.active_game:
+            return
+        self.accumulator += dt
+        steps = 0
+        input_source = getattr(self.active_game, 'input', None)
+        # Rewind snapshots every tick, except while recording: a replay can't go backwards
+        snapshot = getattr(self.active_game, 'snapshot', None) if self.recorder is None else None
+        while self.accumulator >= self.fixed_dt and steps < self.max_steps_per_frame:
+            if self.rewinding and self.rewindable:
+                state = self.rewind.step_back()
+                if state is not None:
+                    self.active_game.restore(state)
+            else:
+                if input_source:
+                    input_source.begin_tick()
+                self.active_game.update(self.fixed_dt)
+                if snapshot:
+                    state = snapshot()
+                    if state is not None:
+                        self.rewind.push(state)
+                        self.rewindable = True
+            self.accumulator -= self.fixed_dt
+            steps += 1
+        if self.accumulator >= self.fixed_dt:
+            # Too far behind (window drag, breakpoint, slow cabinet) - drop the backlog
+            # instead of spiralling into ever longer catch-up frames
+            self.accumulator %= self.fixed_dt
+        self.alpha = self.accumulator / self.fixed_dt
     def draw(self, screen):
-        screen.fill((0, 0, 0))
-        if self.active_game:
-            self.active_game.draw(screen)
-        pygame.display.flip()
+        if not self.dirty_rect_mode:
+            with profiler.span("draw"):
+                screen.fill((0, 0, 0))
+                if self.active_game:
+                    self.active_game.draw(screen, self.alpha)
+                self.capture_frame(screen)
+                if self.rewinding and self.rewind:
+                    self.draw_rewind_indicator(screen)
+                if profiler.overlay:
+                    profiler.draw_overlay(screen)
+            with profiler.span("flip"):
+                pygame.display.flip()
+            return
+        # Dirty-rect mode: the game owns the back buffer and reports what it touched
+        rects = None
+        with profiler.span("draw"):
+            if self.active_game:
+                self.active_game.draw(screen, self.alpha)
+                rects = self.active_game.dirty_rects()
+            self.capture_frame(screen)
+            if self.rewinding and self.rewind:
+                indicator_rect = self.draw_rewind_indicator(screen)
+                if rects is not None:
+                    rects = rects + [indicator_rect]
+            if profiler.overlay:
+                overlay_rect = profiler.draw_overlay(screen)
+                if rects is not None:
+                    rects = rects + [overlay_rect]
+        with profiler.span("flip"):
+            if rects is None or sum(r.width * r.height for r in rects) > self.dirty_area_limit * screen.get_width() * screen.get_height():
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+    def draw_rewind_indicator(self, screen):
+        """Show how much history is left while rewinding; returns the area drawn"""
+        seconds = len(self.rewind) * self.fixed_dt
+        return text_cache.draw(screen, ("<< REWIND ", round(seconds), "s"), (screen.get_width() - 10, 10), 24,
+                               (255, 215, 0), anchor="topright")
+    def capture_frame(self, screen):
+        """Copy the finished game frame (before the profiler overlay) into the capture ring"""
+        if self.capture.recording:
+            with profiler.span("capture"):
+                self.capture.capture(screen)
+        if self.screenshot_pending:
+            self.screenshot_pending = False
+            self.capture.screenshot(screen)
+    def toggle_capture(self):
+        """F6: start/stop recording frames; stopping encodes the clip in the background"""
+        if self.capture.recording:
+            print(f"Encoding capture {self.capture.stop()}")
+        elif self.capture.start(pygame.display.get_surface()):
+            print(f"Capturing frames (keeps the last {self.capture.capacity * self.capture.every})")
+    def toggle_profiler(self):
+        """F3: start/stop collecting frame timings and show the overlay"""
+        profiler.enabled = not profiler.enabled
+        profiler.overlay = profiler.enabled
+        if profiler.enabled:
+            profiler.reset()
+        elif self.active_game:
+            self.active_game.invalidate()  # Repaint over the overlay box
     def handle_events(self):
         try:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    # Another window may have drawn over us; repaint everything once
+                    if self.active_game:
+                        self.active_game.invalidate()
                 elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+                    if event.key == pygame.K_F3:
+                        self.toggle_profiler()
+                    elif event.key == pygame.K_F4 and profiler.frames:
+                        # F4 writes the buffered frames as CSV and Chrome trace JSON
+                        print(f"Saved frame profile {profiler.export()}.csv/.json")
+                    elif event.key == pygame.K_BACKSPACE:
+                        self.rewinding = True  # Held: step back through the last 30 seconds
+                    elif event.key == pygame.K_F6:
+                        self.toggle_capture()
+                    elif event.key == pygame.K_F7:
+                        self.screenshot_pending = True  # Taken from the next finished frame
+                    elif event.key == pygame.K_F5 and self.in_game and self.active_game and self.active_game.__class__.__name__ != 'LauncherGame':
+                        # F5 toggles input recording for the current game
+                        if self.recorder:
+                            self.stop_recording()
+                        else:
+                            self.start_recording(pygame.display.get_surface())
+                    elif event.key == pygame.K_ESCAPE:
                         if self.in_game and self.active_game and self.active_game.__class__.__name__ != 'LauncherGame':
                             self.return_to_launcher(self.launcher_class)
                         else:
@@ -44,8 +227,11 @@ class GameManager: # This shouldn't change much now. 1/27/26
                         elif event.key == pygame.K_UP:
                             self.active_game.selected_game = (self.active_game.selected_game - 1) % len(self.active_game.games)
                         elif event.key == pygame.K_RETURN:
-                            if self.active_game.selected_game < len(self.active_game.game_classes) and self.active_game.game_classes[self.active_game.selected_game]:
-                                self.set_game_by_index(self.active_game.game_classes[self.active_game.selected_game], self.active_game.screen)
+                            self.start_selected_game()
+                elif event.type == pygame.KEYUP and event.key == pygame.K_BACKSPACE:
+                    self.rewinding = False
+                    if self.active_game:
+                        self.active_game.invalidate()  # Repaint over the rewind indicator
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
                     if self.in_game and self.active_game and self.active_game.__class__.__name__ == 'LauncherGame':
                         mouse_pos = pygame.mouse.get_pos()
@@ -58,8 +244,7 @@ class GameManager: # This shouldn't change much now. 1/27/26
                                     # Select game
                                     self.active_game.selected_game = button['index']
                                     # Auto-start game on click
-                                    if self.active_game.selected_game < len(self.active_game.game_classes) and self.active_game.game_classes[self.active_game.selected_game]:
-                                        self.set_game_by_index(self.active_game.game_classes[self.active_game.selected_game], self.active_game.screen)
+                                    self.start_selected_game()
         except Exception as e:
             print(f"ERROR in handle_events: {e}")
             self.running = False
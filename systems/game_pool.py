@@ -0,0 +1,84 @@
+from collections import OrderedDict
+import pygame
+from systems.assets import assets
+
+def estimate_size(obj, shared=None, depth=4):
+    """Rough bytes of surfaces and buffers reachable from obj (the display and shared asset images not counted)"""
+    if shared is None:
+        shared = {id(image) for image in assets.images.values()}  # Owned by the asset cache
+        shared.add(id(pygame.display.get_surface()))
+    seen = set(shared)
+    total = 0
+    stack = [(obj, depth)]
+    while stack:
+        value, level = stack.pop()
+        if id(value) in seen or value is None or isinstance(value, (int, float, str, bool)):
+            continue
+        seen.add(id(value))
+        if isinstance(value, pygame.Surface):
+            total += value.get_width() * value.get_height() * value.get_bytesize()
+            continue
+        try:
+            total += memoryview(value).nbytes  # NumPy arrays, array.array, bytes
+            continue
+        except TypeError:
+            pass
+        if level == 0:
+            continue
+        if isinstance(value, dict):
+            children = list(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            children = value
+        else:
+            children = list(getattr(value, "__dict__", {}).values())
+        stack.extend((child, level - 1) for child in children)
+    return total
+
+class GamePool:
+    """Keeps switched-away game instances suspended so coming back to them is instant
+
+    put() suspends a game and parks it; take() hands the parked instance of a class back for
+    resume(). At most one instance per class is kept, and the least recently used ones are
+    shut down once their estimated memory goes over `budget` bytes.
+    """
+
+    def __init__(self, budget=64 * 1024 * 1024):
+        self.budget = budget
+        self.games = OrderedDict()  # game class -> suspended instance, least recently used first
+        self.sizes = {}  # game class -> estimated bytes, measured when suspended
+
+    def __len__(self):
+        return len(self.games)
+
+    def __contains__(self, game_class):
+        return game_class in self.games
+
+    def put(self, game):
+        """Suspend `game` and keep it for a later take(), evicting old games over the budget"""
+        game_class = type(game)
+        previous = self.games.pop(game_class, None)
+        if previous is not None and previous is not game:
+            previous.shutdown()
+        game.suspend()
+        self.games[game_class] = game
+        self.sizes[game_class] = game.memory_size() if hasattr(game, "memory_size") else estimate_size(game)
+        while len(self.games) > 1 and sum(self.sizes[cls] for cls in self.games) > self.budget:
+            self.discard(next(iter(self.games)))
+
+    def take(self, game_class):
+        """The suspended instance of game_class (now owned by the caller), or None"""
+        self.sizes.pop(game_class, None)
+        return self.games.pop(game_class, None)
+
+    def discard(self, game_class):
+        """Shut down the suspended instance of game_class, if any"""
+        game = self.take(game_class)
+        if game is not None:
+            game.shutdown()
+
+    def clear(self):
+        for game_class in list(self.games):
+            self.discard(game_class)
+
+    def memory_used(self):
+        return sum(self.sizes.values())
@@ -0,0 +1,55 @@
+import os
+import time
+import pygame
+from systems.input import ScriptedInput
+from systems.high_scores import HighScoreStore, set_store
+
+def init_headless(size=(800, 600)):
+    """Initialise pygame with no visible window and return an offscreen surface"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    # convert()/convert_alpha() still need a display mode; the dummy driver never shows it
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode(size)
+    return pygame.Surface(size)
+
+class HeadlessRunner:
+    """Drives a game as fast as the CPU allows: no window, no flip, no frame cap"""
+    def __init__(self, game_class, input_source=None, tick_rate=60, render=False, size=(800, 600), persist_scores=False, configure=None, capture=None):
+        self.screen = init_headless(size)
+        if not persist_scores:
+            # Soak tests and sweeps must not write their scores into the player's high_scores.json
+            set_store(HighScoreStore(save_file=None))
+        self.game = game_class()
+        # Headless games never read the keyboard; default to an idle scripted source
+        self.game.input = input_source if input_source is not None else ScriptedInput()
+        if configure:
+            configure(self.game)  # Tweak attributes init() reads, e.g. Brickfall's wall layout
+        self.game.init(self.screen)
+        self.dt = 1.0 / tick_rate
+        self.render = render or capture is not None  # Draw into the offscreen surface (never presented)
+        self.capture = capture  # Optional FrameCapture fed every drawn frame
+        if capture:
+            capture.start(self.screen)
+        self.ticks = 0
+    def step(self):
+        """Advance the game by one fixed tick"""
+        self.game.input.begin_tick()
+        self.game.update(self.dt)
+        if self.render:
+            self.screen.fill((0, 0, 0))  # Cleared like GameManager does, so games may draw only what they show
+            self.game.draw(self.screen)
+            if self.capture:
+                self.capture.capture(self.screen)
+        self.ticks += 1
+    def run(self, ticks, until=None):
+        """Run up to `ticks` ticks (or until `until(game)` is true) and return elapsed seconds"""
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.step()
+            if until and until(self.game):
+                break
+        return time.perf_counter() - start
+    def shutdown(self):
+        self.game.shutdown()
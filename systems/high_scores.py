@@ -0,0 +1,165 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+
+DEFAULT_GAMES = ("void_drift", "brickfall")
+
+class HighScoreStore:
+    """High scores and top-N leaderboards kept in memory and written to disk in the background.
+    
+    The game loop only ever touches memory. A writer thread saves the file with a
+    temp-file-plus-rename, so a crash mid-write can never leave a half-written file.
+    Pass save_file=None for a memory-only store (headless runs, benchmarks).
+    """
+    
+    def __init__(self, save_file="high_scores.json", top_n=10):
+        self.save_file = save_file
+        self.top_n = top_n
+        self.lock = threading.Lock()
+        self.scores = {game: 0 for game in DEFAULT_GAMES}
+        self.leaderboards = {}
+        self.reset_games = set()  # Reset since the last write; don't merge their old scores back in
+        self.wake = threading.Event()
+        self.closed = False
+        self.writer = None
+        if save_file:
+            self.load_scores()
+            self.writer = threading.Thread(target=self._write_loop, daemon=True)
+            self.writer.start()
+    
+    def load_scores(self):
+        """Load high scores from file"""
+        scores, leaderboards = self._read_file()
+        with self.lock:
+            self.scores.update(scores)
+            self.leaderboards.update(leaderboards)
+    
+    def _read_file(self):
+        try:
+            if os.path.exists(self.save_file):
+                with open(self.save_file, 'r') as f:
+                    data = json.load(f)
+                leaderboards = {game: [entry for entry in board if isinstance(entry, dict) and "score" in entry and "time" in entry]
+                                for game, board in data.pop("leaderboards", {}).items()}
+                scores = {game: score for game, score in data.items() if isinstance(score, (int, float))}
+                return scores, leaderboards
+        except (json.JSONDecodeError, OSError, AttributeError, TypeError):
+            pass
+        # File doesn't exist or is corrupted
+        return {}, {}
+    
+    def get_high_score(self, game_name):
+        """Get high score for a specific game"""
+        with self.lock:
+            return self.scores.get(game_name, 0)
+    
+    def get_leaderboard(self, game_name):
+        """Best runs for a game, highest first, as {"score": ..., "time": ...} entries"""
+        with self.lock:
+            return [dict(entry) for entry in self.leaderboards.get(game_name, [])]
+    
+    def update_high_score(self, game_name, new_score):
+        """Record a finished run; returns True if it beat the high score"""
+        with self.lock:
+            board = self.leaderboards.setdefault(game_name, [])
+            board.append({"score": new_score, "time": time.time()})
+            board.sort(key=lambda entry: entry["score"], reverse=True)
+            del board[self.top_n:]
+            is_best = new_score > self.scores.get(game_name, 0)
+            if is_best:
+                self.scores[game_name] = new_score
+        self.save_scores()
+        return is_best
+    
+    def reset_high_score(self, game_name):
+        """Reset high score and leaderboard for a specific game"""
+        with self.lock:
+            self.scores[game_name] = 0
+            self.leaderboards.pop(game_name, None)
+            self.reset_games.add(game_name)
+        self.save_scores()
+    
+    def reset_all(self):
+        """Reset every game's high score"""
+        with self.lock:
+            games = set(self.scores) | set(self.leaderboards)
+        for game_name in games:
+            self.reset_high_score(game_name)
+    
+    def save_scores(self):
+        """Schedule a write; returns immediately"""
+        if self.writer:
+            self.wake.set()
+    
+    def flush(self):
+        """Write to disk now (used on shutdown)"""
+        if self.save_file:
+            self._write()
+    
+    def close(self):
+        """Stop the writer thread and make sure everything is on disk"""
+        if self.writer and not self.closed:
+            self.closed = True
+            self.wake.set()
+            self.writer.join(timeout=2.0)
+            self.flush()
+    
+    def _write_loop(self):
+        while True:
+            self.wake.wait()
+            self.wake.clear()
+            if self.closed:
+                return
+            try:
+                self._write()
+            except Exception as e:
+                print(f"Error saving high scores: {e}")
+    
+    def _write(self):
+        # Merge with what is on disk so another process's new records aren't lost
+        disk_scores, disk_boards = self._read_file()
+        with self.lock:
+            for game_name, score in disk_scores.items():
+                if game_name not in self.reset_games:
+                    self.scores[game_name] = max(score, self.scores.get(game_name, 0))
+            for game_name, board in disk_boards.items():
+                if game_name not in self.reset_games:
+                    # Runs are identified by (score, time), so entries both sides know aren't doubled
+                    merged = {(entry["score"], entry["time"]): entry for entry in board}
+                    for entry in self.leaderboards.get(game_name, []):
+                        merged[(entry["score"], entry["time"])] = entry
+                    ranked = sorted(merged.values(), key=lambda entry: entry["score"], reverse=True)
+                    self.leaderboards[game_name] = ranked[:self.top_n]
+            self.reset_games.clear()
+            data = dict(self.scores)
+            data["leaderboards"] = {game: [dict(entry) for entry in board] for game, board in self.leaderboards.items()}
+        directory = os.path.dirname(os.path.abspath(self.save_file))
+        fd, temp_path = tempfile.mkstemp(prefix=".high_scores.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.save_file)  # Atomic on the same filesystem
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+_store = None
+
+def get_store():
+    """The process-wide store every game shares"""
+    global _store
+    if _store is None:
+        _store = HighScoreStore()
+        atexit.register(_store.close)
+    return _store
+
+def set_store(store):
+    """Replace the shared store, e.g. with a memory-only one for headless runs"""
+    global _store
+    _store = store
@@ -0,0 +1,36 @@
+import pygame
+
+class KeyState(set):
+    """Set of held keys that can be indexed like pygame.key.get_pressed()"""
+    def __getitem__(self, key):
+        return key in self
+
+class KeyboardInput:
+    """Input source backed by the real keyboard"""
+    def begin_tick(self):
+        """Called once per simulation tick before the game updates"""
+        pass
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+class ScriptedInput:
+    """Programmatic input source for headless runs, bots and soak tests"""
+    def __init__(self, script=None):
+        self.script = script  # Optional callable(tick) -> iterable of held keys
+        self.tick = 0
+        self.keys = KeyState()
+    def begin_tick(self):
+        """Advance the script by one tick"""
+        if self.script:
+            self.set_pressed(self.script(self.tick))
+        self.tick += 1
+    def press(self, key):
+        self.keys.add(key)
+    def release(self, key):
+        self.keys.discard(key)
+    def set_pressed(self, keys):
+        """Replace the held keys with the given iterable"""
+        self.keys.clear()
+        self.keys.update(keys)
+    def get_pressed(self):
+        return self.keys
@@ -0,0 +1,176 @@
+import math
+import random
+from array import array
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # Optional: without NumPy the same buffers are stepped in a Python loop
+    np = None
+
+FADE_LEVELS = 4  # Particles dim through this many alpha steps as their life runs out
+
+class ParticleSystem:
+    """Fixed-capacity particles kept in flat arrays, stepped together and drawn with one batched blit"""
+
+    def __init__(self, capacity=10000, size=3, gravity=0.0, bounds=None, seed=None):
+        self.capacity = capacity
+        self.size = size
+        self.gravity = gravity  # Pixels per second squared, positive is down
+        self.bounds = pygame.Rect(bounds) if bounds else None  # Particles leaving it die early
+        self.count = 0  # Live particles are always packed into [0, count)
+        # Effects are cosmetic, so they get their own generator and never shift gameplay randomness
+        self.rng = np.random.default_rng(seed) if np else random.Random(seed)
+        self.colors = {}  # color -> palette index
+        self.surfaces = []  # FADE_LEVELS squares per palette color, dimmest first
+        if np:
+            self.x = np.zeros(capacity, np.float32)
+            self.y = np.zeros(capacity, np.float32)
+            self.vx = np.zeros(capacity, np.float32)
+            self.vy = np.zeros(capacity, np.float32)
+            self.life = np.zeros(capacity, np.float32)
+            self.max_life = np.ones(capacity, np.float32)
+            self.color = np.zeros(capacity, np.int32)
+            # Scratch for step(), so stepping allocates no temporary arrays or views
+            self.slots = np.arange(capacity)
+            self.destinations = np.zeros(capacity, np.intp)
+            self.scratch = np.zeros(capacity, np.float32)
+            self.alive = np.zeros(capacity, bool)
+            self.inside = np.zeros(capacity, bool)
+        else:
+            self.x = array("f", bytes(4 * capacity))
+            self.y = array("f", bytes(4 * capacity))
+            self.vx = array("f", bytes(4 * capacity))
+            self.vy = array("f", bytes(4 * capacity))
+            self.life = array("f", bytes(4 * capacity))
+            self.max_life = array("f", [1.0]) * capacity
+            self.color = array("i", bytes(4 * capacity))
+        self.fields = (self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.color)
+
+    def __len__(self):
+        return self.count
+
+    def palette_index(self, color):
+        """Palette slot for `color`, building its fade surfaces on first use"""
+        index = self.colors.get(color)
+        if index is None:
+            index = len(self.colors)
+            self.colors[color] = index
+            for level in range(FADE_LEVELS):
+                square = pygame.Surface((self.size, self.size))
+                square.fill(color)
+                square.set_alpha(255 * (level + 1) // FADE_LEVELS)
+                self.surfaces.append(square)
+        return index
+
+    def emit(self, x, y, count, color, speed=(40, 160), life=(0.4, 1.0)):
+        """Burst `count` particles out of (x, y) in random directions; extras past capacity are dropped"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        start, end = self.count, self.count + count
+        color_index = self.palette_index(tuple(color))
+        if np:
+            angle = self.rng.uniform(0, 2 * math.pi, count)
+            velocity = self.rng.uniform(speed[0], speed[1], count)
+            lifetime = self.rng.uniform(life[0], life[1], count)
+            self.x[start:end] = x
+            self.y[start:end] = y
+            self.vx[start:end] = np.cos(angle) * velocity
+            self.vy[start:end] = np.sin(angle) * velocity
+            self.life[start:end] = lifetime
+            self.max_life[start:end] = lifetime
+            self.color[start:end] = color_index
+        else:
+            uniform = self.rng.uniform
+            for i in range(start, end):
+                angle = uniform(0, 2 * math.pi)
+                velocity = uniform(speed[0], speed[1])
+                lifetime = uniform(life[0], life[1])
+                self.x[i] = x
+                self.y[i] = y
+                self.vx[i] = math.cos(angle) * velocity
+                self.vy[i] = math.sin(angle) * velocity
+                self.life[i] = lifetime
+                self.max_life[i] = lifetime
+                self.color[i] = color_index
+        self.count = end
+
+    def step(self, dt):
+        """Advance every live particle by dt seconds and drop the dead ones"""
+        n = self.count
+        if not n:
+            return
+        if np:
+            # Whole buffers are stepped, dead slots past count included, so no slice views are
+            # built; `alive` only keeps slots below count
+            x, y, vy, life = self.x, self.y, self.vy, self.life
+            scratch, alive, inside = self.scratch, self.alive, self.inside
+            x += np.multiply(self.vx, dt, out=scratch)
+            vy += self.gravity * dt
+            y += np.multiply(vy, dt, out=scratch)
+            life -= dt
+            np.greater(life, 0, out=alive)
+            alive &= np.less(self.slots, n, out=inside)
+            if self.bounds:
+                alive &= np.greater_equal(x, self.bounds.left, out=inside)
+                alive &= np.less(x, self.bounds.right, out=inside)
+                alive &= np.greater_equal(y, self.bounds.top, out=inside)
+                alive &= np.less(y, self.bounds.bottom, out=inside)
+            kept = int(np.count_nonzero(alive))
+            if kept != n:
+                # Pack the survivors to the front, in order, so every array stays contiguous. A
+                # survivor's new slot is the number of survivors before it; the dead all go to
+                # the last slot, which is past the packed ones. Each field is scattered into the
+                # scratch buffer (viewed as its 4-byte type) and copied back, allocating nothing.
+                destinations = self.destinations
+                # Cast first (a running sum straight from bool would buffer), then sum in place
+                np.copyto(destinations, alive)
+                np.add.accumulate(destinations, out=destinations)
+                destinations -= 1
+                np.copyto(destinations, self.capacity - 1, where=np.logical_not(alive, out=inside))
+                for field in self.fields:
+                    packed = scratch.view(field.dtype)
+                    np.put(packed, destinations, field)
+                    field[:kept] = packed[:kept]
+                self.count = kept
+        else:
+            kept = 0
+            bounds = self.bounds
+            for i in range(n):
+                life = self.life[i] - dt
+                if life <= 0:
+                    continue
+                vy = self.vy[i] + self.gravity * dt
+                x = self.x[i] + self.vx[i] * dt
+                y = self.y[i] + vy * dt
+                if bounds and not (bounds.left <= x < bounds.right and bounds.top <= y < bounds.bottom):
+                    continue
+                self.x[kept], self.y[kept], self.vy[kept], self.life[kept] = x, y, vy, life
+                if kept != i:
+                    self.vx[kept] = self.vx[i]
+                    self.max_life[kept] = self.max_life[i]
+                    self.color[kept] = self.color[i]
+                kept += 1
+            self.count = kept
+
+    def draw(self, screen):
+        """Draw every live particle with a single batched blit call"""
+        n = self.count
+        if not n:
+            return
+        if np:
+            level = np.minimum((self.life[:n] / self.max_life[:n] * FADE_LEVELS).astype(np.int32), FADE_LEVELS - 1)
+            surfaces = map(self.surfaces.__getitem__, (self.color[:n] * FADE_LEVELS + level).tolist())
+            positions = zip(self.x[:n].astype(np.int32).tolist(), self.y[:n].astype(np.int32).tolist())
+        else:
+            surfaces = [self.surfaces[self.color[i] * FADE_LEVELS + min(int(self.life[i] / self.max_life[i] * FADE_LEVELS), FADE_LEVELS - 1)]
+                        for i in range(n)]
+            positions = zip(map(int, self.x[:n]), map(int, self.y[:n]))
+        if hasattr(screen, "fblits"):
+            screen.fblits(zip(surfaces, positions))  # pygame-ce only: no per-blit rect results
+        else:
+            screen.blits(zip(surfaces, positions), doreturn=False)
+
+    def clear(self):
+        self.count = 0
@@ -0,0 +1,180 @@
+import csv
+import json
+import os
+import time
+from array import array
+import pygame
+from systems.text import text_cache
+
+PHASES = ("events", "update", "draw", "flip")
+
+class _NullSpan:
+    """Shared do-nothing span used while profiling is off"""
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    """Reusable timer for one named span (one instance per name, so spans don't allocate)"""
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+class FrameProfiler:
+    """Per-phase frame timings kept in fixed-size ring buffers.
+    
+    GameManager and the launcher loop time the built-in phases; games can add their
+    own spans with `with profiler.span("void_drift.collisions"):`.
+    """
+    
+    def __init__(self, capacity=600, event_capacity=20000):
+        self.capacity = capacity  # Frames kept
+        self.enabled = False
+        self.overlay = False
+        self.origin = time.perf_counter()
+        self.frames = 0  # Frames recorded since reset; the ring holds the last `capacity`
+        self.frame_start = 0.0
+        self.frame_starts = array('d', bytes(8 * capacity))
+        self.frame_times = array('d', bytes(8 * capacity))
+        self.series = {}  # span name -> per-frame total seconds (ring buffer)
+        self.current = {}  # span name -> seconds so far this frame
+        self.spans = {}
+        # Individual span events for the Chrome trace, also a ring buffer
+        self.event_capacity = event_capacity
+        self.event_names = [None] * event_capacity
+        self.event_starts = array('d', bytes(8 * event_capacity))
+        self.event_durations = array('d', bytes(8 * event_capacity))
+        self.events = 0
+        self.overlay_lines = []
+        for phase in PHASES:
+            self._series(phase)
+    
+    def _series(self, name):
+        series = self.series.get(name)
+        if series is None:
+            series = self.series[name] = array('d', bytes(8 * self.capacity))
+        return series
+    
+    def reset(self):
+        self.frames = 0
+        self.events = 0
+        self.current.clear()
+        # Profiling is usually switched on mid-frame, after begin_frame() ran as a no-op;
+        # time the rest of that frame rather than everything since the last enabled frame
+        self.frame_start = time.perf_counter()
+    
+    def span(self, name):
+        """Context manager timing a named span (free when profiling is off)"""
+        if not self.enabled:
+            return _NULL_SPAN
+        span = self.spans.get(name)
+        if span is None:
+            span = self.spans[name] = _Span(self, name)
+        return span
+    
+    def record(self, name, start, duration):
+        self.current[name] = self.current.get(name, 0.0) + duration
+        i = self.events % self.event_capacity
+        self.event_names[i] = name
+        self.event_starts[i] = start
+        self.event_durations[i] = duration
+        self.events += 1
+    
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_start = time.perf_counter()
+    
+    def end_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        i = self.frames % self.capacity
+        self.frame_starts[i] = self.frame_start
+        self.frame_times[i] = now - self.frame_start
+        for name in self.current:
+            self._series(name)
+        for name, series in self.series.items():
+            series[i] = self.current.get(name, 0.0)
+        self.current.clear()
+        self.frames += 1
+        if self.overlay and self.frames % 30 == 1:
+            self._refresh_overlay()
+    
+    def _frame_order(self):
+        """Ring indices from oldest to newest recorded frame"""
+        count = min(self.frames, self.capacity)
+        first = self.frames - count
+        return [(first + n) % self.capacity for n in range(count)]
+    
+    def percentiles(self, points=(50, 95, 99)):
+        """Frame-time percentiles in milliseconds over the buffered frames"""
+        count = min(self.frames, self.capacity)
+        if not count:
+            return {point: 0.0 for point in points}
+        ordered = sorted(self.frame_times[:count])
+        return {point: ordered[min(count - 1, int(count * point / 100))] * 1000 for point in points}
+    
+    def _refresh_overlay(self):
+        count = min(self.frames, self.capacity)
+        stats = self.percentiles()
+        self.overlay_lines = [f"frame p50 {stats[50]:.2f}  p95 {stats[95]:.2f}  p99 {stats[99]:.2f} ms"]
+        for name, series in self.series.items():
+            self.overlay_lines.append(f"{name} {sum(series[:count]) / count * 1000:.2f} ms")
+    
+    def draw_overlay(self, screen):
+        """Draw the stats box in the top-right corner and return its rect"""
+        width = 250
+        box = pygame.Rect(screen.get_width() - width - 10, 10, width, 8 + 18 * max(1, len(self.overlay_lines)))
+        screen.fill((0, 0, 0), box)
+        pygame.draw.rect(screen, (0, 255, 255), box, 1)
+        for row, line in enumerate(self.overlay_lines):
+            # Fixed strings are cached; these change at most twice a second
+            text_cache.draw(screen, line, (box.x + 6, box.y + 5 + row * 18), 20, (0, 255, 255))
+        return box
+    
+    def export_csv(self, path):
+        """One row per buffered frame: start, total and each span's time in milliseconds"""
+        names = list(self.series)
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "start_ms", "frame_ms"] + [f"{name}_ms" for name in names])
+            first = self.frames - min(self.frames, self.capacity)
+            for n, i in enumerate(self._frame_order()):
+                writer.writerow([first + n, f"{(self.frame_starts[i] - self.origin) * 1000:.3f}",
+                                 f"{self.frame_times[i] * 1000:.3f}"] +
+                                [f"{self.series[name][i] * 1000:.3f}" for name in names])
+    
+    def export_chrome_trace(self, path):
+        """Write buffered frames and spans as Chrome trace JSON (chrome://tracing, Perfetto)"""
+        events = []
+        for i in self._frame_order():
+            events.append({"name": "frame", "ph": "X", "pid": 0, "tid": 0,
+                           "ts": (self.frame_starts[i] - self.origin) * 1e6, "dur": self.frame_times[i] * 1e6})
+        count = min(self.events, self.event_capacity)
+        for n in range(self.events - count, self.events):
+            i = n % self.event_capacity
+            events.append({"name": self.event_names[i], "ph": "X", "pid": 0, "tid": 0,
+                           "ts": (self.event_starts[i] - self.origin) * 1e6, "dur": self.event_durations[i] * 1e6})
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    
+    def export(self, directory="profiles"):
+        """Write both CSV and trace files with a timestamped name; returns the base path"""
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, time.strftime("frames_%Y%m%d_%H%M%S"))
+        self.export_csv(base + ".csv")
+        self.export_chrome_trace(base + ".json")
+        return base
+
+# Shared by the launcher loop, GameManager and any game adding its own spans
+profiler = FrameProfiler()
@@ -0,0 +1,27 @@
+import importlib
+import time
+
+class GameDescriptor:
+    """What the launcher needs to list a game without importing its module"""
+    def __init__(self, name, module, class_name, thumbnail=None, preload_images=(), metadata=None):
+        self.name = name
+        self.module = module  # Dotted module path, imported only when the game is selected
+        self.class_name = class_name
+        self.thumbnail = thumbnail  # Optional asset path for a menu preview
+        self.preload_images = list(preload_images)  # Decoded in the background at startup
+        self.metadata = metadata or {}
+        self.game_class = None
+        self.load_time = None  # Seconds spent importing the module, for startup tuning
+        
+    def load(self):
+        """Import the game's module on first use and return its class"""
+        if self.game_class is None:
+            start = time.perf_counter()
+            module = importlib.import_module(self.module)
+            self.game_class = getattr(module, self.class_name)
+            self.load_time = time.perf_counter() - start
+            print(f"Loaded {self.name} in {self.load_time * 1000:.1f} ms")
+        return self.game_class
+    
+    def __repr__(self):
+        return f"GameDescriptor({self.name!r}, {self.module!r})"
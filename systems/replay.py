@@ -0,0 +1,182 @@
+import importlib
+import json
+import os
+import random
+import struct
+from systems.input import KeyState
+
+MAGIC = b"RPLY"
+VERSION = 1
+# magic, version, tick rate, RNG seed, total ticks, tracked key count
+HEADER = struct.Struct("<4sBHQIB")
+
+def _write_varint(out, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+def _read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+class ReplayLog:
+    """One recorded session: game, RNG seed, and the tracked keys' state on every tick.
+    
+    Key state is stored as a bitmask per tick, delta-encoded: only ticks where the
+    mask changes are written, each as (ticks since last change, new mask) varints.
+    """
+    def __init__(self, game, seed, keys, tick_rate=60):
+        self.game = game  # "module:ClassName", so playback can import it
+        self.seed = seed
+        self.keys = list(keys)  # Bit n of a mask is keys[n]
+        self.tick_rate = tick_rate
+        self.changes = []  # (tick, mask) whenever the held keys change
+        self.ticks = 0
+        self.result = {}  # Game.result() when recording stopped, to verify playback
+    
+    def to_bytes(self):
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.tick_rate, self.seed, self.ticks, len(self.keys)))
+        out += struct.pack(f"<{len(self.keys)}I", *self.keys)
+        for text in (self.game, json.dumps(self.result)):
+            encoded = text.encode("utf-8")
+            _write_varint(out, len(encoded))
+            out += encoded
+        _write_varint(out, len(self.changes))
+        last_tick = 0
+        for tick, mask in self.changes:
+            _write_varint(out, tick - last_tick)
+            _write_varint(out, mask)
+            last_tick = tick
+        return bytes(out)
+    
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, tick_rate, seed, ticks, key_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a RE:PLAY replay file (or an unsupported version)")
+        pos = HEADER.size
+        keys = struct.unpack_from(f"<{key_count}I", data, pos)
+        pos += 4 * key_count
+        texts = []
+        for _ in range(2):
+            length, pos = _read_varint(data, pos)
+            texts.append(data[pos:pos + length].decode("utf-8"))
+            pos += length
+        log = cls(texts[0], seed, keys, tick_rate)
+        log.result = json.loads(texts[1])
+        log.ticks = ticks
+        count, pos = _read_varint(data, pos)
+        tick = 0
+        for _ in range(count):
+            delta, pos = _read_varint(data, pos)
+            mask, pos = _read_varint(data, pos)
+            tick += delta
+            log.changes.append((tick, mask))
+        return log
+    
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+    
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+    
+    def game_class(self):
+        module, class_name = self.game.split(":")
+        return getattr(importlib.import_module(module), class_name)
+
+class InputRecorder:
+    """Input source that passes another source through and logs the game's keys every tick"""
+    def __init__(self, source, game_class, seed, tick_rate=60):
+        self.source = source
+        self.log = ReplayLog(f"{game_class.__module__}:{game_class.__name__}", seed, game_class.input_keys, tick_rate)
+        self.keys = KeyState()
+        self.mask = 0
+    def begin_tick(self):
+        self.source.begin_tick()
+        pressed = self.source.get_pressed()
+        # The game only sees tracked keys, so playback can't diverge on an unrecorded one
+        self.keys.clear()
+        mask = 0
+        for bit, key in enumerate(self.log.keys):
+            if pressed[key]:
+                mask |= 1 << bit
+                self.keys.add(key)
+        if mask != self.mask:
+            self.log.changes.append((self.log.ticks, mask))
+            self.mask = mask
+        self.log.ticks += 1
+    def get_pressed(self):
+        return self.keys
+
+class ReplayInput:
+    """Input source that plays back a ReplayLog tick by tick"""
+    def __init__(self, log):
+        self.log = log
+        self.keys = KeyState()
+        self.tick = 0
+        self.next_change = 0
+    @property
+    def finished(self):
+        return self.tick >= self.log.ticks
+    def begin_tick(self):
+        changes = self.log.changes
+        if self.next_change < len(changes) and changes[self.next_change][0] == self.tick:
+            mask = changes[self.next_change][1]
+            self.keys.clear()
+            self.keys.update(key for bit, key in enumerate(self.log.keys) if mask & (1 << bit))
+            self.next_change += 1
+        self.tick += 1
+    def get_pressed(self):
+        return self.keys
+
+def play(log, capture=None):
+    """Run a replay headless and uncapped; returns (runner, elapsed seconds)
+
+    With a FrameCapture the replay is also drawn, and its last frames end up in the capture ring.
+    """
+    from systems.headless import HeadlessRunner
+    random.seed(log.seed)
+    runner = HeadlessRunner(log.game_class(), ReplayInput(log), tick_rate=log.tick_rate, capture=capture)
+    elapsed = runner.run(log.ticks)
+    return runner, elapsed
+
+# Play a recording back: python -m systems.replay replays/<file>.rply [--capture clip.gif]
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m systems.replay", description="Replay and verify a recording")
+    parser.add_argument("replay", help="replay file (.rply)")
+    parser.add_argument("--capture", metavar="PATH", help="also render the replay and save its last frames (.gif, or a directory of PNGs)")
+    parser.add_argument("--capture-frames", type=int, default=150, metavar="N", help="frames kept for --capture (default 150)")
+    parser.add_argument("--every", type=int, default=2, metavar="N", help="capture every Nth tick (default 2)")
+    args = parser.parse_args()
+    log = ReplayLog.load(args.replay)
+    capture = None
+    if args.capture:
+        from systems.capture import FrameCapture
+        capture = FrameCapture(capacity=args.capture_frames, every=args.every, fps=log.tick_rate)
+    runner, elapsed = play(log, capture)
+    result = runner.game.result()
+    print(f"{log.game}: {log.ticks} ticks in {elapsed:.3f}s ({log.ticks / max(elapsed, 1e-9):.0f} ticks/s)")
+    print(f"Recorded result: {log.result}")
+    print(f"Replayed result: {result}")
+    print("MATCH" if result == log.result else "MISMATCH")
+    if capture and capture.stop(args.capture):
+        capture.flush()
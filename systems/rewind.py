@@ -0,0 +1,93 @@
+import zlib
+from collections import deque
+
+def xor_bytes(a, b):
+    """XOR two buffers, zero-padding the shorter one"""
+    length = max(len(a), len(b))
+    value = int.from_bytes(a, "little") ^ int.from_bytes(b, "little")
+    return value.to_bytes(length, "little")
+
+class RewindBuffer:
+    """Ring of per-tick game snapshots: periodic zlib keyframes, XOR deltas in between
+
+    push() takes the bytes from Game.snapshot() once per tick; step_back() returns the
+    previous tick's snapshot for Game.restore() and forgets the newest one. A delta is the
+    XOR of two consecutive snapshots, so it is mostly zeros and compresses to a few bytes,
+    and undoing it is the same XOR again. Whole keyframe groups are dropped once more than
+    `seconds` of history is held.
+    """
+
+    def __init__(self, seconds=30, tick_rate=60, keyframe_every=60, level=1):
+        self.capacity = int(seconds * tick_rate)
+        self.keyframe_every = keyframe_every  # Ticks per keyframe group
+        self.level = level  # zlib level; 1 is fast and plenty for mostly-zero deltas
+        self.entries = deque()  # (is_keyframe, length, compressed bytes), oldest first
+        self.current = None  # Uncompressed snapshot of the newest entry
+        self.since_keyframe = 0
+        self.bytes_used = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+        self.current = None
+        self.since_keyframe = 0
+        self.bytes_used = 0
+
+    def push(self, snapshot):
+        """Record the state after one tick"""
+        if self.current is None or self.since_keyframe >= self.keyframe_every:
+            entry = (True, len(snapshot), zlib.compress(snapshot, self.level))
+            self.since_keyframe = 1
+        else:
+            entry = (False, len(snapshot), zlib.compress(xor_bytes(snapshot, self.current), self.level))
+            self.since_keyframe += 1
+        self.entries.append(entry)
+        self.bytes_used += len(entry[2])
+        self.current = snapshot
+        while len(self.entries) > self.capacity:
+            self._drop_oldest_group()
+
+    def step_back(self):
+        """Forget the newest tick and return the snapshot before it (None when history runs out)"""
+        if len(self.entries) < 2:
+            return None
+        is_keyframe, _, data = self.entries.pop()
+        self.bytes_used -= len(data)
+        length = self.entries[-1][1]
+        if is_keyframe:
+            # The previous group has to be rebuilt forwards from its own keyframe
+            self.current = self._rebuild_last()
+        else:
+            self.current = xor_bytes(self.current, zlib.decompress(data))[:length]
+        self.since_keyframe = self._ticks_since_keyframe()
+        return self.current
+
+    def _rebuild_last(self):
+        start = len(self.entries) - 1
+        while not self.entries[start][0]:
+            start -= 1
+        state = zlib.decompress(self.entries[start][2])
+        for index in range(start + 1, len(self.entries)):
+            _, length, data = self.entries[index]
+            state = xor_bytes(state, zlib.decompress(data))[:length]
+        return state
+
+    def _ticks_since_keyframe(self):
+        ticks = 0
+        for is_keyframe, _, _ in reversed(self.entries):
+            ticks += 1
+            if is_keyframe:
+                break
+        return ticks
+
+    def _drop_oldest_group(self):
+        # Deltas are only usable behind their keyframe, so the whole group goes at once
+        _, _, data = self.entries.popleft()
+        self.bytes_used -= len(data)
+        while self.entries and not self.entries[0][0]:
+            _, _, data = self.entries.popleft()
+            self.bytes_used -= len(data)
+        if not self.entries:
+            self.current = None
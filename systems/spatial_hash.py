@@ -0,0 +1,93 @@
+import math
+
+class SpatialHash:
+    """Uniform grid of buckets over a world that can wrap around (a torus) on either axis
+
+    A loose grid: insert() files each item under the cell holding its centre (one append),
+    and query() widens the searched area by the largest item inserted, so a collision pass
+    only tests nearby pairs. On a wrapping axis cells are taken modulo the world size, so an
+    item straddling the edge is found from both sides; on a fixed axis, anything beyond the
+    edge lands in the outermost cells. Rebuild it every tick with clear() and insert().
+    """
+
+    def __init__(self, width, height, cell_size=64, wrap_x=True, wrap_y=True):
+        self.width = width
+        self.height = height
+        self.wrap_x = wrap_x
+        self.wrap_y = wrap_y
+        # Whole cells per wrapping axis, so a coordinate past the edge maps to the right cell
+        self.cols = max(1, round(width / cell_size)) if wrap_x else max(1, math.ceil(width / cell_size))
+        self.rows = max(1, round(height / cell_size)) if wrap_y else max(1, math.ceil(height / cell_size))
+        self.cell_width = width / self.cols if wrap_x else cell_size
+        self.cell_height = height / self.rows if wrap_y else cell_size
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+        self.used = []  # Indexes of non-empty cells, so clear() skips the empty ones
+        self.largest_width = 0  # Biggest item since clear(); query() reaches this far
+        self.largest_height = 0
+
+    def _index(self, position, size, count, wrap):
+        index = int(position // size)
+        if wrap:
+            return index % count
+        return 0 if index < 0 else count - 1 if index >= count else index
+
+    def _span(self, start, end, size, count, wrap):
+        """Cell indexes along one axis covered by [start, end)"""
+        first = int(start // size)
+        last = int((end - 1) // size)
+        if wrap:
+            if last - first >= count - 1:
+                return range(count)  # As wide as the world
+            if first >= 0 and last < count:
+                return range(first, last + 1)
+            return [index % count for index in range(first, last + 1)]
+        return range(max(0, min(count - 1, first)), max(0, min(count - 1, last)) + 1)
+
+    def clear(self):
+        for index in self.used:
+            self.cells[index].clear()
+        self.used.clear()
+        self.largest_width = 0
+        self.largest_height = 0
+
+    def insert(self, item, rect):
+        """File item under the cell holding rect's centre"""
+        if rect.width > self.largest_width:
+            self.largest_width = rect.width
+        if rect.height > self.largest_height:
+            self.largest_height = rect.height
+        index = (self._index(rect.centery, self.cell_height, self.rows, self.wrap_y) * self.cols
+                 + self._index(rect.centerx, self.cell_width, self.cols, self.wrap_x))
+        cell = self.cells[index]
+        if not cell:
+            self.used.append(index)
+        cell.append(item)
+
+    def query(self, rect, found=None):
+        """Items that may overlap rect: those centred within half the largest item of it
+
+        Pass `found` to have it cleared and filled instead of a new list being built, so a
+        per-tick collision pass allocates nothing.
+        """
+        # rect.inflate(largest_width, largest_height), without building the Rect
+        left = rect.x - self.largest_width // 2
+        top = rect.y - self.largest_height // 2
+        right = left + rect.width + self.largest_width
+        bottom = top + rect.height + self.largest_height
+        cells = self.cells
+        cols = self._span(left, right, self.cell_width, self.cols, self.wrap_x)
+        if found is None:
+            found = []
+        else:
+            found.clear()
+        for row in self._span(top, bottom, self.cell_height, self.rows, self.wrap_y):
+            base = row * self.cols
+            for col in cols:
+                found.extend(cells[base + col])
+        return found
+
+    def nearest(self, rect, anchor):
+        """rect moved by whole world sizes to its copy nearest anchor, for exact tests across the seam"""
+        dx = round((anchor.centerx - rect.centerx) / self.width) * self.width if self.wrap_x else 0
+        dy = round((anchor.centery - rect.centery) / self.height) * self.height if self.wrap_y else 0
+        return rect.move(dx, dy) if dx or dy else rect
@@ -0,0 +1,65 @@
+from collections import OrderedDict, namedtuple
+import pygame
+from systems.collision import mask_radius
+
+# A scaled surface shared by every entity drawn at that size, plus its collision mask
+# and the radius of the circle around the mask's set pixels
+CachedSprite = namedtuple("CachedSprite", ["key", "image", "mask", "radius"])
+
+class SpriteCache:
+    """Bounded LRU cache of scaled surfaces and collision masks"""
+    
+    def __init__(self, max_entries=512, quantum=10):
+        self.max_entries = max_entries
+        self.quantum = quantum  # Sizes are rounded to this step so spawns share entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def quantize(self, size):
+        """Round a requested size to the cache grid"""
+        return max(self.quantum, int(round(size / self.quantum)) * self.quantum)
+    
+    def get(self, variant, image, width, height):
+        """Return the CachedSprite for `image` (source number `variant`) at the quantized size"""
+        key = (variant, self.quantize(width), self.quantize(height))
+        sprite = self.entries.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return sprite
+        self.misses += 1
+        return self._store(key, image)
+    
+    def prewarm(self, images, sizes):
+        """Build entries for every (variant, width, height) combination ahead of time"""
+        for variant, image in enumerate(images):
+            for width in sizes:
+                for height in sizes:
+                    key = (variant, self.quantize(width), self.quantize(height))
+                    if key not in self.entries:
+                        self._store(key, image)
+    
+    def _store(self, key, image):
+        size = key[1:]
+        if image is None:
+            # No artwork loaded - the fallback rectangle collides everywhere
+            mask = pygame.mask.Mask(size, fill=True)
+            sprite = CachedSprite(key, None, mask, mask_radius(mask))
+        else:
+            scaled = pygame.transform.scale(image, size)
+            mask = pygame.mask.from_surface(scaled)
+            sprite = CachedSprite(key, scaled, mask, mask_radius(mask))
+        self.entries[key] = sprite
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)  # Evict the least recently used size
+        return sprite
+    
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def stats(self):
+        """Hit/miss counters for tuning the cache size"""
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,167 @@
+import os
+import random
+import tempfile
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # Optional: without NumPy the stars are stamped one pixel at a time (once, then cached)
+    np = None
+
+CACHE_DIRECTORY = "cache"
+CACHE_VERSION = 2  # Bump when the look changes so stale cached layers are regenerated
+
+# Star colours and how often each turns up
+STAR_TINTS = ((1.0, 1.0, 1.0), (0.75, 0.82, 1.0), (1.0, 0.94, 0.8), (1.0, 0.82, 0.68))
+TINT_WEIGHTS = (0.5, 0.25, 0.15, 0.1)
+
+class StarLayer:
+    """How one parallax layer looks: scroll speed, stars per megapixel, brightness and star shape"""
+
+    def __init__(self, speed, density, brightness, kernel):
+        self.speed = speed  # Pixels per scroll unit; the game scrolls one unit per tick
+        self.density = density
+        self.brightness = brightness  # (lowest, highest) peak channel value
+        self.kernel = kernel  # (dx, dy, weight) pixels stamped around each star
+
+# Far to near. Every speed is a multiple of 1/4, so all layers line up again after 4 screen heights
+LAYERS = (
+    StarLayer(0.25, 2500, (40, 120), ((0, 0, 1.0),)),
+    StarLayer(0.5, 700, (90, 200), ((0, 0, 1.0), (1, 0, 0.3), (-1, 0, 0.3), (0, 1, 0.3), (0, -1, 0.3))),
+    StarLayer(1.0, 150, (160, 255), ((0, 0, 1.0), (1, 0, 1.0), (0, 1, 1.0), (1, 1, 1.0),
+                                     (-1, 0, 0.35), (-1, 1, 0.35), (2, 0, 0.35), (2, 1, 0.35),
+                                     (0, -1, 0.35), (1, -1, 0.35), (0, 2, 0.35), (1, 2, 0.35))),
+    # Fastest stars trail a short streak behind them (they move down the screen)
+    StarLayer(2.0, 25, (200, 255), ((0, 0, 1.0), (0, -1, 0.7), (0, -2, 0.45), (0, -3, 0.25), (0, -4, 0.1))),
+)
+SCROLL_PERIOD = 4  # Screen heights of scroll after which every layer is back where it started
+
+class Starfield:
+    """Procedural parallax starfield: one screen-sized tile per layer, drawn over a cleared screen
+
+    Tiles are generated from a seed at any resolution (every star's pixels stamped with NumPy in
+    one assignment) and saved to the cache directory, so later runs only load PNGs. Each tile is
+    black apart from its stars and is colour-keyed with RLE acceleration, so blitting it skips
+    the empty runs: a layer costs about as much as its star pixels, not a full-screen copy.
+    """
+
+    def __init__(self, width, height, seed=0, layers=LAYERS, directory=CACHE_DIRECTORY):
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.layers = layers
+        self.directory = directory
+        self.period = height * SCROLL_PERIOD  # Scroll positions repeat after this
+        self.tiles = [self._load_or_generate(index, layer) for index, layer in enumerate(layers)]
+
+    def draw(self, screen, scroll):
+        """Blit every layer scrolled down by `scroll` times its speed, far layers first"""
+        height = self.height
+        for layer, tile in zip(self.layers, self.tiles):
+            offset = int(scroll * layer.speed) % height
+            # The tile wraps vertically: its bottom shows above the scrolled-down top
+            screen.blit(tile, (0, offset))
+            if offset:
+                screen.blit(tile, (0, offset - height))
+
+    def cache_path(self, index):
+        name = f"starfield_v{CACHE_VERSION}_{self.width}x{self.height}_seed{self.seed}_layer{index}.png"
+        return os.path.join(self.directory, name)
+
+    def _load_or_generate(self, index, layer):
+        path = self.cache_path(index)
+        tile = None
+        if os.path.exists(path):
+            try:
+                tile = pygame.image.load(path)
+            except (pygame.error, OSError) as e:
+                print(f"Warning: Could not load cached starfield {path}: {e}")
+            if tile is not None and tile.get_size() != (self.width, self.height):
+                tile = None
+        if tile is None:
+            tile = self.generate(index, layer)
+            try:
+                self._save(tile, path)
+            except (pygame.error, OSError) as e:
+                print(f"Warning: Could not cache starfield layer: {e}")
+        tile = tile.convert()
+        tile.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return tile
+
+    def _save(self, tile, path):
+        # Temp file plus rename, so parallel workers (sweeps, VecEnv) never load a half-written PNG
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".starfield.", suffix=".png", dir=self.directory)
+        os.close(fd)  # pygame writes by name; the extension picks the format
+        try:
+            pygame.image.save(tile, temp_path)
+            os.replace(temp_path, path)  # Atomic on the same filesystem
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def generate(self, index, layer):
+        """Render one layer's tile; stars near an edge wrap to the opposite one so the tile repeats"""
+        count = max(1, round(layer.density * self.width * self.height / 1000000))
+        seed = self.seed * 1000 + index  # Each layer gets its own stars
+        if np:
+            return self._generate_numpy(layer, count, seed)
+        return self._generate_python(layer, count, seed)
+
+    def _generate_numpy(self, layer, count, seed):
+        rng = np.random.default_rng(seed)
+        x = rng.integers(0, self.width, count)
+        y = rng.integers(0, self.height, count)
+        low, high = layer.brightness
+        brightness = rng.uniform(low, high, count)
+        tints = np.array(STAR_TINTS)[rng.choice(len(STAR_TINTS), count, p=TINT_WEIGHTS)]
+        kernel = np.array(layer.kernel)
+        dx, dy, weight = kernel[:, 0, None].astype(int), kernel[:, 1, None].astype(int), kernel[:, 2, None]
+        # Every stamped pixel of every star at once: (kernel size, stars) flattened
+        index = (((y + dy) % self.height) * self.width + (x + dx) % self.width).ravel()
+        intensity = (brightness * weight).ravel()
+        colors = np.rint(tints[None, :, :] * (brightness * weight)[:, :, None]).astype(np.uint8).reshape(-1, 3)
+        # Where stars overlap the brighter stamp wins: sort by pixel, brightest last, keep the last of each
+        order = np.lexsort((intensity, index))
+        index = index[order]
+        last = np.append(index[1:] != index[:-1], True)
+        index = index[last]
+        colors = colors[order[last]].astype(np.uint32)
+        # Only the star pixels are written, straight into a blank 32-bit surface
+        tile = pygame.Surface((self.width, self.height), 0, 32)
+        red, green, blue, _ = tile.get_shifts()
+        view = pygame.surfarray.pixels2d(tile)
+        view[index % self.width, index // self.width] = (colors[:, 0] << red) | (colors[:, 1] << green) | (colors[:, 2] << blue)
+        del view  # Unlock the surface
+        return tile
+
+    def _generate_python(self, layer, count, seed):
+        rng = random.Random(seed)
+        tile = pygame.Surface((self.width, self.height))
+        low, high = layer.brightness
+        intensities = {}  # Stamped pixel -> brightness there
+        for _ in range(count):
+            x = rng.randrange(self.width)
+            y = rng.randrange(self.height)
+            brightness = rng.uniform(low, high)
+            tint = rng.choices(STAR_TINTS, TINT_WEIGHTS)[0]
+            for dx, dy, weight in layer.kernel:
+                position = ((x + dx) % self.width, (y + dy) % self.height)
+                # Where stars overlap the brighter stamp wins, as in the NumPy path
+                if brightness * weight > intensities.get(position, 0):
+                    intensities[position] = brightness * weight
+                    tile.set_at(position, [round(t * brightness * weight) for t in tint])
+        return tile
+
+# Starfields keyed by size and seed, shared between game instances
+_starfields = {}
+
+def get_starfield(width, height, seed=0):
+    """Return the Starfield for this size and seed, loading or generating its layers the first time"""
+    key = (width, height, seed)
+    starfield = _starfields.get(key)
+    if starfield is None:
+        starfield = Starfield(width, height, seed)
+        _starfields[key] = starfield
+    return starfield
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+import pygame
+
+_fonts = {}
+
+def get_font(size, name=None):
+    """Shared Font for (name, size); each font is only loaded once per process"""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(name, size)
+    return font
+
+class TextCache:
+    """Rendered-text cache so HUD and menu strings are only rendered when they change"""
+    
+    DIGITS = "0123456789-"
+    
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.digit_glyphs = {}  # (size, color) -> {char: surface}
+        
+    def render(self, text, size, color, antialias=True):
+        """Return a cached surface for a whole string"""
+        key = (text, size, color, antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            return surface
+        surface = self._prepare(get_font(size).render(text, antialias, color))
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+    
+    def glyphs(self, size, color):
+        """Per-character digit surfaces used to compose numbers without re-rendering"""
+        key = (size, color)
+        glyphs = self.digit_glyphs.get(key)
+        if glyphs is None:
+            font = get_font(size)
+            glyphs = {char: self._prepare(font.render(char, True, color)) for char in self.DIGITS}
+            self.digit_glyphs[key] = glyphs
+        return glyphs
+    
+    def _prepare(self, surface):
+        # Match the display format for faster blits once a window exists
+        if pygame.display.get_surface() is not None:
+            return surface.convert_alpha()
+        return surface
+    
+    def _surfaces(self, parts, size, color):
+        """Yield the surfaces for a string, a number, or a tuple mixing both"""
+        if not isinstance(parts, tuple):
+            parts = (parts,)
+        for part in parts:
+            if isinstance(part, str):
+                if part:
+                    yield self.render(part, size, color)
+            else:
+                glyphs = self.glyphs(size, color)
+                for char in str(int(part)):
+                    yield glyphs[char]
+    
+    def measure(self, parts, size, color=(255, 255, 255)):
+        """Width and height of the composed text"""
+        width = 0
+        height = 0
+        for surface in self._surfaces(parts, size, color):
+            width += surface.get_width()
+            height = max(height, surface.get_height())
+        return width, height
+    
+    def draw(self, screen, parts, pos, size, color, anchor="topleft"):
+        """Blit text at pos (placed by a Rect anchor name) and return the area it covers.
+        
+        parts is a string, a number, or a tuple such as ("Score: ", 42); numbers are
+        composed from cached digit glyphs so a changing score never calls Font.render.
+        """
+        surfaces = list(self._surfaces(parts, size, color))
+        rect = pygame.Rect(0, 0, sum(s.get_width() for s in surfaces),
+                           max((s.get_height() for s in surfaces), default=0))
+        setattr(rect, anchor, pos)
+        x = rect.x
+        blits = []
+        for surface in surfaces:
+            blits.append((surface, (x, rect.y)))
+            x += surface.get_width()
+        screen.blits(blits, doreturn=False)
+        return rect
+
+# Shared by every game and the launcher
+text_cache = TextCache()
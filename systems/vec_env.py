@@ -0,0 +1,160 @@
+import importlib
+import inspect
+import random
+import pygame
+from systems.headless import init_headless
+from systems.high_scores import HighScoreStore, set_store
+from systems.input import ScriptedInput
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency; only bot and playtest tooling needs it
+    np = None
+
+# Games with a batched array core, imported only when asked for
+BATCHED_CORES = {
+    "PaddleGame": "games.paddle_batch:BatchedPaddle",
+    "BrickfallGame": "games.brickfall_batch:BatchedBrickfall",
+}
+
+def batched_core(game_class):
+    """(module, class name) of the game's batched core, or None"""
+    core = BATCHED_CORES.get(game_class.__name__)
+    if core is None:
+        return None
+    module, class_name = core.split(":")
+    return importlib.import_module(module), class_name
+
+def default_actions(game_class):
+    """Do nothing, or hold one of the game's keys"""
+    return [()] + [(key,) for key in game_class.input_keys]
+
+def default_score(game):
+    """Cumulative score the reward is the change of"""
+    return game.result().get("score", 0)
+
+class VecEnv:
+    """Gym-style reset()/step() over N instances of any Game, stepped one after another in one process
+
+    Actions are indexes into `actions`, a list of held-key tuples. step() returns
+    (observations, rewards, dones, info): observations are (N, state size) float32 from
+    Game.observe(), or (N, height, width, 3) uint8 with observation="pixels". An env that
+    finishes a run or reaches max_episode_steps is replaced by a fresh game straight away.
+    For a game with a batched core, the core module's ACTIONS and make_input() are the
+    defaults, so both paths play the same environment: Paddle step for step (checked by
+    benchmarks/vec_env.py), Brickfall by the same rules but its own RNG for paddle spin.
+    """
+
+    def __init__(self, game_class, num_envs, actions=None, observation="state", score=None,
+                 make_input=None, max_episode_steps=None, tick_rate=60, size=(800, 600), configure=None):
+        if np is None:
+            raise ImportError("VecEnv needs NumPy (pip install numpy)")
+        if observation not in ("state", "pixels"):
+            raise ValueError(f"observation must be 'state' or 'pixels', not {observation!r}")
+        self.game_class = game_class
+        self.num_envs = num_envs
+        core = batched_core(game_class)
+        core_module = core[0] if core else None
+        self.actions = actions or getattr(core_module, "ACTIONS", None) or default_actions(game_class)
+        self.observation = observation
+        self.score = score or default_score
+        # Optional make_input(game, agent_input) -> input source
+        self.make_input = make_input or getattr(core_module, "make_input", None)
+        self.max_episode_steps = max_episode_steps
+        self.configure = configure
+        self.dt = 1.0 / tick_rate
+        self.screen = init_headless(size)
+        set_store(HighScoreStore(save_file=None))  # Bots must not touch the player's high scores
+        width, height = size
+        if observation == "pixels":
+            # Every env draws into its own band of one tall surface, so a single
+            # surfarray view covers the whole batch
+            self.canvas = pygame.Surface((width, height * num_envs))
+            self.views = [self.canvas.subsurface((0, i * height, width, height)) for i in range(num_envs)]
+            self.pixels = np.zeros((num_envs, height, width, 3), np.uint8)
+        else:
+            self.views = [self.screen] * num_envs
+        self.games = [None] * num_envs
+        self.agent_inputs = [None] * num_envs
+        self.scores = np.zeros(num_envs, np.float64)
+        self.steps = np.zeros(num_envs, np.int64)
+
+    def _new_game(self, index):
+        game = self.game_class()
+        agent = ScriptedInput()
+        game.input = self.make_input(game, agent) if self.make_input else agent
+        if self.configure:
+            self.configure(game)
+        game.init(self.views[index])
+        self.games[index] = game
+        self.agent_inputs[index] = agent
+        self.scores[index] = self.score(game)
+        self.steps[index] = 0
+
+    def reset(self, seed=None):
+        """Start a fresh game in every env and return the first observations"""
+        if seed is not None:
+            random.seed(seed)  # The games draw from the global RNG
+        for index in range(self.num_envs):
+            self._new_game(index)
+        return self._observe()
+
+    def step(self, actions):
+        """Advance every env one tick with its action; returns (observations, rewards, dones, info)"""
+        rewards = np.zeros(self.num_envs, np.float32)
+        dones = np.zeros(self.num_envs, bool)
+        truncated = np.zeros(self.num_envs, bool)
+        final_scores = np.zeros(self.num_envs, np.float32)
+        for index, action in enumerate(actions):
+            game = self.games[index]
+            runs = game.runs_finished
+            agent = self.agent_inputs[index]
+            agent.set_pressed(self.actions[action])
+            game.input.begin_tick()
+            game.update(self.dt)
+            score = self.score(game)
+            rewards[index] = score - self.scores[index]
+            self.scores[index] = score
+            final_scores[index] = score
+            self.steps[index] += 1
+            finished = game.runs_finished != runs
+            if finished or (self.max_episode_steps and self.steps[index] >= self.max_episode_steps):
+                dones[index] = True
+                truncated[index] = not finished
+                self._new_game(index)
+        return self._observe(), rewards, dones, {"score": final_scores, "truncated": truncated}
+
+    def _observe(self):
+        if self.observation == "state":
+            return np.array([game.observe() for game in self.games], np.float32)
+        self.canvas.fill((0, 0, 0))  # Cleared like GameManager does before games draw
+        for game, view in zip(self.games, self.views):
+            game.draw(view)
+        # pixels3d is a view of the canvas (width, N * height, 3); split the tall axis
+        # per env and copy the whole batch out in one go
+        view = pygame.surfarray.pixels3d(self.canvas)
+        width, height = self.canvas.get_width(), self.canvas.get_height() // self.num_envs
+        np.copyto(self.pixels, view.reshape(width, self.num_envs, height, 3).transpose(1, 2, 0, 3))
+        del view  # Unlock the canvas so the games can draw into it again
+        return self.pixels  # Reused by the next step; copy it to keep it
+
+    def close(self):
+        for game in self.games:
+            if game is not None:
+                game.shutdown()
+
+def make_vec_env(game_class, num_envs, observation="state", batched=True, **kwargs):
+    """Batched array core when the game has one and state observations are wanted, else a VecEnv
+
+    A core is only used when it takes every keyword argument given; otherwise the VecEnv runs
+    instead, so an option is never dropped or passed where it means something else.
+    """
+    core = batched_core(game_class)
+    if batched and core and observation == "state":
+        module, class_name = core
+        core_class = getattr(module, class_name)
+        unsupported = sorted(set(kwargs) - set(inspect.signature(core_class).parameters))
+        if not unsupported:
+            return core_class(num_envs, **kwargs)
+        print(f"make_vec_env: {class_name} does not take {', '.join(unsupported)}; using VecEnv")
+    return VecEnv(game_class, num_envs, observation=observation, **kwargs)